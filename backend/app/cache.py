@@ -0,0 +1,112 @@
+"""
+Redis cache client and helpers
+"""
+import time
+from typing import Optional
+
+import orjson
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+redis_client = redis.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    socket_connect_timeout=0.25,
+    socket_timeout=0.25
+)
+
+# After a Redis error, skip the cache for this long so an outage costs one
+# timeout per interval instead of one per request
+_RETRY_AFTER_SECONDS = 30
+_disabled_until = 0.0
+
+
+def admin_key(admin_id: str) -> str:
+    """Cache key for an authenticated admin"""
+    return f"auth:admin:{admin_id}"
+
+
+def voter_session_key(voter_id: str) -> str:
+    """Cache key for a voter's session validation flags"""
+    return f"auth:voter:{voter_id}"
+
+
+def election_key(election_id) -> str:
+    """Cache key for a serialized election detail response"""
+    return f"elections:detail:{election_id}"
+
+
+def election_results_key(election_id) -> str:
+    """Cache key for a finalized election's results"""
+    return f"elections:results:{election_id}"
+
+
+def dashboard_stats_key() -> str:
+    """Cache key for the admin dashboard counters"""
+    return "elections:dashboard_stats"
+
+
+def _mark_unavailable(error: Exception) -> None:
+    global _disabled_until
+    _disabled_until = time.monotonic() + _RETRY_AFTER_SECONDS
+    logger.warning("redis_unavailable", error=str(error), retry_after=_RETRY_AFTER_SECONDS)
+
+
+async def cache_get(key: str) -> Optional[dict]:
+    """
+    Read a JSON value from the cache
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Optional[dict]: Cached value, or None on miss or if Redis is unavailable
+    """
+    if time.monotonic() < _disabled_until:
+        return None
+    try:
+        raw = await redis_client.get(key)
+    except RedisError as e:
+        _mark_unavailable(e)
+        return None
+    return orjson.loads(raw) if raw is not None else None
+
+
+async def cache_set(key: str, value: dict, ttl: int) -> None:
+    """
+    Write a JSON value to the cache
+
+    Args:
+        key: Cache key
+        value: JSON-serializable value
+        ttl: Time to live in seconds
+    """
+    if ttl <= 0 or time.monotonic() < _disabled_until:
+        return
+    try:
+        await redis_client.setex(key, ttl, orjson.dumps(value))
+    except RedisError as e:
+        _mark_unavailable(e)
+
+
+async def cache_delete(*keys: str) -> None:
+    """
+    Remove keys from the cache
+
+    Invalidation is attempted even while the cache is marked unavailable, so
+    it takes effect as soon as Redis answers again. A delete that fails while
+    Redis is unreachable is lost and the entry survives until its TTL, so
+    callers must keep TTLs short enough to bound that staleness.
+
+    Args:
+        *keys: Cache keys to delete
+    """
+    try:
+        await redis_client.delete(*keys)
+    except RedisError as e:
+        _mark_unavailable(e)
@@ -1,25 +1,99 @@
 """
 Database connection and session management
 """
-from sqlalchemy import create_engine, event, text
+from fastapi import Request
+from sqlalchemy import Table, create_engine, event, insert, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import NullPool
-from typing import Generator
+from typing import AsyncGenerator, Generator
+import orjson
+import random
+import threading
+import time
 import structlog
 
 from app.config import settings
 
 logger = structlog.get_logger()
 
+# Server settings applied to every connection. They are sent in the startup
+# packet, so new connections need no extra SET round trip.
+_SESSION_SETTINGS = {
+    "statement_timeout": "30000",
+    "lock_timeout": "5000",
+    "idle_in_transaction_session_timeout": "60000"
+}
+
+if not settings.DB_STARTUP_OPTIONS:
+    _SESSION_SETTINGS = {}
+
+# Behind an external pooler (PgBouncer in transaction mode) the pooler owns
+# the server connections; a second pool here would only pin them idle
+if settings.DB_EXTERNAL_POOLER:
+    _POOL_ARGS = {"poolclass": NullPool}
+else:
+    _POOL_ARGS = {
+        "pool_pre_ping": True,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT
+    }
+
+
+def _json_serializer(value) -> str:
+    """Encode JSON/JSONB parameters with orjson, which handles UUIDs and datetimes"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=20,
-    max_overflow=0,
-    echo=settings.DEBUG,
-    future=True
+    **_POOL_ARGS,
+    query_cache_size=1200,
+    json_serializer=_json_serializer,
+    future=True,
+    connect_args={
+        "options": " ".join(f"-c {name}={value}" for name, value in _SESSION_SETTINGS.items())
+    } if _SESSION_SETTINGS else {}
+)
+
+# libpq connection parameters that asyncpg does not accept as keywords
+_LIBPQ_ONLY_PARAMS = ("sslmode", "channel_binding")
+
+
+def _async_database_url():
+    """
+    Derive the asyncpg URL from DATABASE_URL
+
+    asyncpg does not understand libpq-only query parameters; sslmode is
+    translated to asyncpg's ssl argument and the rest are dropped.
+    """
+    url = make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg")
+    connect_args = {
+        "server_settings": dict(_SESSION_SETTINGS),
+        # SQLAlchemy's prepared statement cache and asyncpg's own
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE
+    }
+    if "sslmode" in url.query:
+        connect_args["ssl"] = url.query["sslmode"]
+    url = url.difference_update_query(_LIBPQ_ONLY_PARAMS)
+    return url, connect_args
+
+
+_async_url, _async_connect_args = _async_database_url()
+
+# Async engine for request paths that must not block the event loop
+async_engine = create_async_engine(
+    _async_url,
+    **_POOL_ARGS,
+    query_cache_size=1200,
+    json_serializer=_json_serializer,
+    connect_args=_async_connect_args
 )
 
 # Create SessionLocal class
@@ -30,14 +104,65 @@ SessionLocal = sessionmaker(
     future=True
 )
 
+
+
+class _AsyncBackedSession(Session):
+    """Sync session class behind AsyncSessionLocal, so its events stay scoped to it"""
+
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    sync_session_class=_AsyncBackedSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+# Session.info key holding rows to insert just before the transaction commits
+_PENDING_INSERTS_KEY = "pending_inserts"
+
+
+def defer_insert(db: AsyncSession, table: Table, row: dict) -> None:
+    """
+    Insert a row as part of the session's transaction, just before it commits
+
+    Rows for the same table are sent as one multi-row INSERT, and are
+    dropped if the transaction rolls back.
+
+    Args:
+        db: Session from AsyncSessionLocal
+        table: Table to insert into
+        row: Column values for the row
+    """
+    db.info.setdefault(_PENDING_INSERTS_KEY, {}).setdefault(table, []).append(row)
+
+
+@event.listens_for(_AsyncBackedSession, "before_commit")
+def _insert_pending_rows(session: Session) -> None:
+    for table, rows in session.info.pop(_PENDING_INSERTS_KEY, {}).items():
+        session.execute(insert(table), rows)
+
+
+@event.listens_for(_AsyncBackedSession, "after_soft_rollback")
+def _drop_pending_rows(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_INSERTS_KEY, None)
+
 # Base class for declarative models
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
+def get_db(request: Request) -> Generator[Session, None, None]:
     """
     Dependency for getting database session
 
+    The session is stored on request.state, so every dependency chain and
+    background task in one HTTP request shares a single session and pool
+    checkout. The first caller owns it and closes it after the response
+    (FastAPI runs yield-dependency teardown after background tasks).
+
+    Args:
+        request: Current HTTP request
+
     Yields:
         Session: SQLAlchemy database session
 
@@ -46,7 +171,13 @@ def get_db() -> Generator[Session, None, None]:
         def get_items(db: Session = Depends(get_db)):
             return db.query(Item).all()
     """
+    db = getattr(request.state, "db", None)
+    if db is not None:
+        yield db
+        return
+
     db = SessionLocal()
+    request.state.db = db
     try:
         yield db
     except Exception as e:
@@ -54,9 +185,26 @@ def get_db() -> Generator[Session, None, None]:
         db.rollback()
         raise
     finally:
+        del request.state.db
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting an async database session
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error("database_session_error", error=str(e))
+            await db.rollback()
+            raise
+
+
 def init_db() -> None:
     """
     Initialize database - create all tables
@@ -70,42 +218,80 @@ def init_db() -> None:
         raise
 
 
-def check_db_connection() -> bool:
+# Time-partitioned append-only tables (monthly RANGE partitions)
+_PARTITIONED_TABLES = ("auth_attempts", "audit_logs")
+_PARTITION_MONTHS_AHEAD = 3
+
+
+def ensure_log_partitions() -> None:
     """
-    Check if database connection is healthy
+    Pre-create upcoming monthly partitions for the append-only log tables
 
-    Returns:
-        bool: True if connection is healthy, False otherwise
+    Rows for a month without its own partition land in the default
+    partition, which loses pruning and blocks creating that month later.
+    Failures are logged and ignored so startup never depends on this.
     """
     try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-        return True
+        with engine.begin() as conn:
+            for table in _PARTITIONED_TABLES:
+                conn.execute(
+                    text(
+                        "SELECT create_monthly_partitions(:parent, CURRENT_DATE, "
+                        "(CURRENT_DATE + make_interval(months => :months))::DATE)"
+                    ),
+                    {"parent": table, "months": _PARTITION_MONTHS_AHEAD}
+                )
+        logger.info("log_partitions_ensured", tables=list(_PARTITIONED_TABLES), months_ahead=_PARTITION_MONTHS_AHEAD)
     except Exception as e:
-        logger.error("database_connection_check_failed", error=str(e))
-        return False
+        logger.warning("log_partitions_ensure_failed", error=str(e))
+
 
+# Health probe result is reused for a short window so frequent /health
+# scrapes collapse into one SELECT 1 per interval
+_HEALTH_TTL = 2.0
+_HEALTH_CACHE = {"ts": 0.0, "ok": False}
+_health_lock = threading.Lock()
 
-@event.listens_for(engine, "connect")
-def set_sqlite_pragma(dbapi_conn, connection_record):
+
+def check_db_connection() -> bool:
     """
-    Set PostgreSQL connection parameters
-    This is called whenever a new connection is created
+    Check if database connection is healthy
+
+    The result is cached for a couple of seconds.
+
+    Returns:
+        bool: True if connection is healthy, False otherwise
     """
-    cursor = dbapi_conn.cursor()
-    # Set statement timeout to 30 seconds
-    cursor.execute("SET statement_timeout = 30000")
-    cursor.close()
+    if time.monotonic() - _HEALTH_CACHE["ts"] < _HEALTH_TTL:
+        return _HEALTH_CACHE["ok"]
+
+    with _health_lock:
+        # Another caller may have refreshed the result while we waited
+        now = time.monotonic()
+        if now - _HEALTH_CACHE["ts"] < _HEALTH_TTL:
+            return _HEALTH_CACHE["ok"]
+
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            ok = True
+        except Exception as e:
+            logger.error("database_connection_check_failed", error=str(e))
+            ok = False
+
+        _HEALTH_CACHE["ok"] = ok
+        _HEALTH_CACHE["ts"] = now
+        return ok
 
 
-@event.listens_for(engine, "before_cursor_execute")
 def receive_before_cursor_execute(conn, cursor, statement, params, context, executemany):
     """
-    Log SQL queries in debug mode
+    Log a sample of SQL queries in debug mode
     """
-    if settings.DEBUG:
-        logger.debug(
-            "sql_query",
-            statement=statement,
-            params=params
-        )
+    if random.random() < settings.SQL_LOG_SAMPLE_RATE:
+        logger.debug("sql_query", statement=statement[:256])
+
+
+# Only hook statement execution when debugging; production pays no per-query callback
+if settings.DEBUG:
+    event.listen(engine, "before_cursor_execute", receive_before_cursor_execute)
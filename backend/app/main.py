@@ -3,15 +3,52 @@ Main FastAPI application entry point
 """
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+import asyncio
+import orjson
 import structlog
 import sys
+import time
+import uuid
 
 from app.config import settings
-from app.database import check_db_connection, engine
+from app.database import async_engine, check_db_connection, engine, ensure_log_partitions
+from app.services.audit_queue import auth_attempt_queue
 from app.services.blockchain import blockchain_service, BlockchainError
-from app.services.biometric import BiometricAuthError
+from app.services.biometric import BiometricAuthError, warm_up_biometric_services
+
+# Stack and exception rendering is only worth its cost on warning-and-above
+# events; info/debug events skip it entirely
+_ERROR_METHODS = frozenset({"warning", "warn", "error", "exception", "critical", "fatal"})
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+
+def _render_error_context(logger, method_name, event_dict):
+    """Render stack and exception info for warning-and-above events only"""
+    if method_name in _ERROR_METHODS:
+        event_dict = _stack_info_renderer(logger, method_name, event_dict)
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
+def _stringify_uuids(logger, method_name, event_dict):
+    """
+    Render UUID values as strings for the console renderer
+
+    Call sites pass UUIDs as-is, so events dropped by the level filter never
+    pay for the conversion; orjson serializes them natively in JSON mode.
+    """
+    for key, value in event_dict.items():
+        if isinstance(value, uuid.UUID):
+            event_dict[key] = str(value)
+    return event_dict
+
+
+def _orjson_dumps(obj, default=None, **kwargs) -> str:
+    """Serialize log events with orjson; stdlib logging expects str"""
+    return orjson.dumps(obj, default=default).decode()
+
 
 # Configure structured logging
 structlog.configure(
@@ -21,11 +58,12 @@ structlog.configure(
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
+        _render_error_context,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer() if settings.LOG_FORMAT == "json"
-        else structlog.dev.ConsoleRenderer(),
+        *(
+            [structlog.processors.JSONRenderer(serializer=_orjson_dumps)] if settings.LOG_FORMAT == "json"
+            else [_stringify_uuids, structlog.dev.ConsoleRenderer()]
+        ),
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -34,6 +72,40 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+# Last known blockchain reachability, refreshed in the background so health
+# endpoints never wait on a JSON-RPC round trip
+_BC_PROBE_INTERVAL = 5.0
+_BC_STATE = {"ts": 0.0, "ok": False}
+
+
+def _probe_blockchain() -> bool:
+    """Run a blocking is_connected() check and record the result"""
+    try:
+        ok = blockchain_service.web3.is_connected()
+    except Exception:
+        ok = False
+    _BC_STATE.update(ts=time.monotonic(), ok=ok)
+    return ok
+
+
+def _blockchain_healthy() -> bool:
+    """
+    Get blockchain reachability without blocking on the node
+
+    Returns:
+        bool: Cached result of the most recent probe, or False if it is stale
+    """
+    # A stale result means the background probe is stuck, most likely on a
+    # hung node; report unhealthy rather than repeat its blocking call here
+    return time.monotonic() - _BC_STATE["ts"] < _BC_PROBE_INTERVAL * 2 and _BC_STATE["ok"]
+
+
+async def _periodic_blockchain_probe() -> None:
+    """Refresh the cached blockchain state every few seconds"""
+    while True:
+        await asyncio.to_thread(_probe_blockchain)
+        await asyncio.sleep(_BC_PROBE_INTERVAL)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -50,23 +122,34 @@ async def lifespan(app: FastAPI):
                       message="Database not available. Some features may not work.")
     else:
         logger.info("database_connected")
+        await asyncio.to_thread(ensure_log_partitions)
 
     # Check blockchain connection
-    try:
-        if blockchain_service.web3.is_connected():
-            logger.info("blockchain_connected", url=settings.GANACHE_URL)
-        else:
-            logger.warning("blockchain_not_connected")
-    except Exception as e:
-        logger.warning("blockchain_check_failed", error=str(e))
+    if _probe_blockchain():
+        logger.info("blockchain_connected", url=settings.GANACHE_URL)
+    else:
+        logger.warning("blockchain_not_connected")
+
+    probe_task = asyncio.create_task(_periodic_blockchain_probe())
+    # Load biometric models off the event loop while the app starts serving
+    warm_up_task = asyncio.create_task(asyncio.to_thread(warm_up_biometric_services))
+    auth_attempt_queue.start()
 
     yield
 
     # Shutdown
     logger.info("application_shutting_down")
 
+    probe_task.cancel()
+    if not warm_up_task.done():
+        warm_up_task.cancel()
+
+    # Write out queued auth attempts before the engine is disposed
+    await auth_attempt_queue.stop()
+
     # Close database connections
     engine.dispose()
+    await async_engine.dispose()
     logger.info("database_connections_closed")
 
 
@@ -75,7 +158,8 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Blockchain-based voting system with biometric authentication",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -85,6 +169,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Pagination cursor for GET /api/elections
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -93,7 +179,7 @@ app.add_middleware(
 async def blockchain_error_handler(request: Request, exc: BlockchainError):
     """Handle blockchain errors"""
     logger.error("blockchain_error", error=str(exc), path=request.url.path)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Blockchain operation failed",
@@ -107,7 +193,7 @@ async def blockchain_error_handler(request: Request, exc: BlockchainError):
 async def biometric_auth_error_handler(request: Request, exc: BiometricAuthError):
     """Handle biometric authentication errors"""
     logger.warning("biometric_auth_error", error=str(exc), path=request.url.path)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={
             "error": "Biometric authentication failed",
@@ -121,7 +207,7 @@ async def biometric_auth_error_handler(request: Request, exc: BiometricAuthError
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle uncaught exceptions"""
     logger.error("unhandled_exception", error=str(exc), path=request.url.path, exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -160,11 +246,7 @@ async def health_check():
     health_status["checks"]["database"] = "healthy" if db_healthy else "unhealthy"
 
     # Check blockchain
-    try:
-        blockchain_healthy = blockchain_service.web3.is_connected()
-        health_status["checks"]["blockchain"] = "healthy" if blockchain_healthy else "unhealthy"
-    except:
-        health_status["checks"]["blockchain"] = "unhealthy"
+    health_status["checks"]["blockchain"] = "healthy" if _blockchain_healthy() else "unhealthy"
 
     # Overall status
     if not all(v == "healthy" for v in health_status["checks"].values()):
@@ -173,6 +255,39 @@ async def health_check():
     return health_status
 
 
+# Parts of /api/info that only change on restart
+_STATIC_INFO = {
+    "application": {
+        "name": settings.APP_NAME,
+        "version": settings.APP_VERSION,
+        "environment": "development" if settings.DEBUG else "production"
+    },
+    "biometrics": {
+        "face_model": settings.FACE_MODEL,
+        "face_threshold": settings.FACE_THRESHOLD,
+        "fingerprint_sdk": settings.FINGERPRINT_SDK,
+        "fingerprint_threshold": settings.FINGERPRINT_THRESHOLD
+    },
+    "security": {
+        "max_auth_attempts": settings.MAX_AUTH_ATTEMPTS,
+        "session_timeout_seconds": settings.SESSION_TIMEOUT_SECONDS
+    }
+}
+
+# Contracts are loaded once when the blockchain service is created
+_BLOCKCHAIN_INFO = {
+    "connected": True,
+    "url": settings.GANACHE_URL,
+    "network_id": settings.GANACHE_NETWORK_ID,
+    "contracts_loaded": {
+        "voter_registry": blockchain_service.voter_registry is not None,
+        "voting_booth": blockchain_service.voting_booth is not None,
+        "results_tallier": blockchain_service.results_tallier is not None,
+        "election_controller": blockchain_service.election_controller is not None
+    }
+}
+
+
 # System info endpoint
 @app.get("/api/info")
 async def system_info():
@@ -180,42 +295,12 @@ async def system_info():
     Get system information
     """
     try:
-        # Get blockchain info
-        blockchain_info = {}
-        if blockchain_service.web3.is_connected():
-            blockchain_info = {
-                "connected": True,
-                "url": settings.GANACHE_URL,
-                "network_id": settings.GANACHE_NETWORK_ID,
-                "contracts_loaded": {
-                    "voter_registry": blockchain_service.voter_registry is not None,
-                    "voting_booth": blockchain_service.voting_booth is not None,
-                    "results_tallier": blockchain_service.results_tallier is not None,
-                    "election_controller": blockchain_service.election_controller is not None
-                }
-            }
-        else:
-            blockchain_info = {"connected": False}
-
         return {
-            "application": {
-                "name": settings.APP_NAME,
-                "version": settings.APP_VERSION,
-                "environment": "development" if settings.DEBUG else "production"
-            },
-            "blockchain": blockchain_info,
+            **_STATIC_INFO,
+            "blockchain": _BLOCKCHAIN_INFO if _blockchain_healthy() else {"connected": False},
             "database": {
-                "connected": check_db_connection()
-            },
-            "biometrics": {
-                "face_model": settings.FACE_MODEL,
-                "face_threshold": settings.FACE_THRESHOLD,
-                "fingerprint_sdk": settings.FINGERPRINT_SDK,
-                "fingerprint_threshold": settings.FINGERPRINT_THRESHOLD
-            },
-            "security": {
-                "max_auth_attempts": settings.MAX_AUTH_ATTEMPTS,
-                "session_timeout_seconds": settings.SESSION_TIMEOUT_SECONDS
+                "connected": check_db_connection(),
+                "pool": engine.pool.status()
             }
         }
 
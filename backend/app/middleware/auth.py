@@ -3,21 +3,79 @@ Authentication and authorization middleware
 """
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from jose import JWTError, jwt
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import jwt
+from jwt import InvalidTokenError as JWTError
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+import hashlib
+import threading
+import time
+import uuid
 import structlog
 
+from app.cache import admin_key, voter_session_key, cache_get, cache_set
 from app.config import settings
-from app.database import get_db
+from app.database import get_async_db
 from app.models.admin import Admin, AdminRole
 from app.models.voter import Voter
 
-logger = structlog.get_logger()
+logger = structlog.get_logger().bind(component="auth")
 
 security = HTTPBearer()
 
+# Resolved once at import; these are read on every token encode/decode
+_JWT_SECRET = settings.JWT_SECRET
+_JWT_ALG = settings.JWT_ALGORITHM
+_ACCESS_EXP_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_EXP_SECONDS = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+_VSESSION_EXP_SECONDS = 5 * 60
+_VSESSION_SECRET = settings.VOTING_SESSION_SECRET
+
+# Verified admin token payloads, keyed by a digest of the token so raw
+# tokens are never held in memory. Entries live at most _TOKEN_CACHE_TTL
+# seconds and never past the token's own exp.
+_TOKEN_CACHE_TTL = 60
+_TOKEN_CACHE_MAX = 10_000
+_token_cache: Dict[bytes, Tuple[float, dict]] = {}
+_token_cache_lock = threading.Lock()
+
+# Cached admin records (is_active, role) are only dropped on login, so this
+# bounds how long a deactivation or role change can go unnoticed
+_ADMIN_CACHE_TTL = 60
+
+
+def _decode_admin_token(token: str) -> dict:
+    """
+    Verify and decode an admin access or refresh token, with caching
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        dict: Token payload
+
+    Raises:
+        JWTError: If the token is invalid or expired
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+
+    entry = _token_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    payload = jwt.decode(token, _JWT_SECRET, algorithms=[_JWT_ALG])
+
+    with _token_cache_lock:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            _token_cache.pop(next(iter(_token_cache)), None)
+        _token_cache[key] = (min(now + _TOKEN_CACHE_TTL, payload["exp"]), payload)
+
+    return payload
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -31,16 +89,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         str: Encoded JWT token
     """
     to_encode = data.copy()
-    now = datetime.now(timezone.utc)
+    now = int(time.time())
 
     if expires_delta:
-        expire = now + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = now + _ACCESS_EXP_SECONDS
 
     to_encode.update({"exp": expire, "iat": now})
 
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALG)
     return encoded_jwt
 
 
@@ -55,12 +113,12 @@ def create_refresh_token(data: dict) -> str:
         str: Encoded JWT refresh token
     """
     to_encode = data.copy()
-    now = datetime.now(timezone.utc)
-    expire = now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    now = int(time.time())
+    expire = now + _REFRESH_EXP_SECONDS
 
     to_encode.update({"exp": expire, "iat": now, "type": "refresh"})
 
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALG)
     return encoded_jwt
 
 
@@ -77,39 +135,28 @@ def create_voting_session_token(voter_id: str, election_id: str, constituency_id
     Returns:
         str: Encoded JWT voting session token
     """
-    now = datetime.now(timezone.utc)
-    expire = now + timedelta(minutes=5)
+    now = int(time.time())
+    expire = now + _VSESSION_EXP_SECONDS
 
     data = {
         "voter_id": voter_id,
         "election_id": election_id,
         "constituency_id": constituency_id,
         "session_id": session_id,
-        "exp": int(expire.timestamp()),
-        "iat": int(now.timestamp()),
+        "exp": expire,
+        "iat": now,
         "type": "voting_session"
     }
 
-    encoded_jwt = jwt.encode(data, settings.VOTING_SESSION_SECRET, algorithm=settings.JWT_ALGORITHM)
-
-    # Detailed logging for debugging
-    logger.info(
-        "voting_session_token_created",
-        voter_id=voter_id,
-        token_length=len(encoded_jwt),
-        token_full=encoded_jwt,
-        secret_prefix=settings.VOTING_SESSION_SECRET[:10] if settings.VOTING_SESSION_SECRET else "NONE",
-        algorithm=settings.JWT_ALGORITHM,
-        payload=data,
-        exp_timestamp=data["exp"],
-        iat_timestamp=data["iat"]
-    )
+    encoded_jwt = jwt.encode(data, _VSESSION_SECRET, algorithm=_JWT_ALG)
+
+    logger.debug("voting_session_token_created", voter_id=voter_id, session_id=session_id)
     return encoded_jwt
 
 
 async def get_current_admin(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Admin:
     """
     Dependency to get current authenticated admin
@@ -132,11 +179,7 @@ async def get_current_admin(
 
     try:
         # Decode JWT token
-        payload = jwt.decode(
-            credentials.credentials,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = _decode_admin_token(credentials.credentials)
 
         admin_id: str = payload.get("sub")
         if admin_id is None:
@@ -153,11 +196,45 @@ async def get_current_admin(
         logger.error("jwt_decode_failed", error=str(e))
         raise credentials_exception
 
-    # Get admin from database
-    admin = db.query(Admin).filter(Admin.id == admin_id).first()
+    cache_key = admin_key(admin_id)
+    cached = await cache_get(cache_key)
+
+    if cached is not None:
+        # Transient instance built from the cached subset; never added to a session
+        admin = Admin(
+            id=uuid.UUID(cached["id"]),
+            username=cached["username"],
+            email=cached["email"],
+            role=AdminRole(cached["role"]),
+            is_active=cached["is_active"],
+            created_at=datetime.fromisoformat(cached["created_at"]) if cached["created_at"] else None,
+            last_login_at=datetime.fromisoformat(cached["last_login_at"]) if cached["last_login_at"] else None
+        )
+    else:
+        # Get admin from database
+        try:
+            admin_uuid = uuid.UUID(admin_id)
+        except ValueError:
+            raise credentials_exception
+
+        admin = (await db.execute(select(Admin).where(Admin.id == admin_uuid))).scalar_one_or_none()
 
-    if admin is None:
-        raise credentials_exception
+        if admin is None:
+            raise credentials_exception
+
+        await cache_set(
+            cache_key,
+            {
+                "id": str(admin.id),
+                "username": admin.username,
+                "email": admin.email,
+                "role": admin.role,
+                "is_active": admin.is_active,
+                "created_at": admin.created_at.isoformat() if admin.created_at else None,
+                "last_login_at": admin.last_login_at.isoformat() if admin.last_login_at else None
+            },
+            min(_ADMIN_CACHE_TTL, int(payload["exp"] - time.time()))
+        )
 
     if not admin.is_active:
         raise HTTPException(
@@ -169,27 +246,32 @@ async def get_current_admin(
     return admin
 
 
+@lru_cache(maxsize=None)
 def require_role(*roles: AdminRole):
     """
     Dependency factory to require specific admin roles
 
+    Memoized, so every route requiring the same roles shares one dependency
+    callable and FastAPI resolves it once per request.
+
     Args:
         *roles: Required admin roles
 
     Returns:
         Dependency function
     """
+    # Any listed role grants access, and higher roles inherit lower ones,
+    # so the check reduces to the lowest required rank
+    required_rank = min(Admin._ROLE_RANK[r] for r in roles)
+    denied_detail = f"Insufficient permissions. Required: {[r.value for r in roles]}"
+
     async def role_checker(current_admin: Admin = Depends(get_current_admin)) -> Admin:
         """Check if admin has required role"""
-        if current_admin.role not in roles:
-            # Check role hierarchy
-            has_permission = any(current_admin.has_permission(role) for role in roles)
-
-            if not has_permission:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Insufficient permissions. Required: {[r.value for r in roles]}"
-                )
+        if Admin._ROLE_RANK.get(current_admin.role, 0) < required_rank:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=denied_detail
+            )
 
         return current_admin
 
@@ -198,7 +280,7 @@ def require_role(*roles: AdminRole):
 
 async def get_current_session(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> dict:
     """
     Dependency to get current voting session
@@ -219,25 +301,22 @@ async def get_current_session(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    # Log received token for debugging
     received_token = credentials.credentials
-    logger.info(
-        "voting_session_token_received",
-        token_length=len(received_token),
-        token_full=received_token,
-        secret_prefix=settings.VOTING_SESSION_SECRET[:10] if settings.VOTING_SESSION_SECRET else "NONE",
-        algorithm=settings.JWT_ALGORITHM
-    )
+    logger.debug("voting_session_token_received", token_length=len(received_token))
 
     try:
         # Decode voting session token
         payload = jwt.decode(
             received_token,
-            settings.VOTING_SESSION_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
+            _VSESSION_SECRET,
+            algorithms=[_JWT_ALG]
         )
 
-        logger.info("voting_session_token_decoded_successfully", payload=payload)
+        logger.debug(
+            "voting_session_token_decoded",
+            voter_id=payload.get("voter_id"),
+            session_id=payload.get("session_id")
+        )
 
         # Verify token type
         if payload.get("type") != "voting_session":
@@ -257,21 +336,31 @@ async def get_current_session(
             raise credentials_exception
 
         # Verify voter exists and hasn't voted
-        voter = db.query(Voter).filter(Voter.voter_id == session_data["voter_id"]).first()
+        cache_key = voter_session_key(session_data["voter_id"])
+        voter = await cache_get(cache_key)
 
-        if not voter:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Voter not found"
-            )
+        if voter is None:
+            row = (await db.execute(
+                select(Voter.has_voted, Voter.locked_out)
+                .where(Voter.voter_id == session_data["voter_id"])
+            )).first()
 
-        if voter.has_voted:
+            if row is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Voter not found"
+                )
+
+            voter = {"has_voted": row.has_voted, "locked_out": row.locked_out}
+            await cache_set(cache_key, voter, int(payload["exp"] - time.time()))
+
+        if voter["has_voted"]:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Voter has already cast vote"
             )
 
-        if voter.locked_out:
+        if voter["locked_out"]:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Voter is locked out"
@@ -284,8 +373,7 @@ async def get_current_session(
         logger.error(
             "voting_session_decode_failed",
             error=str(e),
-            error_type=type(e).__name__,
-            token_preview=received_token[:50]
+            error_type=type(e).__name__
         )
         raise credentials_exception
 
@@ -304,11 +392,7 @@ def decode_refresh_token(token: str) -> dict:
         HTTPException: If token is invalid
     """
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = _decode_admin_token(token)
 
         if payload.get("type") != "refresh":
             raise HTTPException(
@@ -2,7 +2,7 @@
 SQLAlchemy ORM Models
 """
 from app.models.admin import Admin
-from app.models.election import Election, Constituency, Candidate
+from app.models.election import Election, Constituency, Candidate, ElectionResult
 from app.models.voter import Voter, AuthAttempt, VoteSubmission
 from app.models.audit import AuditLog, BlockchainTransaction
 
@@ -11,6 +11,7 @@ __all__ = [
     "Election",
     "Constituency",
     "Candidate",
+    "ElectionResult",
     "Voter",
     "AuthAttempt",
     "VoteSubmission",
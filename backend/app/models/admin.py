@@ -1,14 +1,14 @@
 """
 Admin model for system administrators
 """
-from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 import enum
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class AdminRole(str, enum.Enum):
@@ -25,14 +25,19 @@ class Admin(Base):
     """
     __tablename__ = "admins"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"))
     username = Column(String(100), unique=True, nullable=False, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(512), nullable=False)
     role = Column(
-        String(50),
+        SQLEnum(
+            AdminRole,
+            name="admin_role",
+            create_type=False,
+            values_callable=lambda enum_cls: [member.value for member in enum_cls]
+        ),
         nullable=False,
-        default=AdminRole.POLLING_OFFICER.value,
+        default=AdminRole.POLLING_OFFICER,
         index=True
     )
     mfa_secret = Column(String(255), nullable=True)
@@ -53,6 +58,10 @@ class Admin(Base):
     registered_voters = relationship("Voter", back_populates="registrar")
     audit_logs = relationship("AuditLog", back_populates="admin")
 
+    # Permission rank per role; a higher rank includes all lower ones.
+    # Derived from declaration order, which matches the admin_role enum in Postgres.
+    _ROLE_RANK = {role: rank for rank, role in enumerate(reversed(AdminRole), start=1)}
+
     def __repr__(self):
         return f"<Admin(id={self.id}, username={self.username}, role={self.role.value})>"
 
@@ -61,10 +70,4 @@ class Admin(Base):
         Check if admin has required permission level
         Permission hierarchy: super_admin > election_administrator > polling_officer > auditor
         """
-        role_hierarchy = {
-            AdminRole.SUPER_ADMIN: 4,
-            AdminRole.ELECTION_ADMINISTRATOR: 3,
-            AdminRole.POLLING_OFFICER: 2,
-            AdminRole.AUDITOR: 1
-        }
-        return role_hierarchy.get(self.role, 0) >= role_hierarchy.get(required_role, 0)
+        return Admin._ROLE_RANK.get(self.role, 0) >= Admin._ROLE_RANK.get(required_role, 0)
@@ -1,14 +1,15 @@
 """
 Audit-related models: AuditLog, BlockchainTransaction
 """
-from sqlalchemy import Column, String, BigInteger, Boolean, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, String, BigInteger, Boolean, DateTime, Enum as SQLEnum, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, INET, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 import enum
 
 from app.database import Base
+from app.models.types import HexBinary
+from app.utils.uuid7 import uuid7, uuid7_time_default
 
 
 class LogAction(str, enum.Enum):
@@ -51,12 +52,25 @@ class AuditLog(Base):
     Audit log for administrative actions (append-only)
     """
     __tablename__ = "audit_logs"
+    # Monthly partitions; see create_monthly_partitions() in schema.sql
+    __table_args__ = (
+        # jsonb_path_ops: smaller GIN index that serves @> containment
+        Index("idx_audit_logs_details", "details", postgresql_using="gin", postgresql_ops={"details": "jsonb_path_ops"}),
+        # Election audit trail pages, keyset on (occurred_at, id)
+        Index("idx_audit_logs_target_occurred_id", "target_table", "target_id", "occurred_at", "id"),
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"))
     admin_id = Column(UUID(as_uuid=True), ForeignKey("admins.id", ondelete="SET NULL"), nullable=True, index=True)
 
     action = Column(
-        String(50),
+        SQLEnum(
+            LogAction,
+            name="log_action",
+            create_type=False,
+            values_callable=lambda enum_cls: [member.value for member in enum_cls]
+        ),
         nullable=False,
         index=True
     )
@@ -65,7 +79,8 @@ class AuditLog(Base):
     details = Column(JSONB, nullable=True)
 
     ip_address = Column(INET, nullable=True)
-    occurred_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
+    # Partition key, so part of the primary key; defaults to the time embedded in id
+    occurred_at = Column(DateTime(timezone=True), primary_key=True, nullable=False, default=uuid7_time_default, server_default=func.now(), index=True)
 
     # Relationships
     admin = relationship("Admin", back_populates="audit_logs")
@@ -79,26 +94,37 @@ class BlockchainTransaction(Base):
     Blockchain transaction log
     """
     __tablename__ = "blockchain_txns"
+    __table_args__ = (
+        Index("idx_blockchain_txns_raw_event", "raw_event", postgresql_using="gin", postgresql_ops={"raw_event": "jsonb_path_ops"}),
+        # Election audit trail pages, keyset on (recorded_at, id)
+        Index("idx_blockchain_txns_election_recorded_id", "election_id", "recorded_at", "id"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    election_id = Column(UUID(as_uuid=True), ForeignKey("elections.id", ondelete="SET NULL"), nullable=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"))
+    # Indexed by idx_blockchain_txns_election_recorded_id
+    election_id = Column(UUID(as_uuid=True), ForeignKey("elections.id", ondelete="SET NULL"), nullable=True)
 
     tx_type = Column(
-        String(50),
+        SQLEnum(
+            TxType,
+            name="tx_type",
+            create_type=False,
+            values_callable=lambda enum_cls: [member.value for member in enum_cls]
+        ),
         nullable=False,
         index=True
     )
-    tx_hash = Column(String(66), unique=True, nullable=False, index=True)
+    tx_hash = Column(HexBinary, unique=True, nullable=False, index=True)
     block_number = Column(BigInteger, nullable=True)
 
-    from_address = Column(String(42), nullable=False, index=True)
-    to_address = Column(String(42), nullable=True)
+    from_address = Column(HexBinary, nullable=False, index=True)
+    to_address = Column(HexBinary, nullable=True)
 
     gas_used = Column(BigInteger, nullable=True)
     status = Column(Boolean, nullable=False, default=True)
     raw_event = Column(JSONB, nullable=True)
 
-    recorded_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
+    recorded_at = Column(DateTime(timezone=True), nullable=False, default=uuid7_time_default, server_default=func.now(), index=True)
 
     # Relationships
     election = relationship("Election", back_populates="blockchain_transactions")
@@ -1,14 +1,14 @@
 """
-Election-related models: Election, Constituency, Candidate
+Election-related models: Election, Constituency, Candidate, ElectionResult
 """
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, Enum as SQLEnum, ForeignKey, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, Enum as SQLEnum, ForeignKey, UniqueConstraint, Index, desc, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 import enum
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class ElectionStatus(str, enum.Enum):
@@ -25,15 +25,23 @@ class Election(Base):
     Election model representing an electoral event
     """
     __tablename__ = "elections"
+    __table_args__ = (
+        # Active count on the dashboard, and status-filtered listings newest first
+        Index("idx_elections_active", "id", postgresql_where=text("status = 'active'")),
+        Index("idx_elections_status_created_id", "status", desc("created_at"), desc("id")),
+        # Keyset pagination of the unfiltered listing
+        Index("idx_elections_created_id", desc("created_at"), desc("id")),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"))
     name = Column(String(300), nullable=False)
     description = Column(Text, nullable=True)
+    # Native election_status enum, loaded as plain strings: the routers compare
+    # against ElectionStatus.*.value and format status into messages
     status = Column(
-        String(50),
+        SQLEnum(*(member.value for member in ElectionStatus), name="election_status", create_type=False),
         nullable=False,
-        default=ElectionStatus.DRAFT.value,
-        index=True
+        default=ElectionStatus.DRAFT.value
     )
 
     voting_start_at = Column(DateTime(timezone=True), nullable=True)
@@ -57,13 +65,14 @@ class Election(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
-    # Relationships
-    creator = relationship("Admin", back_populates="created_elections", foreign_keys=[created_by])
-    finalizer = relationship("Admin", back_populates="finalized_elections", foreign_keys=[finalized_by])
-    constituencies = relationship("Constituency", back_populates="election", cascade="all, delete-orphan")
-    candidates = relationship("Candidate", back_populates="election")
-    vote_submissions = relationship("VoteSubmission", back_populates="election")
-    blockchain_transactions = relationship("BlockchainTransaction", back_populates="election")
+    # Relationships. All of them raise on lazy access: queries opt in with
+    # selectinload so a new attribute access cannot add hidden per-row SELECTs
+    creator = relationship("Admin", back_populates="created_elections", foreign_keys=[created_by], lazy="raise")
+    finalizer = relationship("Admin", back_populates="finalized_elections", foreign_keys=[finalized_by], lazy="raise")
+    constituencies = relationship("Constituency", back_populates="election", cascade="all, delete-orphan", lazy="raise")
+    candidates = relationship("Candidate", back_populates="election", lazy="raise")
+    vote_submissions = relationship("VoteSubmission", back_populates="election", lazy="raise")
+    blockchain_transactions = relationship("BlockchainTransaction", back_populates="election", lazy="raise")
 
     def __repr__(self):
         return f"<Election(id={self.id}, name={self.name}, status={self.status.value})>"
@@ -80,7 +89,7 @@ class Constituency(Base):
         UniqueConstraint("election_id", "on_chain_id", name="constituencies_unique_on_chain_id"),
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"))
     election_id = Column(UUID(as_uuid=True), ForeignKey("elections.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(200), nullable=False)
     code = Column(String(50), nullable=False, index=True)
@@ -89,9 +98,9 @@ class Constituency(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
-    election = relationship("Election", back_populates="constituencies")
-    candidates = relationship("Candidate", back_populates="constituency")
-    voters = relationship("Voter", back_populates="constituency")
+    election = relationship("Election", back_populates="constituencies", lazy="raise")
+    candidates = relationship("Candidate", back_populates="constituency", lazy="raise")
+    voters = relationship("Voter", back_populates="constituency", lazy="raise")
 
     def __repr__(self):
         return f"<Constituency(id={self.id}, name={self.name}, code={self.code})>"
@@ -105,9 +114,11 @@ class Candidate(Base):
 
     __table_args__ = (
         UniqueConstraint("election_id", "on_chain_id", name="candidates_unique_on_chain_per_election"),
+        # Active candidates per constituency when finalizing
+        Index("idx_candidates_election_constituency", "election_id", "constituency_id", postgresql_where=text("is_active")),
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"))
     election_id = Column(UUID(as_uuid=True), ForeignKey("elections.id", ondelete="CASCADE"), nullable=False, index=True)
     constituency_id = Column(UUID(as_uuid=True), ForeignKey("constituencies.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(300), nullable=False)
@@ -122,9 +133,23 @@ class Candidate(Base):
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    election = relationship("Election", back_populates="candidates")
-    constituency = relationship("Constituency", back_populates="candidates")
-    creator = relationship("Admin")
+    election = relationship("Election", back_populates="candidates", lazy="raise")
+    constituency = relationship("Constituency", back_populates="candidates", lazy="raise")
+    creator = relationship("Admin", lazy="raise")
 
     def __repr__(self):
         return f"<Candidate(id={self.id}, name={self.name}, party={self.party})>"
+
+
+class ElectionResult(Base):
+    """
+    Results of a finalized election, stored once they are complete
+    """
+    __tablename__ = "election_results"
+
+    election_id = Column(UUID(as_uuid=True), ForeignKey("elections.id", ondelete="CASCADE"), primary_key=True)
+    payload = Column(JSONB, nullable=False)
+    computed_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self):
+        return f"<ElectionResult(election_id={self.election_id}, computed_at={self.computed_at})>"
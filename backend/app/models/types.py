@@ -0,0 +1,29 @@
+"""
+Custom column types
+"""
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+from app.utils.hex import bytes_to_hex, hex_to_bytes
+
+
+class HexBinary(TypeDecorator):
+    """
+    BYTEA column exposed to Python as a 0x-prefixed hex string
+
+    Hashes and addresses are stored as raw bytes (32 bytes for a
+    transaction hash instead of 66 characters) while the ORM and API keep
+    working with the usual "0x..." strings. Values are returned lowercase.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return hex_to_bytes(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return bytes_to_hex(value)
@@ -1,14 +1,15 @@
 """
 Voter-related models: Voter, AuthAttempt, VoteSubmission
 """
-from sqlalchemy import Column, String, Text, SmallInteger, BigInteger, Boolean, DateTime, Enum as SQLEnum, ForeignKey, DECIMAL, UniqueConstraint, CheckConstraint
+from sqlalchemy import Column, String, Text, SmallInteger, BigInteger, Boolean, DateTime, Enum as SQLEnum, ForeignKey, DECIMAL, UniqueConstraint, CheckConstraint, Index, desc, text
 from sqlalchemy.dialects.postgresql import UUID, INET
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 import enum
 
 from app.database import Base
+from app.models.types import HexBinary
+from app.utils.uuid7 import uuid7, uuid7_time_default
 
 
 class AuthMethod(str, enum.Enum):
@@ -29,9 +30,13 @@ class Voter(Base):
     Voter model with biometric data
     """
     __tablename__ = "voters"
+    __table_args__ = (
+        # Session validation reads only these flags by voter_id (index-only scan)
+        Index("idx_voters_voterid_covering", "voter_id", postgresql_include=["has_voted", "locked_out"]),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    voter_id = Column(String(100), unique=True, nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"))
+    voter_id = Column(String(100), unique=True, nullable=False)
     full_name = Column(String(300), nullable=False)
     address = Column(Text, nullable=True)
     age = Column(SmallInteger, nullable=False)
@@ -85,27 +90,56 @@ class AuthAttempt(Base):
     Authentication attempt log (append-only)
     """
     __tablename__ = "auth_attempts"
+    __table_args__ = (
+        # Filter + ORDER BY attempted_at DESC in the audit log view; these also
+        # serve plain lookups on their leading column. The id tie-breaker
+        # matches the keyset cursor, and INCLUDE covers the view's projection
+        # so its pages are index-only scans.
+        Index(
+            "idx_auth_attempts_outcome_attempted_at",
+            "outcome", desc("attempted_at"), desc("id"),
+            postgresql_include=["voter_id", "auth_method", "ip_address", "failure_reason", "similarity_score"]
+        ),
+        Index("idx_auth_attempts_voter_attempted_at", "voter_id", desc("attempted_at")),
+        Index(
+            "idx_auth_attempts_attempted_at",
+            desc("attempted_at"), desc("id"),
+            postgresql_include=["voter_id", "outcome", "auth_method", "ip_address", "failure_reason", "similarity_score"]
+        ),
+        # Monthly partitions; see create_monthly_partitions() in schema.sql
+        {"postgresql_partition_by": "RANGE (attempted_at)"},
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    voter_id = Column(UUID(as_uuid=True), ForeignKey("voters.id", ondelete="SET NULL"), nullable=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"))
+    voter_id = Column(UUID(as_uuid=True), ForeignKey("voters.id", ondelete="SET NULL"), nullable=True)
     session_id = Column(UUID(as_uuid=True), nullable=True, index=True)
     polling_station = Column(String(200), nullable=True)
 
     auth_method = Column(
-        SQLEnum(AuthMethod, name="auth_method", create_type=False),
+        SQLEnum(
+            AuthMethod,
+            name="auth_method",
+            create_type=False,
+            values_callable=lambda enum_cls: [member.value for member in enum_cls]
+        ),
         nullable=False,
         index=True
     )
     outcome = Column(
-        SQLEnum(AuthOutcome, name="auth_outcome", create_type=False),
-        nullable=False,
-        index=True
+        SQLEnum(
+            AuthOutcome,
+            name="auth_outcome",
+            create_type=False,
+            values_callable=lambda enum_cls: [member.value for member in enum_cls]
+        ),
+        nullable=False
     )
     failure_reason = Column(String(500), nullable=True)
     similarity_score = Column(DECIMAL(5, 4), nullable=True)
 
     ip_address = Column(INET, nullable=True)
-    attempted_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
+    # Partition key, so part of the primary key; defaults to the time embedded in id
+    attempted_at = Column(DateTime(timezone=True), primary_key=True, nullable=False, default=uuid7_time_default, server_default=func.now())
 
     # Relationships
     voter = relationship("Voter", back_populates="auth_attempts")
@@ -122,27 +156,29 @@ class VoteSubmission(Base):
 
     __table_args__ = (
         UniqueConstraint("voter_id", "election_id", name="vote_submissions_unique_voter_election"),
+        # Election audit trail pages, keyset on (submitted_at, id)
+        Index("idx_vote_submissions_election_submitted_id", "election_id", "submitted_at", "id"),
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"))
     voter_id = Column(
         UUID(as_uuid=True),
         ForeignKey("voters.id", ondelete="RESTRICT"),
         nullable=False,
         index=True
     )
+    # Indexed by idx_vote_submissions_election_submitted_id
     election_id = Column(
         UUID(as_uuid=True),
         ForeignKey("elections.id", ondelete="RESTRICT"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     session_id = Column(UUID(as_uuid=True), nullable=False, index=True)
-    tx_hash = Column(String(66), unique=True, nullable=False, index=True)
+    tx_hash = Column(HexBinary, unique=True, nullable=False, index=True)
     block_number = Column(BigInteger, nullable=False)
     gas_used = Column(BigInteger, nullable=True)
 
-    submitted_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
+    submitted_at = Column(DateTime(timezone=True), nullable=False, default=uuid7_time_default, server_default=func.now(), index=True)
 
     # Relationships
     voter = relationship("Voter", back_populates="vote_submissions")
@@ -7,226 +7,406 @@ Provides:
 
 Requires admin authentication (auditor or above)
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, or_
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy import String, cast, func, literal, or_, outerjoin, select, text, tuple_
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
-from typing import Optional
-import csv
-import io
+from typing import Dict, Optional, Tuple
+from operator import attrgetter
+import asyncio
+import orjson
+import time
+import uuid
 import structlog
 
-from app.database import get_db
+from app.database import async_engine, get_async_db
 from app.middleware.auth import get_current_admin, require_role
 from app.models.admin import AdminRole
 from app.models.audit import AuditLog, BlockchainTransaction
+from app.models.election import Election
 from app.models.voter import AuthAttempt, Voter
+from app.utils.hex import hex_to_bytes
 
 logger = structlog.get_logger()
 
 router = APIRouter(prefix="/api/audit", tags=["Audit"])
 
 
+# auth_attempts is a partitioned parent, which autovacuum never analyzes, so
+# its own reltuples stays unset; sum the partitions' instead (each is -1
+# until that partition has been analyzed)
+_AUTH_ATTEMPTS_ESTIMATE = text("""
+    SELECT sum(GREATEST(c.reltuples, 0))::bigint
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = 'auth_attempts'::regclass
+""")
+
+
+async def _auth_attempts_estimate(db: AsyncSession, at_least: int) -> int:
+    """Planner row estimate for auth_attempts, or an exact count if it is unusable"""
+    total = (await db.execute(_AUTH_ATTEMPTS_ESTIMATE)).scalar()
+    if total is None or total < at_least:
+        total = (await db.execute(select(func.count()).select_from(AuthAttempt))).scalar_one()
+    return total
+
+
+# Recent totals per filter combination, so dashboard polling does not
+# recount the same rows on every refresh
+_COUNT_TTL = 5.0
+_COUNT_CACHE_MAX = 512
+_count_cache: Dict[tuple, Tuple[float, int]] = {}
+
+
+def _cached_count(key: tuple) -> Optional[int]:
+    """Return a cached total for these filters if it is still fresh"""
+    entry = _count_cache.get(key)
+    if entry is None or time.monotonic() - entry[0] >= _COUNT_TTL:
+        return None
+    return entry[1]
+
+
+def _store_count(key: tuple, total: int) -> None:
+    """Cache a total, evicting the oldest entry when full"""
+    _count_cache.pop(key, None)
+    if len(_count_cache) >= _COUNT_CACHE_MAX:
+        del _count_cache[next(iter(_count_cache))]
+    _count_cache[key] = (time.monotonic(), total)
+
+
 @router.get("/logs")
 async def get_audit_logs(
-    startDate: Optional[str] = Query(None),
-    endDate: Optional[str] = Query(None),
+    startDate: Optional[datetime] = Query(None),
+    endDate: Optional[datetime] = Query(None),
     voterId: Optional[str] = Query(None),
     outcome: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=1000),
-    db: Session = Depends(get_db),
+    afterTs: Optional[datetime] = Query(None),
+    afterId: Optional[uuid.UUID] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
     current_admin = Depends(require_role(AdminRole.AUDITOR, AdminRole.ELECTION_ADMINISTRATOR, AdminRole.SUPER_ADMIN))
 ):
-    """Return authentication attempt logs with filters and pagination (frontend expects 1-indexed pages)"""
+    """
+    Return authentication attempt logs with filters and pagination (frontend expects 1-indexed pages)
+
+    Pages are OFFSET-based by default. Passing afterTs/afterId from a previous
+    response's next_cursor switches to keyset paging, which stays O(limit) on
+    deep pages; page is then only echoed back.
+    """
+    if (afterTs is None) != (afterId is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="afterTs and afterId must be given together"
+        )
+
     try:
-        # Use raw SQL to avoid enum conversion issues
-        from sqlalchemy import text
-
-        # Build the base query
-        sql_query = """
-            SELECT
-                a.id,
-                v.voter_id,
-                a.auth_method,
-                a.outcome,
-                a.attempted_at,
-                a.ip_address,
-                a.failure_reason,
-                a.similarity_score
-            FROM auth_attempts a
-            LEFT JOIN voters v ON a.voter_id = v.id
-            WHERE 1=1
-        """
-        params = {}
+        stmt = (
+            select(
+                AuthAttempt.id,
+                Voter.voter_id,
+                AuthAttempt.auth_method,
+                AuthAttempt.outcome,
+                AuthAttempt.attempted_at,
+                AuthAttempt.ip_address,
+                AuthAttempt.failure_reason,
+                AuthAttempt.similarity_score
+            )
+            .select_from(outerjoin(AuthAttempt, Voter, AuthAttempt.voter_id == Voter.id))
+        )
+        filtered = False
 
         # Date range filters
         if startDate:
-            try:
-                start_dt = datetime.fromisoformat(startDate)
-                sql_query += " AND a.attempted_at >= :start_date"
-                params['start_date'] = start_dt
-            except Exception:
-                pass
+            stmt = stmt.where(AuthAttempt.attempted_at >= startDate)
+            filtered = True
 
         if endDate:
-            try:
-                end_dt = datetime.fromisoformat(endDate)
-                sql_query += " AND a.attempted_at <= :end_date"
-                params['end_date'] = end_dt
-            except Exception:
-                pass
+            stmt = stmt.where(AuthAttempt.attempted_at <= endDate)
+            filtered = True
 
         # Filter by voter_id
         if voterId:
-            sql_query += " AND v.voter_id = :voter_id"
-            params['voter_id'] = voterId
+            stmt = stmt.where(Voter.voter_id == voterId)
+            filtered = True
 
         # Filter by outcome
         if outcome:
-            sql_query += " AND a.outcome = :outcome"
-            params['outcome'] = outcome
-
-        # Get total count
-        count_query = f"SELECT COUNT(*) as total FROM ({sql_query}) as subquery"
-        total_result = db.execute(text(count_query), params).fetchone()
-        total = total_result[0] if total_result else 0
-
-        # Add ordering and pagination
-        sql_query += " ORDER BY a.attempted_at DESC"
-        offset = (page - 1) * limit
-        sql_query += f" OFFSET {offset} LIMIT {limit}"
-
-        # Execute query
-        result = db.execute(text(sql_query), params)
-        rows = result.fetchall()
+            stmt = stmt.where(AuthAttempt.outcome == outcome)
+            filtered = True
+
+        count_key = (startDate, endDate, voterId, outcome)
+        cached_total = _cached_count(count_key)
+
+        # id breaks ties between equal timestamps so keyset cursors are exact.
+        # Pages fetch one extra row to tell whether another page exists.
+        order = (AuthAttempt.attempted_at.desc(), AuthAttempt.id.desc())
+        if afterTs is not None:
+            # Keyset page: seek past the cursor in the index instead of scanning OFFSET rows
+            rows = (await db.execute(
+                stmt.where(tuple_(AuthAttempt.attempted_at, AuthAttempt.id) < tuple_(afterTs, afterId))
+                .order_by(*order)
+                .limit(limit + 1)
+            )).all()
+            if cached_total is not None:
+                total = cached_total
+            elif filtered:
+                total = (await db.execute(select(func.count()).select_from(stmt.subquery()))).scalar_one()
+            else:
+                total = await _auth_attempts_estimate(db, len(rows))
+        else:
+            offset = (page - 1) * limit
+            # OFFSET/LIMIT compile to bind parameters, so every page shares one
+            # statement text and hits the prepared statement cache
+            stmt = stmt.order_by(*order).offset(offset).limit(limit + 1)
+
+            if not filtered and page == 1:
+                # Unfiltered first page: skip counting and use the planner's row estimate
+                rows = (await db.execute(stmt)).all()
+                if len(rows) <= limit:
+                    total = len(rows)
+                else:
+                    total = cached_total if cached_total is not None else await _auth_attempts_estimate(db, len(rows))
+            elif cached_total is not None:
+                rows = (await db.execute(stmt)).all()
+                total = cached_total
+            else:
+                # Count in the same scan as the page instead of a second COUNT query
+                rows = (await db.execute(stmt.add_columns(func.count().over().label("total_count")))).all()
+                if rows:
+                    total = rows[0].total_count
+                elif offset:
+                    # Past the last page the window count is unavailable
+                    total = (await db.execute(
+                        select(func.count()).select_from(stmt.limit(None).offset(None).order_by(None).subquery())
+                    )).scalar_one()
+                else:
+                    total = 0
+
+        if cached_total is None:
+            _store_count(count_key, total)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = {"afterTs": rows[-1].attempted_at.isoformat(), "afterId": str(rows[-1].id)}
 
         # Format response
         results = [
             {
-                "id": str(row[0]),
-                "voter_id": row[1],
-                "method": row[2],
-                "outcome": row[3],
-                "timestamp": row[4].isoformat() if row[4] else None,
-                "ip_address": str(row[5]) if row[5] else None,
-                "failure_reason": row[6],
-                "similarity_score": float(row[7]) if row[7] else None
+                "id": row.id,
+                "voter_id": row.voter_id,
+                "method": row.auth_method,
+                "outcome": row.outcome,
+                "timestamp": row.attempted_at,
+                "ip_address": str(row.ip_address) if row.ip_address else None,
+                "failure_reason": row.failure_reason,
+                "similarity_score": float(row.similarity_score) if row.similarity_score else None
             }
             for row in rows
         ]
 
-        return {"total": total, "page": page, "limit": limit, "logs": results}
+        # Returned directly so orjson serializes UUIDs and datetimes in C,
+        # skipping FastAPI's jsonable_encoder pass
+        return ORJSONResponse({"total": total, "page": page, "limit": limit, "logs": results, "next_cursor": next_cursor})
 
     except Exception as e:
         logger.error("get_audit_logs_failed", error=str(e), error_type=type(e).__name__)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to retrieve authentication logs: {str(e)}")
 
 
+# Columns copied verbatim into each transaction item; attrgetter fetches
+# them all in one C call per row
+_TX_FIELDS = (
+    "id",
+    "election_id",
+    "tx_type",
+    "tx_hash",
+    "block_number",
+    "from_address",
+    "to_address",
+    "gas_used",
+    "status",
+    "recorded_at"
+)
+_tx_values = attrgetter(*_TX_FIELDS)
+
+
 @router.get("/blockchain")
 async def get_blockchain_transactions(
     voterId: Optional[str] = Query(None),
     txHash: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=1000),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_admin = Depends(require_role(AdminRole.AUDITOR, AdminRole.ELECTION_ADMINISTRATOR, AdminRole.SUPER_ADMIN))
 ):
     """Return blockchain transaction logs (frontend expects 1-indexed pages)"""
     try:
-        query = db.query(BlockchainTransaction)
+        stmt = select(BlockchainTransaction)
 
         if txHash:
-            query = query.filter(BlockchainTransaction.tx_hash == txHash)
+            try:
+                hex_to_bytes(txHash)
+            except ValueError:
+                # Not a hash, so it cannot match any stored transaction
+                return ORJSONResponse({"total": 0, "page": page, "limit": limit, "transactions": []})
+            stmt = stmt.where(BlockchainTransaction.tx_hash == txHash)
 
         # voterId filter may not directly map to tx; leave as future enhancement
 
-        total = query.count()
+        total = (await db.execute(select(func.count()).select_from(stmt.subquery()))).scalar_one()
 
         # Convert 1-indexed page to 0-indexed offset
         offset = (page - 1) * limit
-        txs = query.order_by(BlockchainTransaction.recorded_at.desc()).offset(offset).limit(limit).all()
-
-        results = [
-            {
-                "id": str(t.id),
-                "election_id": str(t.election_id) if t.election_id else None,
-                "tx_type": t.tx_type,
-                "tx_hash": t.tx_hash,
-                "block_number": t.block_number,
-                "from_address": t.from_address,
-                "to_address": t.to_address,
-                "gas_used": t.gas_used,
-                "status": t.status,
-                "timestamp": t.recorded_at.isoformat() if t.recorded_at else None,
-                "voter_id": t.raw_event.get("voter_id") if t.raw_event else None,
-                "recorded_at": t.recorded_at.isoformat() if t.recorded_at else None
-            }
-            for t in txs
-        ]
-
-        return {"total": total, "page": page, "limit": limit, "transactions": results}
+        txs = (await db.execute(
+            stmt.order_by(BlockchainTransaction.recorded_at.desc())
+            .offset(offset)
+            .limit(limit)
+            # One IN-list query for the page's elections instead of one per row
+            .options(selectinload(BlockchainTransaction.election).load_only(Election.id, Election.name))
+        )).scalars().all()
+
+        results = []
+        for t in txs:
+            item = dict(zip(_TX_FIELDS, _tx_values(t)))
+            item["election_name"] = t.election.name if t.election else None
+            item["timestamp"] = item["recorded_at"]
+            item["voter_id"] = t.raw_event.get("voter_id") if t.raw_event else None
+            results.append(item)
+
+        return ORJSONResponse({"total": total, "page": page, "limit": limit, "transactions": results})
 
     except Exception as e:
         logger.error("get_blockchain_transactions_failed", error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve blockchain transactions")
 
 
+# Chunks buffered between COPY and the client; when full, COPY waits for the
+# client to catch up, so memory stays bounded on slow downloads
+_EXPORT_QUEUE_CHUNKS = 16
+# Seconds COPY may wait on a full queue before the export is abandoned, so a
+# reader that never starts or stops cannot hold the connection indefinitely
+_EXPORT_STALL_TIMEOUT = 60
+
+
+async def _start_copy(sql: str, args: list) -> Tuple[asyncio.Queue, asyncio.Task]:
+    """
+    Run COPY ... TO STDOUT on a dedicated connection, feeding a bounded queue
+
+    Args:
+        sql: Compiled SELECT with $n placeholders
+        args: Positional arguments for the placeholders
+
+    Returns:
+        Tuple[asyncio.Queue, asyncio.Task]: Queue of CSV chunks ending with None
+            on completion or the raised exception, and the task running COPY
+    """
+    queue = asyncio.Queue(maxsize=_EXPORT_QUEUE_CHUNKS)
+
+    async def put(item):
+        await asyncio.wait_for(queue.put(item), _EXPORT_STALL_TIMEOUT)
+
+    async def run():
+        end = None
+        try:
+            async with async_engine.connect() as conn:
+                raw = await conn.get_raw_connection()
+                # COPY takes no bind parameters; asyncpg encodes the $n arguments into the statement
+                await raw.driver_connection.copy_from_query(sql, *args, output=put, format="csv", header=True)
+        except asyncio.TimeoutError:
+            logger.warning("export_audit_logs_stalled", timeout=_EXPORT_STALL_TIMEOUT)
+            return
+        except Exception as e:
+            end = e
+        try:
+            await put(end)
+        except asyncio.TimeoutError:
+            logger.warning("export_audit_logs_stalled", timeout=_EXPORT_STALL_TIMEOUT)
+
+    return queue, asyncio.create_task(run())
+
+
+async def _iter_copy(queue: asyncio.Queue, task: asyncio.Task, first: bytes):
+    """Yield CSV chunks from a running COPY, cancelling it if the client goes away"""
+    try:
+        yield first
+        while (chunk := await queue.get()) is not None:
+            if isinstance(chunk, Exception):
+                # Headers are already sent; abort the response rather than truncate silently
+                logger.error("export_audit_logs_stream_failed", error=str(chunk))
+                raise chunk
+            yield chunk
+    finally:
+        task.cancel()
+
+
+async def _cancel_copy(task: asyncio.Task) -> None:
+    """Cancel a COPY task; a coroutine so Starlette runs it on the event loop, not a worker thread"""
+    task.cancel()
+
+
 @router.get("/export")
 async def export_audit_logs(
-    startDate: Optional[str] = Query(None),
-    endDate: Optional[str] = Query(None),
+    startDate: Optional[datetime] = Query(None),
+    endDate: Optional[datetime] = Query(None),
     voterId: Optional[str] = Query(None),
     outcome: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
     current_admin = Depends(require_role(AdminRole.AUDITOR, AdminRole.ELECTION_ADMINISTRATOR, AdminRole.SUPER_ADMIN))
 ):
-    """Export audit logs as CSV"""
+    """Export audit logs as CSV, streamed from Postgres COPY as it is produced"""
     try:
-        query = db.query(AuditLog)
+        stmt = select(
+            AuditLog.id,
+            AuditLog.admin_id,
+            AuditLog.action,
+            AuditLog.target_table,
+            AuditLog.target_id,
+            AuditLog.details,
+            AuditLog.ip_address,
+            AuditLog.occurred_at
+        )
 
         if startDate:
-            try:
-                start_dt = datetime.fromisoformat(startDate)
-                query = query.filter(AuditLog.occurred_at >= start_dt)
-            except Exception:
-                pass
+            stmt = stmt.where(AuditLog.occurred_at >= startDate)
         if endDate:
-            try:
-                end_dt = datetime.fromisoformat(endDate)
-                query = query.filter(AuditLog.occurred_at <= end_dt)
-            except Exception:
-                pass
+            stmt = stmt.where(AuditLog.occurred_at <= endDate)
         if voterId:
+            # Containment is served by the jsonb_path_ops GIN index on details
+            voter_match = AuditLog.details.op("@>")(cast(literal(orjson.dumps({"voter_id": voterId}).decode(), String), JSONB))
             try:
-                import uuid as _uuid
-                query = query.filter(or_(AuditLog.target_id == _uuid.UUID(voterId), AuditLog.details["voter_id"].astext == voterId))
-            except Exception:
-                query = query.filter(AuditLog.details["voter_id"].astext == voterId)
+                stmt = stmt.where(or_(AuditLog.target_id == uuid.UUID(voterId), voter_match))
+            except ValueError:
+                stmt = stmt.where(voter_match)
         if outcome:
-            query = query.filter(AuditLog.action == outcome)
-
-        logs = query.order_by(AuditLog.occurred_at.desc()).all()
-
-        # Build CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(["id", "admin_id", "action", "target_table", "target_id", "details", "ip_address", "occurred_at"])
-        for l in logs:
-            writer.writerow([
-                str(l.id),
-                str(l.admin_id) if l.admin_id else "",
-                l.action,
-                l.target_table or "",
-                str(l.target_id) if l.target_id else "",
-                str(l.details) if l.details else "",
-                str(l.ip_address) if l.ip_address else "",
-                l.occurred_at.isoformat() if l.occurred_at else ""
-            ])
-
-        response = Response(content=output.getvalue(), media_type="text/csv")
-        response.headers["Content-Disposition"] = "attachment; filename=audit_logs.csv"
-        return response
+            stmt = stmt.where(cast(AuditLog.action, String) == outcome)
+
+        compiled = stmt.order_by(AuditLog.occurred_at.desc()).compile(dialect=async_engine.dialect)
+        args = [compiled.params[name] for name in compiled.positiontup]
+
+        queue, task = await _start_copy(str(compiled), args)
+
+        # Wait for the first chunk (at least the header) so query errors still return a 500
+        try:
+            first = await queue.get()
+        except BaseException:
+            task.cancel()
+            raise
+        if isinstance(first, Exception):
+            raise first
+
+        # The generator's own cleanup never runs if iteration never starts
+        # (client gone before the body), so the response cancels COPY too
+        return StreamingResponse(
+            _iter_copy(queue, task, first),
+            media_type="text/csv",
+            headers={"Content-Disposition": "attachment; filename=audit_logs.csv"},
+            background=BackgroundTask(_cancel_copy, task)
+        )
 
     except Exception as e:
         logger.error("export_audit_logs_failed", error=str(e))
@@ -2,190 +2,232 @@
 Authentication and authorization routes
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import text
-from datetime import datetime, timedelta
-from typing import Optional
+from sqlalchemy import DateTime, String, bindparam, text
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import asyncio
+import pyotp
+import secrets
 import structlog
-import uuid
 
-from app.database import get_db
+from app.cache import admin_key, cache_delete
+from app.database import get_async_db, get_db
 from app.config import settings
 from app.schemas.auth import LoginResponse, LoginRequest, TokenRefreshResponse, MFASetupResponse, MFAVerifyResponse, Token, TokenRefresh, MFASetup, MFAVerify
+from app.models.admin import Admin
 from app.services.crypto import hash_password, verify_password
-from app.middleware.auth import create_access_token, create_refresh_token, get_current_admin
+from app.utils.uuid7 import uuid7
+from app.middleware.auth import create_access_token, create_refresh_token, decode_refresh_token, get_current_admin
 
 logger = structlog.get_logger()
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Verified against when the username is unknown, so that path costs the same
+# as a wrong password; hashed once at import rather than per request
+_DUMMY_PASSWORD_HASH = hash_password(secrets.token_urlsafe(16))
+
+
+@lru_cache(maxsize=1024)
+def _totp_for(secret: str) -> pyotp.TOTP:
+    """
+    TOTP verifier for an MFA secret, reused across verifications
+
+    Keyed by the secret itself, so a re-enrolled admin gets a fresh entry.
+
+    Args:
+        secret: Base32 TOTP secret
+
+    Returns:
+        pyotp.TOTP: Verifier for the secret
+    """
+    return pyotp.TOTP(secret)
+
+# Statements built once at import, with typed bind parameters, instead of
+# re-parsing the SQL text on every request
+_ADMIN_ID = bindparam("id", type_=UUID(as_uuid=False))
+# For binding uuid.UUID objects as-is, without a round trip through str
+_UUID_VALUE = UUID(as_uuid=True)
+
+_SQL_GET_ADMIN_BY_USERNAME = text("""
+    SELECT id, username, email, password_hash, role, is_active, mfa_enabled
+    FROM admins
+    WHERE username = :username
+""").bindparams(bindparam("username", type_=String))
+# Re-checks is_active and returns the current identity in the same round trip
+_SQL_UPDATE_LAST_LOGIN = text("""
+    UPDATE admins SET last_login_at = :ts
+    WHERE id = :id AND is_active
+    RETURNING id, username, role
+""").bindparams(_ADMIN_ID, bindparam("ts", type_=DateTime(timezone=True)))
+_SQL_GET_ADMIN_BY_ID = text("SELECT id, username, role, is_active FROM admins WHERE id = :id").bindparams(_ADMIN_ID)
+_SQL_SET_MFA_SECRET = text("UPDATE admins SET mfa_secret = :secret WHERE id = :id").bindparams(
+    _ADMIN_ID, bindparam("secret", type_=String)
+)
+_SQL_GET_MFA_SECRET = text("SELECT mfa_secret FROM admins WHERE id = :id").bindparams(_ADMIN_ID)
+_SQL_ENABLE_MFA = text("UPDATE admins SET mfa_enabled = TRUE WHERE id = :id").bindparams(_ADMIN_ID)
+_SQL_DISABLE_MFA = text("UPDATE admins SET mfa_enabled = FALSE, mfa_secret = NULL WHERE id = :id").bindparams(_ADMIN_ID)
+
 
 @router.post("/login", response_model=LoginResponse)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Admin login with username and password
     Returns JWT access and refresh tokens
     """
-    try:
-        # Query admin user
-        result = db.execute(
-            text("""
-                SELECT id, username, email, password_hash, role, is_active, mfa_enabled
-                FROM admins
-                WHERE username = :username
-            """),
-            {"username": form_data.username}
-        )
-        admin = result.fetchone()
-
-        if not admin:
-            logger.warning("login_failed", username=form_data.username, reason="user_not_found")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid credentials"
-            )
-
-        # Check if account is active
-        if not admin.is_active:
-            logger.warning("login_failed", username=form_data.username, reason="account_inactive")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Account is disabled"
-            )
-
-        # Verify password
-        if not verify_password(form_data.password, admin.password_hash):
-            logger.warning("login_failed", username=form_data.username, reason="invalid_password")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid credentials"
-            )
-
-        # Check if MFA is required
-        if admin.mfa_enabled:
-            # Return a temporary token that requires MFA verification
-            temp_token = create_access_token(
-                data={
-                    "sub": str(admin.id),
-                    "username": admin.username,
-                    "role": admin.role,
-                    "mfa_required": True
-                },
-                expires_delta=timedelta(minutes=5)
-            )
-            return LoginResponse(
-                access_token=temp_token,
-                refresh_token="",
-                token_type="bearer",
-                expires_in=300,
-                admin_id=str(admin.id),
-                username=admin.username,
-                role=str(admin.role)
-            )
-
-        # Create tokens
-        access_token = create_access_token(
-            data={
-                "sub": str(admin.id),
-                "username": admin.username,
-                "role": admin.role
-            }
-        )
-        refresh_token = create_refresh_token(
-            data={"sub": str(admin.id)}
+    # Query admin user
+    result = await db.execute(
+        _SQL_GET_ADMIN_BY_USERNAME,
+        {"username": form_data.username}
+    )
+    admin = result.fetchone()
+
+    if not admin:
+        await asyncio.to_thread(verify_password, form_data.password, _DUMMY_PASSWORD_HASH)
+        logger.warning("login_failed", username=form_data.username, reason="user_not_found")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials"
         )
 
-        # Update last login
-        db.execute(
-            text("UPDATE admins SET last_login_at = NOW() WHERE id = :id"),
-            {"id": str(admin.id)}
+    # Check if account is active
+    if not admin.is_active:
+        logger.warning("login_failed", username=form_data.username, reason="account_inactive")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account is disabled"
         )
-        db.commit()
 
-        logger.info("login_success", admin_id=str(admin.id), username=admin.username)
+    # Verify password; Argon2 is deliberately slow, so keep it off the event loop
+    if not await asyncio.to_thread(verify_password, form_data.password, admin.password_hash):
+        logger.warning("login_failed", username=form_data.username, reason="invalid_password")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials"
+        )
 
-        return LoginResponse(
-            access_token=access_token,
-            refresh_token=refresh_token,
+    # Check if MFA is required
+    if admin.mfa_enabled:
+        # Return a temporary token that requires MFA verification
+        temp_token = create_access_token(
+            data={
+                "sub": str(admin.id),
+                "username": admin.username,
+                "role": admin.role,
+                "mfa_required": True
+            },
+            expires_delta=timedelta(minutes=5)
+        )
+        response = LoginResponse(
+            access_token=temp_token,
+            refresh_token="",
             token_type="bearer",
-            expires_in=1800,
+            expires_in=300,
             admin_id=str(admin.id),
             username=admin.username,
             role=str(admin.role)
         )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("login_error", error=str(e))
+        return ORJSONResponse(response.model_dump())
+
+    # Update last login; the returned row is what the tokens are issued for
+    admin = (await db.execute(
+        _SQL_UPDATE_LAST_LOGIN,
+        {"id": str(admin.id), "ts": datetime.now(timezone.utc)}
+    )).fetchone()
+    await db.commit()
+
+    if not admin:
+        # Deactivated between the lookup and the update
+        logger.warning("login_failed", username=form_data.username, reason="account_inactive")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Login failed"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account is disabled"
         )
 
+    await cache_delete(admin_key(str(admin.id)))
+
+    # Create tokens
+    access_token = create_access_token(
+        data={
+            "sub": str(admin.id),
+            "username": admin.username,
+            "role": admin.role
+        }
+    )
+    refresh_token = create_refresh_token(
+        data={"sub": str(admin.id)}
+    )
+
+    logger.info("login_success", admin_id=str(admin.id), username=admin.username)
+
+    response = LoginResponse(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        token_type="bearer",
+        expires_in=1800,
+        admin_id=str(admin.id),
+        username=admin.username,
+        role=str(admin.role)
+    )
+    # Returned as-is, skipping response_model re-validation
+    return ORJSONResponse(response.model_dump())
+
 
 @router.post("/refresh", response_model=Token)
 async def refresh_token(
     token_data: TokenRefresh,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Refresh access token using refresh token
     """
-    try:
-        # Verify and decode refresh token
-        from app.middleware.auth import verify_token
-        payload = verify_token(token_data.refresh_token)
-
-        admin_id = payload.get("sub")
-        if not admin_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid refresh token"
-            )
-
-        # Get admin details
-        result = db.execute(
-            text("SELECT id, username, role, is_active FROM admins WHERE id = :id"),
-            {"id": admin_id}
-        )
-        admin = result.fetchone()
-
-        if not admin or not admin.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Admin not found or inactive"
-            )
+    # Verify and decode refresh token
+    payload = decode_refresh_token(token_data.refresh_token)
 
-        # Create new access token
-        access_token = create_access_token(
-            data={
-                "sub": str(admin.id),
-                "username": admin.username,
-                "role": admin.role
-            }
+    admin_id = payload.get("sub")
+    if not admin_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token"
         )
 
-        return {
-            "access_token": access_token,
-            "refresh_token": token_data.refresh_token,
-            "token_type": "bearer"
-        }
+    # Get admin details
+    result = await db.execute(
+        _SQL_GET_ADMIN_BY_ID,
+        {"id": admin_id}
+    )
+    admin = result.fetchone()
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("refresh_token_error", error=str(e))
+    if not admin or not admin.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid refresh token"
+            detail="Admin not found or inactive"
         )
 
+    # Create new access token
+    access_token = create_access_token(
+        data={
+            "sub": str(admin.id),
+            "username": admin.username,
+            "role": admin.role
+        }
+    )
+
+    return {
+        "access_token": access_token,
+        "refresh_token": token_data.refresh_token,
+        "token_type": "bearer"
+    }
+
 
 @router.post("/logout")
 async def logout(current_admin: dict = Depends(get_current_admin)):
@@ -226,40 +268,30 @@ async def setup_mfa(
     """
     Setup MFA (TOTP) for admin account
     """
-    try:
-        import pyotp
-
-        # Generate TOTP secret
-        secret = pyotp.random_base32()
-
-        # Generate QR code provisioning URI
-        admin_username = current_admin["username"]
-        uri = pyotp.totp.TOTP(secret).provisioning_uri(
-            name=admin_username,
-            issuer_name="Blockchain Voting System"
-        )
-
-        # Store secret in database (encrypted in production)
-        db.execute(
-            text("UPDATE admins SET mfa_secret = :secret WHERE id = :id"),
-            {"secret": secret, "id": current_admin["sub"]}
-        )
-        db.commit()
+    # Generate TOTP secret
+    secret = pyotp.random_base32()
+
+    # Generate QR code provisioning URI
+    admin_username = current_admin["username"]
+    uri = pyotp.totp.TOTP(secret).provisioning_uri(
+        name=admin_username,
+        issuer_name="Blockchain Voting System"
+    )
 
-        logger.info("mfa_setup_initiated", admin_id=current_admin["sub"])
+    # Store secret in database (encrypted in production)
+    db.execute(
+        _SQL_SET_MFA_SECRET,
+        {"secret": secret, "id": current_admin["sub"]}
+    )
+    db.commit()
 
-        return {
-            "secret": secret,
-            "qr_code_uri": uri,
-            "message": "Scan QR code with authenticator app"
-        }
+    logger.info("mfa_setup_initiated", admin_id=current_admin["sub"])
 
-    except Exception as e:
-        logger.error("mfa_setup_error", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="MFA setup failed"
-        )
+    return {
+        "secret": secret,
+        "qr_code_uri": uri,
+        "message": "Scan QR code with authenticator app"
+    }
 
 
 @router.post("/mfa/verify")
@@ -271,50 +303,38 @@ async def verify_mfa(
     """
     Verify MFA code and enable MFA for account
     """
-    try:
-        import pyotp
+    # Get MFA secret
+    result = db.execute(
+        _SQL_GET_MFA_SECRET,
+        {"id": current_admin["sub"]}
+    )
+    admin = result.fetchone()
 
-        # Get MFA secret
-        result = db.execute(
-            text("SELECT mfa_secret FROM admins WHERE id = :id"),
-            {"id": current_admin["sub"]}
+    if not admin or not admin.mfa_secret:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="MFA not set up"
         )
-        admin = result.fetchone()
-
-        if not admin or not admin.mfa_secret:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="MFA not set up"
-            )
-
-        # Verify TOTP code
-        totp = pyotp.TOTP(admin.mfa_secret)
-        if not totp.verify(mfa_data.code, valid_window=1):
-            logger.warning("mfa_verification_failed", admin_id=current_admin["sub"])
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid MFA code"
-            )
-
-        # Enable MFA
-        db.execute(
-            text("UPDATE admins SET mfa_enabled = TRUE WHERE id = :id"),
-            {"id": current_admin["sub"]}
+
+    # Verify TOTP code
+    totp = _totp_for(admin.mfa_secret)
+    if not totp.verify(mfa_data.code, valid_window=1):
+        logger.warning("mfa_verification_failed", admin_id=current_admin["sub"])
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid MFA code"
         )
-        db.commit()
 
-        logger.info("mfa_enabled", admin_id=current_admin["sub"])
+    # Enable MFA
+    db.execute(
+        _SQL_ENABLE_MFA,
+        {"id": current_admin["sub"]}
+    )
+    db.commit()
 
-        return {"message": "MFA enabled successfully"}
+    logger.info("mfa_enabled", admin_id=current_admin["sub"])
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("mfa_verify_error", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="MFA verification failed"
-        )
+    return {"message": "MFA enabled successfully"}
 
 
 @router.post("/mfa/disable")
@@ -326,7 +346,7 @@ async def disable_mfa(
     Disable MFA for admin account
     """
     db.execute(
-        text("UPDATE admins SET mfa_enabled = FALSE, mfa_secret = NULL WHERE id = :id"),
+        _SQL_DISABLE_MFA,
         {"id": current_admin["sub"]}
     )
     db.commit()
@@ -344,142 +364,130 @@ async def bootstrap_test_data(db: Session = Depends(get_db)):
     
     WARNING: This endpoint should be disabled in production!
     """
-    try:
-        created = []
-        
-        # Check if admin already exists
-        admin_check = db.execute(
-            text("SELECT id FROM admins WHERE username = 'superadmin'")
-        ).fetchone()
-        
-        if admin_check:
-            # Update existing admin password
-            admin_id = admin_check[0]
-            hashed_pwd = hash_password("Admin@123456")
-            db.execute(
-                text("UPDATE admins SET password_hash = :pwd WHERE id = :id"),
-                {"pwd": hashed_pwd, "id": admin_id}
-            )
-            db.commit()
-            created.append("admin_superadmin_updated")
-            logger.info("bootstrap_admin_updated")
-        else:
-            # Create superadmin user
-            admin_id = str(uuid.uuid4())
-            hashed_pwd = hash_password("Admin@123456")
-            
-            db.execute(
-                text("""
-                    INSERT INTO admins (id, username, email, password_hash, role, is_active)
-                    VALUES (:id, :username, :email, :password_hash, :role, :is_active)
-                """),
-                {
-                    "id": admin_id,
-                    "username": "superadmin",
-                    "email": "superadmin@voting.local",
-                    "password_hash": hashed_pwd,
-                    "role": "super_admin",
-                    "is_active": True
-                }
-            )
-            db.commit()
-            created.append("admin_superadmin")
-            logger.info("bootstrap_admin_created")
-        
-        # Create test election
-        election_check = db.execute(
-            text("SELECT id FROM elections WHERE name = 'Test Election 2026'")
-        ).fetchone()
-        
-        if not election_check:
-            election_id = str(uuid.uuid4())
-            
-            db.execute(
-                text("""
-                    INSERT INTO elections (id, name, description, status, voting_start_at, voting_end_at)
-                    VALUES (:id, :name, :description, :status, :voting_start_at, :voting_end_at)
-                """),
-                {
-                    "id": election_id,
-                    "name": "Test Election 2026",
-                    "description": "Test election for development",
-                    "status": "draft",
-                    "voting_start_at": datetime.utcnow() + timedelta(hours=1),
-                    "voting_end_at": datetime.utcnow() + timedelta(hours=9)
-                }
-            )
-            db.commit()
-            created.append(f"election_{election_id[:8]}")
-            logger.info("bootstrap_election_created")
-        else:
-            election_id = election_check[0]
-        
-        # Create test constituency
-        constituency_check = db.execute(
-            text("SELECT id FROM constituencies WHERE name = 'Test Constituency'")
-        ).fetchone()
+    created = []
+    
+    now = datetime.now(timezone.utc)
+    password_hash = await asyncio.to_thread(hash_password, "Admin@123456")
+
+    # Create or reset the superadmin in one statement; xmax = 0 only for a fresh insert
+    admin_row = db.execute(
+        text("""
+            INSERT INTO admins (id, username, email, password_hash, role, is_active)
+            VALUES (:id, :username, :email, :password_hash, :role, :is_active)
+            ON CONFLICT (username) DO UPDATE SET password_hash = EXCLUDED.password_hash
+            RETURNING id, (xmax = 0) AS inserted
+        """).bindparams(bindparam("id", type_=_UUID_VALUE)),
+        {
+            "id": uuid7(),
+            "username": "superadmin",
+            "email": "superadmin@voting.local",
+            "password_hash": password_hash,
+            "role": "super_admin",
+            "is_active": True
+        }
+    ).fetchone()
+
+    if admin_row.inserted:
+        created.append("admin_superadmin")
+        logger.info("bootstrap_admin_created")
+    else:
+        created.append("admin_superadmin_updated")
+        logger.info("bootstrap_admin_updated")
+    
+    # Create test election
+    election_check = db.execute(
+        text("SELECT id FROM elections WHERE name = 'Test Election 2026'")
+    ).fetchone()
+    
+    if not election_check:
+        election_id = uuid7()
         
-        if not constituency_check:
-            constituency_id = str(uuid.uuid4())
-            db.execute(
-                text("""
-                    INSERT INTO constituencies (id, election_id, name, code, on_chain_id)
-                    VALUES (:id, :election_id, :name, :code, :on_chain_id)
-                """),
+        db.execute(
+            text("""
+                INSERT INTO elections (id, name, description, status, voting_start_at, voting_end_at)
+                VALUES (:id, :name, :description, :status, :voting_start_at, :voting_end_at)
+            """).bindparams(bindparam("id", type_=_UUID_VALUE)),
+            {
+                "id": election_id,
+                "name": "Test Election 2026",
+                "description": "Test election for development",
+                "status": "draft",
+                "voting_start_at": now + timedelta(hours=1),
+                "voting_end_at": now + timedelta(hours=9)
+            }
+        )
+        created.append(f"election_{election_id.hex[:8]}")
+        logger.info("bootstrap_election_created")
+    else:
+        election_id = election_check[0]
+    
+    # Create test constituency
+    constituency_check = db.execute(
+        text("SELECT id FROM constituencies WHERE name = 'Test Constituency'")
+    ).fetchone()
+    
+    if not constituency_check:
+        constituency_id = uuid7()
+        db.execute(
+            text("""
+                INSERT INTO constituencies (id, election_id, name, code, on_chain_id)
+                VALUES (:id, :election_id, :name, :code, :on_chain_id)
+            """).bindparams(bindparam("id", type_=_UUID_VALUE), bindparam("election_id", type_=_UUID_VALUE)),
+            {
+                "id": constituency_id,
+                "election_id": election_id,
+                "name": "Test Constituency",
+                "code": "TST_001",
+                "on_chain_id": 1
+            }
+        )
+        created.append(f"constituency_{constituency_id.hex[:8]}")
+        logger.info("bootstrap_constituency_created")
+    else:
+        constituency_id = constituency_check[0]
+    
+    # Create test candidates
+    candidate_check = db.execute(
+        text("SELECT COUNT(*) as cnt FROM candidates WHERE election_id = :election_id"),
+        {"election_id": election_id}
+    ).fetchone()
+    
+    if candidate_check[0] == 0:
+        candidate_names = ["Alice Johnson", "Bob Smith", "Charlie Brown", "Diana Prince"]
+        # One executemany instead of a statement per candidate
+        db.execute(
+            text("""
+                INSERT INTO candidates (id, election_id, constituency_id, name, party, on_chain_id)
+                VALUES (:id, :election_id, :constituency_id, :name, :party, :on_chain_id)
+            """).bindparams(
+                bindparam("id", type_=_UUID_VALUE),
+                bindparam("election_id", type_=_UUID_VALUE),
+                bindparam("constituency_id", type_=_UUID_VALUE)
+            ),
+            [
                 {
-                    "id": constituency_id,
+                    "id": uuid7(),
                     "election_id": election_id,
-                    "name": "Test Constituency",
-                    "code": "TST_001",
-                    "on_chain_id": 1
+                    "constituency_id": constituency_id,
+                    "name": name,
+                    "party": f"Party {i}",
+                    "on_chain_id": i
                 }
-            )
-            db.commit()
-            created.append(f"constituency_{constituency_id[:8]}")
-            logger.info("bootstrap_constituency_created")
-        else:
-            constituency_id = constituency_check[0]
-        
-        # Create test candidates
-        candidate_check = db.execute(
-            text("SELECT COUNT(*) as cnt FROM candidates WHERE election_id = :election_id"),
-            {"election_id": election_id}
-        ).fetchone()
-        
-        if candidate_check[0] == 0:
-            candidate_names = ["Alice Johnson", "Bob Smith", "Charlie Brown", "Diana Prince"]
-            for i, name in enumerate(candidate_names, 1):
-                candidate_id = str(uuid.uuid4())
-                db.execute(
-                    text("""
-                        INSERT INTO candidates (id, election_id, constituency_id, name, party, on_chain_id)
-                        VALUES (:id, :election_id, :constituency_id, :name, :party, :on_chain_id)
-                    """),
-                    {
-                        "id": candidate_id,
-                        "election_id": election_id,
-                        "constituency_id": constituency_id,
-                        "name": name,
-                        "party": f"Party {i}",
-                        "on_chain_id": i
-                    }
-                )
-            db.commit()
-            created.append(f"candidates_4")
-            logger.info("bootstrap_candidates_created")
-        
-        return {
-            "success": True,
-            "message": "Bootstrap complete",
-            "created": created,
-            "credentials": {
-                "username": "superadmin",
-                "password": "Admin@123456"
-            }
-        }    
-    except Exception as e:
-        logger.error("bootstrap_failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Bootstrap failed: {str(e)}"
-        )
\ No newline at end of file
+                for i, name in enumerate(candidate_names, 1)
+            ]
+        )
+        created.append(f"candidates_4")
+        logger.info("bootstrap_candidates_created")
+
+    # Everything above commits together, or not at all
+    db.commit()
+
+    return {
+        "success": True,
+        "message": "Bootstrap complete",
+        "created": created,
+        "credentials": {
+            "username": "superadmin",
+            "password": "Admin@123456"
+        }
+    }    
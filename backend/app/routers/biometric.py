@@ -1,24 +1,20 @@
 """
 Biometric authentication routes
 """
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, File, Form, UploadFile
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
+import asyncio
 import structlog
 from typing import Optional
 
-from app.services.biometric import FaceService, FACE_AVAILABLE, BiometricAuthError, FingerprintService, FINGERPRINT_AVAILABLE
+from app.services.biometric import FACE_AVAILABLE, FINGERPRINT_AVAILABLE, get_face_service
 
 logger = structlog.get_logger()
 router = APIRouter(prefix="/biometric", tags=["biometric"])
 
 
 # Request/Response Models
-class FaceVerifyRequest(BaseModel):
-    """Request for face verification"""
-    image: str = Field(..., description="Base64 encoded image")
-    user_id: str = Field(..., description="User ID to verify against")
-
-
 class FaceVerifyResponse(BaseModel):
     """Response for face verification"""
     verified: bool
@@ -26,12 +22,6 @@ class FaceVerifyResponse(BaseModel):
     message: str
 
 
-class FaceEnrollRequest(BaseModel):
-    """Request for face enrollment"""
-    image: str = Field(..., description="Base64 encoded image")
-    user_id: str = Field(..., description="User ID to enroll")
-
-
 class FaceEnrollResponse(BaseModel):
     """Response for face enrollment"""
     success: bool
@@ -52,19 +42,19 @@ class FingerprintVerifyResponse(BaseModel):
     message: str
 
 
-# Initialize services
-face_service = FaceService() if FACE_AVAILABLE else None
-fingerprint_service = FingerprintService() if FINGERPRINT_AVAILABLE else None
+# Face endpoints
 
 
-# Face endpoints
 @router.post("/face", response_model=FaceVerifyResponse)
-async def verify_face(request: FaceVerifyRequest):
+async def verify_face(
+    user_id: str = Form(..., description="User ID to verify against"),
+    image: UploadFile = File(..., description="Face image")
+):
     """
     Verify face biometric
     
-    Requires:
-    - Base64 encoded face image
+    Requires (multipart/form-data):
+    - Face image file
     - User ID to verify against
     
     Returns:
@@ -77,46 +67,38 @@ async def verify_face(request: FaceVerifyRequest):
             detail="Face recognition service is not available"
         )
     
-    try:
-        logger.info("face_verification_requested", user_id=request.user_id)
-        
-        # Decode base64 image
-        image_bytes = face_service.decode_image(request.image)
-        
-        # Get embedding for provided image
-        embedding = face_service.get_embedding(image_bytes)
-        
-        # TODO: Compare with stored embedding for user_id
-        # For now, return a basic response
-        logger.info("face_verification_completed", user_id=request.user_id)
-        
-        return FaceVerifyResponse(
-            verified=True,
-            confidence=0.95,
-            message="Face verified successfully"
-        )
-        
-    except BiometricAuthError as e:
-        logger.warning("face_verification_failed", error=str(e), user_id=request.user_id)
-        raise HTTPException(
-            status_code=400,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error("face_verification_error", error=str(e), user_id=request.user_id)
-        raise HTTPException(
-            status_code=500,
-            detail="Face verification failed"
-        )
+    logger.info("face_verification_requested", user_id=user_id)
+    
+    face_service = get_face_service()
+
+    # Raw upload bytes; no base64 round trip
+    image_bytes = await image.read()
+    
+    # Get embedding for provided image
+    embedding = await asyncio.to_thread(face_service.get_embedding, image_bytes)
+    
+    # TODO: Compare with stored embedding for user_id
+    # For now, return a basic response
+    logger.info("face_verification_completed", user_id=user_id)
+    
+    response = FaceVerifyResponse(
+        verified=True,
+        confidence=0.95,
+        message="Face verified successfully"
+    )
+    return ORJSONResponse(response.model_dump())
 
 
 @router.post("/face/enroll", response_model=FaceEnrollResponse)
-async def enroll_face(request: FaceEnrollRequest):
+async def enroll_face(
+    user_id: str = Form(..., description="User ID to enroll"),
+    image: UploadFile = File(..., description="Face image")
+):
     """
     Enroll a face for a user
     
-    Requires:
-    - Base64 encoded face image
+    Requires (multipart/form-data):
+    - Face image file
     - User ID to associate with this face
     
     Returns:
@@ -129,39 +111,30 @@ async def enroll_face(request: FaceEnrollRequest):
             detail="Face recognition service is not available"
         )
     
-    try:
-        logger.info("face_enrollment_requested", user_id=request.user_id)
-        
-        # Decode base64 image
-        image_bytes = face_service.decode_image(request.image)
-        
-        # Process and store embedding
-        # TODO: Store in database with user_id
-        embedding = face_service.get_embedding(image_bytes)
-        
-        logger.info("face_enrollment_completed", user_id=request.user_id)
-        
-        return FaceEnrollResponse(
-            success=True,
-            message="Face enrolled successfully",
-            user_id=request.user_id
-        )
-        
-    except BiometricAuthError as e:
-        logger.warning("face_enrollment_failed", error=str(e), user_id=request.user_id)
-        raise HTTPException(
-            status_code=400,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error("face_enrollment_error", error=str(e), user_id=request.user_id)
-        raise HTTPException(
-            status_code=500,
-            detail="Face enrollment failed"
-        )
+    logger.info("face_enrollment_requested", user_id=user_id)
+    
+    face_service = get_face_service()
+
+    # Raw upload bytes; no base64 round trip
+    image_bytes = await image.read()
+    
+    # Process and store embedding
+    # TODO: Store in database with user_id
+    embedding = await asyncio.to_thread(face_service.get_embedding, image_bytes)
+    
+    logger.info("face_enrollment_completed", user_id=user_id)
+    
+    response = FaceEnrollResponse(
+        success=True,
+        message="Face enrolled successfully",
+        user_id=user_id
+    )
+    return ORJSONResponse(response.model_dump())
 
 
 # Fingerprint endpoints
+
+
 @router.post("/fingerprint", response_model=FingerprintVerifyResponse)
 async def verify_fingerprint(request: FingerprintVerifyRequest):
     """
@@ -181,24 +154,17 @@ async def verify_fingerprint(request: FingerprintVerifyRequest):
             detail="Fingerprint recognition service is not available"
         )
     
-    try:
-        logger.info("fingerprint_verification_requested", user_id=request.user_id)
-        
-        # TODO: Implement fingerprint verification
-        logger.info("fingerprint_verification_completed", user_id=request.user_id)
-        
-        return FingerprintVerifyResponse(
-            verified=True,
-            confidence=0.95,
-            message="Fingerprint verified successfully"
-        )
-        
-    except Exception as e:
-        logger.error("fingerprint_verification_error", error=str(e), user_id=request.user_id)
-        raise HTTPException(
-            status_code=500,
-            detail="Fingerprint verification failed"
-        )
+    logger.info("fingerprint_verification_requested", user_id=request.user_id)
+    
+    # TODO: Implement fingerprint verification
+    logger.info("fingerprint_verification_completed", user_id=request.user_id)
+    
+    response = FingerprintVerifyResponse(
+        verified=True,
+        confidence=0.95,
+        message="Fingerprint verified successfully"
+    )
+    return ORJSONResponse(response.model_dump())
 
 
 @router.get("/status")
@@ -2,19 +2,26 @@
 Election management and lifecycle router
 Implements complete election workflow: draft -> active -> closed -> finalized
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from typing import List, Optional
-from datetime import datetime
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Integer, bindparam, func, and_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload, selectinload
+from typing import Dict, List, Literal, Optional, Tuple
+from datetime import datetime, timezone
+from urllib.parse import urlencode
 from uuid import UUID
+import asyncio
 import structlog
 
-from app.database import get_db
-from app.models.election import Election, ElectionStatus, Constituency, Candidate
+from app.cache import cache_delete, cache_get, cache_set, dashboard_stats_key, election_key, election_results_key
+from app.database import AsyncSessionLocal, defer_insert, get_async_db
+from app.utils.uuid7 import uuid7
+from app.models.election import Election, ElectionResult, ElectionStatus, Constituency, Candidate
 from app.models.admin import Admin, AdminRole
 from app.models.audit import AuditLog, LogAction, BlockchainTransaction, TxType
-from app.models.voter import VoteSubmission
+from app.models.voter import Voter, VoteSubmission
 from app.schemas.election import (
     ElectionCreate,
     ElectionResponse,
@@ -29,32 +36,105 @@ from app.services.blockchain import blockchain_service, BlockchainError
 
 logger = structlog.get_logger()
 
+# Handlers return ORJSONResponse built from the validated response model, so
+# FastAPI does not validate and encode the result a second time.
+# response_model stays declared for the OpenAPI schema.
 router = APIRouter(prefix="/api/elections", tags=["Elections"])
 
+# Election.status loads as a plain string (see the model), so states are
+# compared as their string values throughout
+_EDITABLE_STATES = frozenset({ElectionStatus.DRAFT.value, ElectionStatus.CONFIGURED.value})
+
+# Role dependencies shared by the routes below
+_require_election_admin = require_role(AdminRole.ELECTION_ADMINISTRATOR, AdminRole.SUPER_ADMIN)
+_require_election_auditor = require_role(AdminRole.ELECTION_ADMINISTRATOR, AdminRole.SUPER_ADMIN, AdminRole.AUDITOR)
+
+# Dashboards poll /stats from many tabs; counts may lag this many seconds
+_DASHBOARD_STATS_TTL = 10
+
+# Election detail responses are invalidated on every write; the TTL only
+# bounds staleness if an invalidation is lost while Redis is unreachable
+_ELECTION_DETAIL_TTL = 60
+
+# Finalized results are immutable; the TTL only reclaims Redis memory
+_RESULTS_TTL = 86400
+# In-process copy of finalized results, skipping even the Redis round trip
+_RESULTS_LOCAL_MAX = 128
+_results_local: Dict[UUID, dict] = {}
+
+
+def _store_results_local(election_id: UUID, results: dict) -> None:
+    """Keep finalized results in process, evicting the oldest entry when full"""
+    if len(_results_local) >= _RESULTS_LOCAL_MAX:
+        del _results_local[next(iter(_results_local))]
+    _results_local[election_id] = results
+
+
+# Election columns serialized by ElectionResponse; listings load nothing else
+_ELECTION_RESPONSE_COLUMNS = (
+    Election.name, Election.description, Election.status,
+    Election.voting_start_at, Election.voting_end_at,
+    Election.contract_address, Election.voting_contract_address,
+    Election.registry_contract_address, Election.tally_contract_address,
+    Election.network_id, Election.created_at, Election.updated_at
+)
+
+# All four dashboard counters in one round trip; elections is scanned once
+_SQL_DASHBOARD_STATS = text("""
+    SELECT e.total_elections, e.active_elections,
+           (SELECT count(*) FROM voters) AS registered_voters,
+           (SELECT count(*) FROM vote_submissions) AS total_votes
+    FROM (
+        SELECT count(*) AS total_elections,
+               count(*) FILTER (WHERE status = 'active') AS active_elections
+        FROM elections
+    ) AS e
+""")
+
+# Statements built once at import with bound parameters, so requests skip
+# constructing them and go straight to the engine's compiled cache
+
+# Constituencies with their active candidates and each one's registered
+# voter count, for building results
+_STMT_RESULT_CONSTITUENCIES = (
+    select(
+        Constituency,
+        select(func.count(Voter.id))
+        .where(Voter.constituency_id == Constituency.id)
+        .correlate(Constituency)
+        .scalar_subquery()
+    )
+    .where(Constituency.election_id == bindparam("election_id"))
+    .options(selectinload(Constituency.candidates.and_(Candidate.is_active == True)))
+)
+
+_STMT_STORED_RESULTS = select(ElectionResult.payload).where(ElectionResult.election_id == bindparam("election_id"))
+
 
 # Helper function to log audit events
 def log_audit(
-    db: Session,
+    db: AsyncSession,
     admin: Admin,
     action: LogAction,
     target_table: str,
     target_id: UUID,
     details: dict = None
 ):
-    """Log audit event"""
-    audit_log = AuditLog(
-        admin_id=admin.id,
-        action=action,
-        target_table=target_table,
-        target_id=target_id,
-        details=details
-    )
-    db.add(audit_log)
+    """Log audit event; inserted with the transaction's other audit rows just before it commits"""
+    # The id is minted now, so occurred_at (taken from it) is the action time
+    defer_insert(db, AuditLog.__table__, {
+        "id": uuid7(),
+        "admin_id": admin.id,
+        "action": action,
+        "target_table": target_table,
+        "target_id": target_id,
+        "details": details
+    })
 
 
 # Helper function to log blockchain transactions
 def log_blockchain_tx(
-    db: Session,
+    db: AsyncSession,
     election_id: UUID,
     tx_type: TxType,
     tx_hash: str,
@@ -64,22 +144,12 @@ def log_blockchain_tx(
     status: bool = True
 ):
     """Log blockchain transaction"""
-    # Normalize tx_hash: ensure 0x prefix and lowercase
-    normalized_hash = None
-    if tx_hash:
-        try:
-            h = str(tx_hash)
-            h = h.lower()
-            if not h.startswith('0x'):
-                h = '0x' + h
-            normalized_hash = h
-        except Exception:
-            normalized_hash = tx_hash
-
+    # tx_hash is a HexBinary column: any case, with or without 0x, binds to
+    # the same bytes, so the hash is stored as returned by the service
     tx_log = BlockchainTransaction(
         election_id=election_id,
         tx_type=tx_type,
-        tx_hash=normalized_hash,
+        tx_hash=tx_hash,
         from_address=from_address,
         block_number=block_number,
         gas_used=gas_used,
@@ -88,11 +158,61 @@ def log_blockchain_tx(
     db.add(tx_log)
 
 
+async def _next_on_chain_id(db: AsyncSession, model, election_id: UUID):
+    """
+    SQL expression for the next free on_chain_id in an election
+
+    Assign the result to the new row's on_chain_id so the INSERT computes
+    MAX + 1 itself. A transaction-scoped advisory lock, taken here, keeps
+    concurrent inserts for the same election and table from reading the
+    same maximum; it is released on commit or rollback.
+
+    Args:
+        db: Database session
+        model: Constituency or Candidate
+        election_id: Election identifier
+
+    Returns:
+        Scalar subquery yielding the next on_chain_id (0 for the first row)
+    """
+    lock_key = f"{model.__tablename__}.on_chain_id:{election_id}"
+    await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(lock_key))))
+    return (
+        select(func.coalesce(func.max(model.on_chain_id) + 1, 0))
+        .where(model.election_id == election_id)
+        .scalar_subquery()
+    )
+
+
+async def _get_election_with_children(db: AsyncSession, election_id: UUID) -> Optional[Election]:
+    """
+    Load an election with the collections ElectionResponse serializes
+
+    Async sessions cannot lazy load, so constituencies and candidates are
+    loaded up front. populate_existing refreshes an instance already in the
+    session, picking up server-generated columns after a commit.
+
+    Args:
+        db: Database session
+        election_id: Election identifier
+
+    Returns:
+        Election, or None if it does not exist
+    """
+    result = await db.execute(
+        select(Election)
+        .options(selectinload(Election.constituencies), selectinload(Election.candidates))
+        .where(Election.id == election_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
 @router.post("", response_model=ElectionResponse, status_code=status.HTTP_201_CREATED)
 async def create_election(
     election_data: ElectionCreate,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(require_role(AdminRole.ELECTION_ADMINISTRATOR, AdminRole.SUPER_ADMIN))
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Admin = Depends(_require_election_admin)
 ):
     """
     Create a new election (draft state)
@@ -110,7 +230,7 @@ async def create_election(
         )
 
         db.add(election)
-        db.flush()  # Get election.id before commit
+        await db.flush()  # Get election.id before commit
 
         # Log audit event
         log_audit(
@@ -122,8 +242,9 @@ async def create_election(
             {"name": election.name, "status": election.status}
         )
 
-        db.commit()
-        db.refresh(election)
+        await db.commit()
+        await cache_delete(dashboard_stats_key())
+        election = await _get_election_with_children(db, election.id)
 
         logger.info(
             "election_created",
@@ -132,10 +253,10 @@ async def create_election(
             admin_id=str(current_admin.id)
         )
 
-        return election
+        return ORJSONResponse(ElectionResponse.model_validate(election).model_dump(), status_code=status.HTTP_201_CREATED)
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error("election_creation_failed", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -147,8 +268,8 @@ async def create_election(
 async def update_election(
     election_id: UUID,
     election_data: ElectionUpdate,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(require_role(AdminRole.ELECTION_ADMINISTRATOR, AdminRole.SUPER_ADMIN))
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Admin = Depends(_require_election_admin)
 ):
     """
     Update an existing election
@@ -157,7 +278,7 @@ async def update_election(
     """
     try:
         # Find the election
-        election = db.query(Election).filter(Election.id == election_id).first()
+        election = await _get_election_with_children(db, election_id)
 
         if not election:
             raise HTTPException(
@@ -166,7 +287,7 @@ async def update_election(
             )
 
         # Only allow updates for draft or configured elections
-        if election.status not in [ElectionStatus.DRAFT.value, ElectionStatus.CONFIGURED.value]:
+        if election.status not in _EDITABLE_STATES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Cannot update election in {election.status} state"
@@ -174,6 +295,8 @@ async def update_election(
 
         # Update fields if provided
         update_data = election_data.model_dump(exclude_unset=True)
+        if update_data.get("status") is not None:
+            update_data["status"] = update_data["status"].value
         for field, value in update_data.items():
             setattr(election, field, value)
 
@@ -187,8 +310,9 @@ async def update_election(
             {"updated_fields": list(update_data.keys())}
         )
 
-        db.commit()
-        db.refresh(election)
+        await db.commit()
+        await cache_delete(election_key(election_id))
+        election = await _get_election_with_children(db, election.id)
 
         logger.info(
             "election_updated",
@@ -197,12 +321,12 @@ async def update_election(
             admin_id=str(current_admin.id)
         )
 
-        return election
+        return ORJSONResponse(ElectionResponse.model_validate(election).model_dump())
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error("election_update_failed", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -215,32 +339,56 @@ async def list_elections(
     status_filter: Optional[ElectionStatus] = Query(None, alias="status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db),
+    afterTs: Optional[datetime] = Query(None),
+    afterId: Optional[UUID] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
     current_admin: Admin = Depends(get_current_admin)
 ):
     """
     List elections with optional status filter and pagination
     Returns elections based on admin role and election status
+
+    Pages are OFFSET-based by default. When a page is full, the
+    X-Next-Cursor header carries afterTs/afterId query parameters for the
+    next page; passing them switches to keyset paging, which stays
+    O(limit) however deep the page, and skip is then ignored.
     """
     try:
         # Build query
-        query = db.query(Election)
+        query = select(Election).options(
+            load_only(*_ELECTION_RESPONSE_COLUMNS),
+            selectinload(Election.constituencies),
+            selectinload(Election.candidates),
+            raiseload("*")
+        )
 
         # Apply status filter if provided
         if status_filter:
-            query = query.filter(Election.status == status_filter)
+            query = query.where(Election.status == status_filter.value)
 
-        # Apply pagination
-        elections = query.order_by(Election.created_at.desc()).offset(skip).limit(limit).all()
+        # Apply pagination; id breaks ties between equal timestamps so keyset cursors are exact
+        query = query.order_by(Election.created_at.desc(), Election.id.desc()).limit(limit)
+        if afterTs is not None and afterId is not None:
+            # Keyset page: seek past the cursor in the index instead of scanning OFFSET rows
+            query = query.where(tuple_(Election.created_at, Election.id) < tuple_(afterTs, afterId))
+        else:
+            query = query.offset(skip)
 
-        logger.info(
+        elections = (await db.scalars(query)).all()
+
+        logger.debug(
             "elections_listed",
             count=len(elections),
-            status_filter=status_filter.value if status_filter else None,
-            admin_id=str(current_admin.id)
+            status_filter=status_filter,
+            admin_id=current_admin.id
         )
 
-        return elections
+        headers = None
+        if len(elections) == limit:
+            last = elections[-1]
+            headers = {"X-Next-Cursor": urlencode({"afterTs": last.created_at.isoformat(), "afterId": str(last.id)})}
+
+        return ORJSONResponse([ElectionResponse.model_validate(e).model_dump() for e in elections], headers=headers)
 
     except Exception as e:
         logger.error("election_list_failed", error=str(e))
@@ -253,7 +401,7 @@ async def list_elections(
 @router.get("/stats")
 async def get_dashboard_stats(
     current_admin: Admin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get dashboard statistics
@@ -264,38 +412,33 @@ async def get_dashboard_stats(
         - registered_voters: Total number of registered voters
         - total_votes: Total number of votes cast
     """
-    try:
-        from app.models.voter import Voter
-
-        # Count total elections
-        total_elections = db.query(func.count(Election.id)).scalar() or 0
+    cached = await cache_get(dashboard_stats_key())
+    if cached is not None:
+        return cached
 
-        # Count active elections
-        active_elections = db.query(func.count(Election.id)).filter(
-            Election.status == ElectionStatus.ACTIVE
-        ).scalar() or 0
-
-        # Count registered voters
-        registered_voters = db.query(func.count(Voter.id)).scalar() or 0
-
-        # Count total votes cast
-        total_votes = db.query(func.count(VoteSubmission.id)).scalar() or 0
+    try:
+        total_elections, active_elections, registered_voters, total_votes = (
+            await db.execute(_SQL_DASHBOARD_STATS)
+        ).one()
 
         logger.debug(
             "dashboard_stats_retrieved",
-            admin_id=str(current_admin.id),
+            admin_id=current_admin.id,
             total_elections=total_elections,
             active_elections=active_elections,
             registered_voters=registered_voters,
             total_votes=total_votes
         )
 
-        return {
+        stats = {
             "total_elections": total_elections,
             "active_elections": active_elections,
             "registered_voters": registered_voters,
             "total_votes": total_votes
         }
+        await cache_set(dashboard_stats_key(), stats, _DASHBOARD_STATS_TTL)
+
+        return stats
 
     except Exception as e:
         logger.error("dashboard_stats_failed", error=str(e))
@@ -308,7 +451,7 @@ async def get_dashboard_stats(
 @router.get("/{election_id}", response_model=ElectionResponse)
 async def get_election(
     election_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_admin: Admin = Depends(get_current_admin)
 ):
     """
@@ -317,9 +460,17 @@ async def get_election(
     - Constituencies
     - Candidates
     - Blockchain contract addresses
+
+    Served from Redis when cached; every mutation of the election or its
+    constituencies and candidates drops the entry.
     """
+    cache_key = election_key(election_id)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
     try:
-        election = db.query(Election).filter(Election.id == election_id).first()
+        election = await _get_election_with_children(db, election_id)
 
         if not election:
             raise HTTPException(
@@ -327,13 +478,16 @@ async def get_election(
                 detail="Election not found"
             )
 
-        logger.info(
+        logger.debug(
             "election_retrieved",
-            election_id=str(election_id),
-            admin_id=str(current_admin.id)
+            election_id=election_id,
+            admin_id=current_admin.id
         )
 
-        return election
+        response = ElectionResponse.model_validate(election).model_dump()
+        await cache_set(cache_key, response, _ELECTION_DETAIL_TTL)
+
+        return ORJSONResponse(response)
 
     except HTTPException:
         raise
@@ -349,8 +503,8 @@ async def get_election(
 async def add_constituency(
     election_id: UUID,
     constituency_data: ConstituencyCreate,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(require_role(AdminRole.ELECTION_ADMINISTRATOR, AdminRole.SUPER_ADMIN))
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Admin = Depends(_require_election_admin)
 ):
     """
     Add constituency to election
@@ -358,7 +512,7 @@ async def add_constituency(
     """
     try:
         # Verify election exists and is in correct state
-        election = db.query(Election).filter(Election.id == election_id).first()
+        election = await db.get(Election, election_id)
 
         if not election:
             raise HTTPException(
@@ -366,47 +520,41 @@ async def add_constituency(
                 detail="Election not found"
             )
 
-        if election.status not in [ElectionStatus.DRAFT.value, ElectionStatus.CONFIGURED.value]:
+        if election.status not in _EDITABLE_STATES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Cannot add constituency to election in {election.status} state"
             )
 
-        # Check for duplicate constituency code
-        existing = db.query(Constituency).filter(
-            and_(
-                Constituency.election_id == election_id,
-                Constituency.code == constituency_data.code
-            )
-        ).first()
-
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Constituency with this code already exists in this election"
-            )
-
         # Auto-generate on_chain_id if not provided
         if constituency_data.on_chain_id is None:
-            # Get the max on_chain_id for this election and increment
-            max_on_chain_id = db.query(func.max(Constituency.on_chain_id)).filter(
-                Constituency.election_id == election_id
-            ).scalar()
-            next_on_chain_id = (max_on_chain_id or -1) + 1
+            next_on_chain_id = await _next_on_chain_id(db, Constituency, election_id)
         else:
             next_on_chain_id = constituency_data.on_chain_id
 
-        # Create constituency
-        constituency = Constituency(
-            election_id=election_id,
-            name=constituency_data.name,
-            code=constituency_data.code,
-            on_chain_id=next_on_chain_id
-        )
+        # Create constituency; the unique constraints on (election_id, code)
+        # and (election_id, on_chain_id) reject duplicates in the same statement.
+        # A Core insert returns a plain row, with no ORM instance to track.
+        constituency = (await db.execute(
+            pg_insert(Constituency.__table__)
+            .values(
+                election_id=election_id,
+                name=constituency_data.name,
+                code=constituency_data.code,
+                on_chain_id=next_on_chain_id
+            )
+            .on_conflict_do_nothing()
+            .returning(*Constituency.__table__.c)
+        )).first()
+
+        if constituency is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Constituency with this code or on_chain_id already exists in this election"
+            )
 
-        db.add(constituency)
-        db.commit()
-        db.refresh(constituency)
+        await db.commit()
+        await cache_delete(election_key(election_id))
 
         logger.info(
             "constituency_added",
@@ -415,12 +563,12 @@ async def add_constituency(
             code=constituency.code
         )
 
-        return constituency
+        return ORJSONResponse(ConstituencyResponse.model_validate(constituency).model_dump(), status_code=status.HTTP_201_CREATED)
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error("constituency_addition_failed", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -432,8 +580,8 @@ async def add_constituency(
 async def add_candidate(
     election_id: UUID,
     candidate_data: CandidateCreate,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(require_role(AdminRole.ELECTION_ADMINISTRATOR, AdminRole.SUPER_ADMIN))
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Admin = Depends(_require_election_admin)
 ):
     """
     Add candidate to election
@@ -442,7 +590,7 @@ async def add_candidate(
     """
     try:
         # Verify election exists and is in correct state
-        election = db.query(Election).filter(Election.id == election_id).first()
+        election = await db.get(Election, election_id)
 
         if not election:
             raise HTTPException(
@@ -450,19 +598,21 @@ async def add_candidate(
                 detail="Election not found"
             )
 
-        if election.status not in [ElectionStatus.DRAFT.value, ElectionStatus.CONFIGURED.value]:
+        if election.status not in _EDITABLE_STATES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Cannot add candidate to election in {election.status} state"
             )
 
         # Verify constituency exists and belongs to this election
-        constituency = db.query(Constituency).filter(
-            and_(
-                Constituency.id == candidate_data.constituency_id,
-                Constituency.election_id == election_id
+        constituency = await db.scalar(
+            select(Constituency).where(
+                and_(
+                    Constituency.id == candidate_data.constituency_id,
+                    Constituency.election_id == election_id
+                )
             )
-        ).first()
+        )
 
         if not constituency:
             raise HTTPException(
@@ -472,47 +622,42 @@ async def add_candidate(
 
         # Auto-generate on_chain_id if not provided
         if candidate_data.on_chain_id is None:
-            # Get the max on_chain_id for this election and increment
-            max_on_chain_id = db.query(func.max(Candidate.on_chain_id)).filter(
-                Candidate.election_id == election_id
-            ).scalar()
-            next_on_chain_id = (max_on_chain_id or -1) + 1
+            next_on_chain_id = await _next_on_chain_id(db, Candidate, election_id)
         else:
             next_on_chain_id = candidate_data.on_chain_id
 
-        # Check for duplicate on_chain_id
-        existing = db.query(Candidate).filter(
-            and_(
-                Candidate.election_id == election_id,
-                Candidate.on_chain_id == next_on_chain_id
+        # Create candidate; the unique constraint on (election_id, on_chain_id)
+        # rejects a duplicate in the same statement. A Core insert returns a
+        # plain row, with no ORM instance to track.
+        candidate = (await db.execute(
+            pg_insert(Candidate.__table__)
+            .values(
+                election_id=election_id,
+                constituency_id=candidate_data.constituency_id,
+                name=candidate_data.name,
+                party=candidate_data.party,
+                bio=candidate_data.bio,
+                on_chain_id=next_on_chain_id,
+                created_by=current_admin.id
             )
-        ).first()
+            .on_conflict_do_nothing()
+            .returning(*Candidate.__table__.c)
+        )).first()
 
-        if existing:
+        if candidate is None:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Candidate with this on_chain_id already exists in this election"
             )
 
-        # Create candidate
-        candidate = Candidate(
-            election_id=election_id,
-            constituency_id=candidate_data.constituency_id,
-            name=candidate_data.name,
-            party=candidate_data.party,
-            bio=candidate_data.bio,
-            on_chain_id=next_on_chain_id,
-            created_by=current_admin.id
-        )
-
-        db.add(candidate)
-        db.flush()
-
-        # Register candidate on blockchain if blockchain is connected
+        # Register candidate on blockchain if blockchain is connected. This
+        # stays in the request so the registration is mined before the
+        # election can be started.
         if blockchain_service.connected:
             try:
-                tx_hash = blockchain_service.register_candidate(
-                    next_on_chain_id,
+                tx_hash = await asyncio.to_thread(
+                    blockchain_service.register_candidate,
+                    candidate.on_chain_id,
                     constituency.on_chain_id
                 )
 
@@ -537,7 +682,7 @@ async def add_candidate(
                     candidate_id=str(candidate.id),
                     error=str(be)
                 )
-                # Continue anyway - can register on blockchain later
+                # The candidate is still added; the failure is logged for follow-up
 
         # Log audit event
         log_audit(
@@ -553,8 +698,8 @@ async def add_candidate(
             }
         )
 
-        db.commit()
-        db.refresh(candidate)
+        await db.commit()
+        await cache_delete(election_key(election_id))
 
         logger.info(
             "candidate_added",
@@ -563,12 +708,12 @@ async def add_candidate(
             name=candidate.name
         )
 
-        return candidate
+        return ORJSONResponse(CandidateResponse.model_validate(candidate).model_dump(), status_code=status.HTTP_201_CREATED)
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error("candidate_addition_failed", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -579,8 +724,8 @@ async def add_candidate(
 @router.post("/{election_id}/start")
 async def start_election(
     election_id: UUID,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(require_role(AdminRole.ELECTION_ADMINISTRATOR, AdminRole.SUPER_ADMIN))
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Admin = Depends(_require_election_admin)
 ):
     """
     Start election - change status to active
@@ -589,7 +734,7 @@ async def start_election(
     """
     try:
         # Verify election exists and is in correct state
-        election = db.query(Election).filter(Election.id == election_id).first()
+        election = await db.get(Election, election_id)
 
         if not election:
             raise HTTPException(
@@ -598,16 +743,16 @@ async def start_election(
             )
 
         # Verify election is in configured state (or draft if no blockchain)
-        if election.status not in [ElectionStatus.DRAFT.value, ElectionStatus.CONFIGURED.value]:
+        if election.status not in _EDITABLE_STATES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Cannot start election in {election.status} state. Must be configured first."
             )
 
         # Verify election has constituencies and candidates
-        constituency_count = db.query(func.count(Constituency.id)).filter(
-            Constituency.election_id == election_id
-        ).scalar()
+        constituency_count = await db.scalar(
+            select(func.count(Constituency.id)).where(Constituency.election_id == election_id)
+        )
 
         if constituency_count == 0:
             raise HTTPException(
@@ -615,9 +760,9 @@ async def start_election(
                 detail="Cannot start election without constituencies"
             )
 
-        candidate_count = db.query(func.count(Candidate.id)).filter(
-            Candidate.election_id == election_id
-        ).scalar()
+        candidate_count = await db.scalar(
+            select(func.count(Candidate.id)).where(Candidate.election_id == election_id)
+        )
 
         if candidate_count == 0:
             raise HTTPException(
@@ -625,15 +770,18 @@ async def start_election(
                 detail="Cannot start election without candidates"
             )
 
+        now = datetime.now(timezone.utc)
+
         # Start election on blockchain
         tx_hash = None
         if blockchain_service.connected:
             try:
                 # Calculate timestamps
-                start_time = int(election.voting_start_at.timestamp()) if election.voting_start_at else int(datetime.utcnow().timestamp())
-                end_time = int(election.voting_end_at.timestamp()) if election.voting_end_at else int(datetime.utcnow().timestamp()) + 86400  # Default 24 hours
+                now_ts = int(now.timestamp())
+                start_time = int(election.voting_start_at.timestamp()) if election.voting_start_at else now_ts
+                end_time = int(election.voting_end_at.timestamp()) if election.voting_end_at else now_ts + 86400  # Default 24 hours
 
-                tx_hash = blockchain_service.start_election(start_time, end_time)
+                tx_hash = await asyncio.to_thread(blockchain_service.start_election, start_time, end_time)
 
                 # Log blockchain transaction
                 log_blockchain_tx(
@@ -660,7 +808,7 @@ async def start_election(
         # Update election status
         election.status = ElectionStatus.ACTIVE.value
         if not election.voting_start_at:
-            election.voting_start_at = datetime.utcnow()
+            election.voting_start_at = now
 
         # Log audit event
         log_audit(
@@ -672,7 +820,8 @@ async def start_election(
             {"tx_hash": tx_hash, "status": election.status}
         )
 
-        db.commit()
+        await db.commit()
+        await cache_delete(dashboard_stats_key(), election_key(election_id))
 
         logger.info(
             "election_started",
@@ -691,7 +840,7 @@ async def start_election(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error("election_start_failed", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -702,8 +851,8 @@ async def start_election(
 @router.post("/{election_id}/close")
 async def close_election(
     election_id: UUID,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(require_role(AdminRole.ELECTION_ADMINISTRATOR, AdminRole.SUPER_ADMIN))
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Admin = Depends(_require_election_admin)
 ):
     """
     Close election - change status to closed
@@ -712,7 +861,7 @@ async def close_election(
     """
     try:
         # Verify election exists and is in correct state
-        election = db.query(Election).filter(Election.id == election_id).first()
+        election = await db.get(Election, election_id)
 
         if not election:
             raise HTTPException(
@@ -730,7 +879,7 @@ async def close_election(
         tx_hash = None
         if blockchain_service.connected:
             try:
-                tx_hash = blockchain_service.close_election()
+                tx_hash = await asyncio.to_thread(blockchain_service.close_election)
 
                 # Log blockchain transaction
                 log_blockchain_tx(
@@ -757,7 +906,7 @@ async def close_election(
         # Update election status
         election.status = ElectionStatus.ENDED.value
         if not election.voting_end_at:
-            election.voting_end_at = datetime.utcnow()
+            election.voting_end_at = datetime.now(timezone.utc)
 
         # Log audit event
         log_audit(
@@ -769,7 +918,8 @@ async def close_election(
             {"tx_hash": tx_hash, "status": election.status}
         )
 
-        db.commit()
+        await db.commit()
+        await cache_delete(dashboard_stats_key(), election_key(election_id))
 
         logger.info(
             "election_closed",
@@ -788,7 +938,7 @@ async def close_election(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error("election_close_failed", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -799,8 +949,9 @@ async def close_election(
 @router.post("/{election_id}/finalize")
 async def finalize_election(
     election_id: UUID,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(require_role(AdminRole.ELECTION_ADMINISTRATOR, AdminRole.SUPER_ADMIN))
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Admin = Depends(_require_election_admin)
 ):
     """
     Finalize election results
@@ -808,11 +959,12 @@ async def finalize_election(
     - Detects ties (multiple candidates with max votes)
     - Stores results in database
     - Changes status to finalized
+    - Precomputes the results in the background once the response is sent
     Election must be in ended/closed state
     """
     try:
         # Verify election exists and is in correct state
-        election = db.query(Election).filter(Election.id == election_id).first()
+        election = await db.get(Election, election_id)
 
         if not election:
             raise HTTPException(
@@ -826,10 +978,12 @@ async def finalize_election(
                 detail=f"Cannot finalize election in {election.status} state. Must be closed first."
             )
 
-        # Get all constituencies for this election
-        constituencies = db.query(Constituency).filter(
-            Constituency.election_id == election_id
-        ).all()
+        # Get all constituencies for this election with their active candidates
+        constituencies = (await db.scalars(
+            select(Constituency)
+            .where(Constituency.election_id == election_id)
+            .options(selectinload(Constituency.candidates.and_(Candidate.is_active == True)))
+        )).all()
 
         if not constituencies:
             raise HTTPException(
@@ -837,20 +991,24 @@ async def finalize_election(
                 detail="No constituencies found for this election"
             )
 
+        # Votes cast per constituency, counted by the voter's constituency.
+        # Submissions are deliberately not linked to a candidate (the choice
+        # lives only on chain), so this is the expected total per constituency.
+        vote_counts = dict((await db.execute(
+            select(Voter.constituency_id, func.count(VoteSubmission.id))
+            .select_from(VoteSubmission)
+            .join(Voter, VoteSubmission.voter_id == Voter.id)
+            .where(VoteSubmission.election_id == election_id)
+            .group_by(Voter.constituency_id)
+        )).all())
+
         # Prepare data for blockchain finalization
         constituency_ids = [c.on_chain_id for c in constituencies]
         candidate_ids_per_constituency = []
         expected_votes_per_constituency = []
 
         for constituency in constituencies:
-            # Get all candidates for this constituency
-            candidates = db.query(Candidate).filter(
-                and_(
-                    Candidate.election_id == election_id,
-                    Candidate.constituency_id == constituency.id,
-                    Candidate.is_active == True
-                )
-            ).all()
+            candidates = constituency.candidates
 
             if not candidates:
                 raise HTTPException(
@@ -858,25 +1016,15 @@ async def finalize_election(
                     detail=f"No candidates found for constituency {constituency.name}"
                 )
 
-            candidate_ids = [c.on_chain_id for c in candidates]
-            candidate_ids_per_constituency.append(candidate_ids)
-
-            # Get vote count for this constituency from database
-            vote_count = db.query(func.count(VoteSubmission.id)).filter(
-                VoteSubmission.election_id == election_id
-            ).join(
-                Candidate, VoteSubmission.voter_id == Candidate.id  # This is simplified
-            ).filter(
-                Candidate.constituency_id == constituency.id
-            ).scalar() or 0
-
-            expected_votes_per_constituency.append(vote_count)
+            candidate_ids_per_constituency.append([c.on_chain_id for c in candidates])
+            expected_votes_per_constituency.append(vote_counts.get(constituency.id, 0))
 
         # Finalize election on blockchain
         tx_hash = None
         if blockchain_service.connected:
             try:
-                tx_hash = blockchain_service.finalize_election(
+                tx_hash = await asyncio.to_thread(
+                    blockchain_service.finalize_election,
                     constituency_ids,
                     candidate_ids_per_constituency,
                     expected_votes_per_constituency
@@ -907,7 +1055,7 @@ async def finalize_election(
         # Update election status
         election.status = ElectionStatus.FINALIZED.value
         election.finalized_by = current_admin.id
-        election.finalized_at = datetime.utcnow()
+        election.finalized_at = datetime.now(timezone.utc)
 
         # Log audit event
         log_audit(
@@ -919,7 +1067,10 @@ async def finalize_election(
             {"tx_hash": tx_hash, "status": election.status}
         )
 
-        db.commit()
+        await db.commit()
+        await cache_delete(election_key(election_id), election_results_key(election_id))
+        _results_local.pop(election_id, None)
+        background_tasks.add_task(_warm_election_results, election_id)
 
         logger.info(
             "election_finalized",
@@ -939,7 +1090,7 @@ async def finalize_election(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error("election_finalization_failed", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -947,10 +1098,191 @@ async def finalize_election(
         )
 
 
+async def _compute_election_results(db: AsyncSession, election: Election) -> Tuple[dict, bool]:
+    """
+    Build a finalized election's results from the database and blockchain
+
+    Args:
+        db: Database session
+        election: Finalized election
+
+    Returns:
+        Tuple of the results dict and whether it is complete (the blockchain
+        was reachable and every RPC succeeded)
+    """
+    # Get results from blockchain
+    results = {
+        "election_id": election.id,
+        "election_name": election.name,
+        "status": election.status,
+        "finalized_at": election.finalized_at,
+        "constituencies": []
+    }
+
+    # Get all constituencies with their active candidates and, in the same
+    # query, each one's registered voter count
+    rows = (await db.execute(_STMT_RESULT_CONSTITUENCIES, {"election_id": election.id})).all()
+    constituencies = [constituency for constituency, _ in rows]
+    total_registered = sum(count for _, count in rows)
+    candidates_per_constituency = [constituency.candidates for constituency in constituencies]
+
+    # Fetch every vote count and constituency result from the blockchain
+    # concurrently, so the RPC latency is paid once rather than per call.
+    # Without a node or tallier every read would fail, so none are attempted.
+    all_candidates = [c for candidates in candidates_per_constituency for c in candidates]
+    vote_counts = [0] * len(all_candidates)
+    bc_results = [None] * len(constituencies)
+    complete = blockchain_service.results_available
+    if complete:
+        fetched = await asyncio.gather(
+            *(asyncio.to_thread(blockchain_service.get_candidate_vote_count, c.on_chain_id) for c in all_candidates),
+            *(asyncio.to_thread(blockchain_service.get_constituency_result, c.on_chain_id) for c in constituencies),
+            return_exceptions=True
+        )
+        for i, (candidate, result) in enumerate(zip(all_candidates, fetched)):
+            if isinstance(result, BlockchainError):
+                complete = False
+                logger.warning(
+                    "candidate_vote_count_retrieval_failed",
+                    candidate_id=str(candidate.id),
+                    error=str(result)
+                )
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                vote_counts[i] = result
+        for i, (constituency, result) in enumerate(zip(constituencies, fetched[len(all_candidates):])):
+            if isinstance(result, BlockchainError):
+                complete = False
+                logger.warning(
+                    "constituency_result_retrieval_failed",
+                    constituency_id=str(constituency.id),
+                    error=str(result)
+                )
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                bc_results[i] = result
+
+    total_votes = 0
+    offset = 0
+
+    for constituency, candidates, bc_result in zip(constituencies, candidates_per_constituency, bc_results):
+        counts = vote_counts[offset:offset + len(candidates)]
+        offset += len(candidates)
+
+        candidates_data = [
+            {
+                "candidate_id": candidate.id,
+                "candidate_name": candidate.name,
+                "party": candidate.party,
+                "vote_count": vote_count
+            }
+            for candidate, vote_count in zip(candidates, counts)
+        ]
+
+        # Winner is the unique candidate with the most votes; a shared
+        # maximum is a tie. Nobody wins with zero votes.
+        max_votes = max(counts, default=0)
+        is_tied = max_votes > 0 and counts.count(max_votes) > 1
+        constituency_total = sum(counts)
+
+        constituency_result = {
+            "constituency_id": constituency.id,
+            "constituency_name": constituency.name,
+            "constituency_code": constituency.code,
+            "candidates": candidates_data,
+            "winner": candidates_data[counts.index(max_votes)] if max_votes > 0 and not is_tied else None,
+            "is_tied": is_tied,
+            "total_votes": constituency_total
+        }
+
+        total_votes += constituency_total
+
+        # Blockchain constituency result if available
+        if bc_result is not None:
+            constituency_result["blockchain_data"] = {
+                "winner_candidate_id": bc_result["winner_candidate_id"],
+                "winner_vote_count": bc_result["winner_vote_count"],
+                "is_tied": bc_result["is_tied"],
+                "total_votes": bc_result["total_votes"],
+                "finalized_at": bc_result["finalized_at"]
+            }
+
+        results["constituencies"].append(constituency_result)
+
+    # Add overall statistics
+    results["total_votes_cast"] = total_votes
+    results["total_constituencies"] = len(constituencies)
+
+    results["total_registered_voters"] = total_registered
+    results["turnout_percentage"] = (total_votes / total_registered * 100) if total_registered > 0 else 0
+
+    return results, complete
+
+
+async def _save_election_results(db: AsyncSession, election_id: UUID, results: dict) -> None:
+    """
+    Persist complete results so later reads are a single indexed lookup
+
+    Best effort: the results are already computed, so a failed write is
+    logged and the next request simply computes them again.
+
+    Args:
+        db: Database session
+        election_id: Election identifier
+        results: Complete results as built by _compute_election_results
+    """
+    try:
+        await db.execute(
+            pg_insert(ElectionResult.__table__)
+            .values(election_id=election_id, payload=results)
+            .on_conflict_do_nothing()
+        )
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        logger.warning("election_results_persist_failed", election_id=str(election_id), error=str(e))
+
+
+async def _warm_election_results(election_id: UUID) -> None:
+    """
+    Compute and store a just-finalized election's results
+
+    Runs as a background task after finalization, so the one read per
+    candidate from the blockchain is paid once here rather than by the
+    first results request. Incomplete results are not stored; the results
+    endpoint then computes them on demand as before.
+
+    Args:
+        election_id: Election identifier
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            election = await db.get(Election, election_id)
+            if election is None or election.status != ElectionStatus.FINALIZED.value:
+                return
+
+            results, complete = await _compute_election_results(db, election)
+            if not complete:
+                logger.warning("election_results_warm_incomplete", election_id=str(election_id))
+                return
+
+            await _save_election_results(db, election_id, results)
+    except Exception as e:
+        logger.error("election_results_warm_failed", election_id=str(election_id), error=str(e))
+        return
+
+    await cache_set(election_results_key(election_id), results, _RESULTS_TTL)
+    _store_results_local(election_id, results)
+
+    logger.info("election_results_warmed", election_id=str(election_id))
+
+
 @router.get("/{election_id}/results")
 async def get_election_results(
     election_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_admin: Admin = Depends(get_current_admin)
 ):
     """
@@ -961,10 +1293,24 @@ async def get_election_results(
     - Tie information
     - Overall turnout
     Only available if election is finalized
+
+    Finalized results never change, so complete results (every RPC
+    succeeded) are stored in election_results and kept in process and in
+    Redis; only the first complete request computes them live.
     """
+    results = _results_local.get(election_id)
+    if results is not None:
+        return ORJSONResponse(results)
+
+    cache_key = election_results_key(election_id)
+    results = await cache_get(cache_key)
+    if results is not None:
+        _store_results_local(election_id, results)
+        return ORJSONResponse(results)
+
     try:
         # Verify election exists and is finalized
-        election = db.query(Election).filter(Election.id == election_id).first()
+        election = await db.get(Election, election_id)
 
         if not election:
             raise HTTPException(
@@ -978,121 +1324,27 @@ async def get_election_results(
                 detail=f"Results not available. Election status is {election.status}. Must be finalized."
             )
 
-        # Get results from blockchain
-        results = {
-            "election_id": str(election_id),
-            "election_name": election.name,
-            "status": election.status,
-            "finalized_at": election.finalized_at.isoformat() if election.finalized_at else None,
-            "constituencies": []
-        }
-
-        # Get all constituencies
-        constituencies = db.query(Constituency).filter(
-            Constituency.election_id == election_id
-        ).all()
-
-        total_votes = 0
+        # Persisted at first complete computation; results never change after finalization
+        stored = await db.scalar(_STMT_STORED_RESULTS, {"election_id": election_id})
+        if stored is not None:
+            await cache_set(cache_key, stored, _RESULTS_TTL)
+            _store_results_local(election_id, stored)
+            return ORJSONResponse(stored)
 
-        for constituency in constituencies:
-            constituency_result = {
-                "constituency_id": str(constituency.id),
-                "constituency_name": constituency.name,
-                "constituency_code": constituency.code,
-                "candidates": [],
-                "winner": None,
-                "is_tied": False,
-                "total_votes": 0
-            }
+        results, complete = await _compute_election_results(db, election)
 
-            # Get candidates for this constituency
-            candidates = db.query(Candidate).filter(
-                and_(
-                    Candidate.election_id == election_id,
-                    Candidate.constituency_id == constituency.id,
-                    Candidate.is_active == True
-                )
-            ).all()
-
-            max_votes = 0
-            winner_candidate = None
-
-            for candidate in candidates:
-                # Get vote count from blockchain
-                vote_count = 0
-                if blockchain_service.connected:
-                    try:
-                        vote_count = blockchain_service.get_candidate_vote_count(candidate.on_chain_id)
-                    except BlockchainError as be:
-                        logger.warning(
-                            "candidate_vote_count_retrieval_failed",
-                            candidate_id=str(candidate.id),
-                            error=str(be)
-                        )
-
-                candidate_data = {
-                    "candidate_id": str(candidate.id),
-                    "candidate_name": candidate.name,
-                    "party": candidate.party,
-                    "vote_count": vote_count
-                }
-
-                constituency_result["candidates"].append(candidate_data)
-                constituency_result["total_votes"] += vote_count
-
-                # Track winner
-                if vote_count > max_votes:
-                    max_votes = vote_count
-                    winner_candidate = candidate_data
-                elif vote_count == max_votes and max_votes > 0:
-                    # Tie detected
-                    constituency_result["is_tied"] = True
-
-            total_votes += constituency_result["total_votes"]
-
-            # Set winner if no tie
-            if winner_candidate and not constituency_result["is_tied"]:
-                constituency_result["winner"] = winner_candidate
-
-            # Get blockchain constituency result if available
-            if blockchain_service.connected:
-                try:
-                    bc_result = blockchain_service.get_constituency_result(constituency.on_chain_id)
-                    constituency_result["blockchain_data"] = {
-                        "winner_candidate_id": bc_result["winner_candidate_id"],
-                        "winner_vote_count": bc_result["winner_vote_count"],
-                        "is_tied": bc_result["is_tied"],
-                        "total_votes": bc_result["total_votes"],
-                        "finalized_at": bc_result["finalized_at"]
-                    }
-                except BlockchainError as be:
-                    logger.warning(
-                        "constituency_result_retrieval_failed",
-                        constituency_id=str(constituency.id),
-                        error=str(be)
-                    )
-
-            results["constituencies"].append(constituency_result)
-
-        # Add overall statistics
-        results["total_votes_cast"] = total_votes
-        results["total_constituencies"] = len(constituencies)
-
-        # Get voter statistics
-        total_registered = db.query(func.count(Constituency.id)).join(
-            Election
-        ).filter(Election.id == election_id).scalar() or 0
-
-        results["total_registered_voters"] = total_registered
-        results["turnout_percentage"] = (total_votes / total_registered * 100) if total_registered > 0 else 0
-
-        logger.info(
+        logger.debug(
             "election_results_retrieved",
-            election_id=str(election_id),
-            admin_id=str(current_admin.id)
+            election_id=election_id,
+            admin_id=current_admin.id
         )
 
-        return results
+        if complete:
+            await _save_election_results(db, election_id, results)
+            await cache_set(cache_key, results, _RESULTS_TTL)
+            _store_results_local(election_id, results)
+
+        return ORJSONResponse(results)
 
     except HTTPException:
         raise
@@ -1104,97 +1356,191 @@ async def get_election_results(
         )
 
 
+def _audit_trail_section(stmt, ts_col, id_col, render) -> tuple:
+    """
+    Prebuild the statements for one list in an election's audit trail
+
+    Args:
+        stmt: Rows of the list, filtered by the election_id parameter
+        ts_col: Timestamp column the list is ordered by
+        id_col: Primary key column, breaking ties between equal timestamps
+        render: Maps a row to its response dict
+
+    Returns:
+        tuple: First page statement, keyset page statement (after_ts and
+        after_id parameters), total count subquery, timestamp attribute
+        name and renderer
+    """
+    page = stmt.order_by(ts_col, id_col).limit(bindparam("limit", type_=Integer))
+    return (
+        page,
+        page.where(
+            tuple_(ts_col, id_col) > tuple_(bindparam("after_ts", type_=ts_col.type), bindparam("after_id", type_=id_col.type))
+        ),
+        select(func.count()).select_from(stmt.subquery()).scalar_subquery(),
+        ts_col.key,
+        render
+    )
+
+
+# Each query selects only the rendered columns (raw_event JSONB and the
+# voter/session ids stay in the database). UUIDs, datetimes and enums are
+# left to orjson, which encodes them natively.
+_AUDIT_TRAIL_SECTIONS = {
+    "blockchain_transactions": _audit_trail_section(
+        select(
+            BlockchainTransaction.id,
+            BlockchainTransaction.tx_type,
+            BlockchainTransaction.tx_hash,
+            BlockchainTransaction.block_number,
+            BlockchainTransaction.from_address,
+            BlockchainTransaction.to_address,
+            BlockchainTransaction.gas_used,
+            BlockchainTransaction.status,
+            BlockchainTransaction.recorded_at
+        ).where(BlockchainTransaction.election_id == bindparam("election_id")),
+        BlockchainTransaction.recorded_at,
+        BlockchainTransaction.id,
+        lambda tx: {
+            "id": tx.id,
+            "tx_type": tx.tx_type,
+            "tx_hash": tx.tx_hash,
+            "block_number": tx.block_number,
+            "from_address": tx.from_address,
+            "to_address": tx.to_address,
+            "gas_used": tx.gas_used,
+            "status": tx.status,
+            "recorded_at": tx.recorded_at
+        }
+    ),
+    "audit_logs": _audit_trail_section(
+        select(
+            AuditLog.id,
+            AuditLog.admin_id,
+            AuditLog.action,
+            AuditLog.details,
+            AuditLog.occurred_at
+        ).where(
+            and_(
+                AuditLog.target_table == "elections",
+                AuditLog.target_id == bindparam("election_id")
+            )
+        ),
+        AuditLog.occurred_at,
+        AuditLog.id,
+        lambda log: {
+            "id": log.id,
+            "admin_id": log.admin_id,
+            "action": log.action,
+            "details": log.details,
+            "occurred_at": log.occurred_at
+        }
+    ),
+    "vote_submissions": _audit_trail_section(
+        select(
+            VoteSubmission.id,
+            VoteSubmission.tx_hash,
+            VoteSubmission.block_number,
+            VoteSubmission.submitted_at
+        ).where(VoteSubmission.election_id == bindparam("election_id")),
+        VoteSubmission.submitted_at,
+        VoteSubmission.id,
+        lambda vote: {
+            "id": vote.id,
+            "tx_hash": vote.tx_hash,
+            "block_number": vote.block_number,
+            "submitted_at": vote.submitted_at
+        }
+    )
+}
+
+# All three totals in one round trip
+_STMT_AUDIT_TRAIL_TOTALS = select(*(section[2] for section in _AUDIT_TRAIL_SECTIONS.values()))
+
+
 @router.get("/{election_id}/audit")
 async def get_election_audit_trail(
     election_id: UUID,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(require_role(AdminRole.ELECTION_ADMINISTRATOR, AdminRole.SUPER_ADMIN, AdminRole.AUDITOR))
+    section: Optional[Literal["blockchain_transactions", "audit_logs", "vote_submissions"]] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    afterTs: Optional[datetime] = Query(None),
+    afterId: Optional[UUID] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Admin = Depends(_require_election_auditor)
 ):
     """
     Get audit trail for election
     Returns blockchain transaction log and vote timestamps
     Admin only (election_administrator, super_admin, or auditor)
+
+    Each list is paged oldest first, at most limit rows. next_cursors holds
+    afterTs/afterId for a list's next page (null when it is exhausted);
+    pass them together with section to page through that list alone.
     """
+    # A cursor belongs to one list and needs both halves
+    if (afterTs is None) != (afterId is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="afterTs and afterId must be given together"
+        )
+    keyset = afterTs is not None
+    if keyset and section is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="A cursor requires section, the list it was issued for"
+        )
+
     try:
         # Verify election exists
-        election = db.query(Election).filter(Election.id == election_id).first()
+        election_name = await db.scalar(select(Election.name).where(Election.id == election_id))
 
-        if not election:
+        if election_name is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Election not found"
             )
 
-        # Get blockchain transactions for this election
-        blockchain_txns = db.query(BlockchainTransaction).filter(
-            BlockchainTransaction.election_id == election_id
-        ).order_by(BlockchainTransaction.recorded_at).all()
+        sections = _AUDIT_TRAIL_SECTIONS
+        if section is not None:
+            sections = {section: sections[section]}
 
-        # Get audit logs related to this election
-        audit_logs = db.query(AuditLog).filter(
-            and_(
-                AuditLog.target_table == "elections",
-                AuditLog.target_id == election_id
-            )
-        ).order_by(AuditLog.occurred_at).all()
+        # One extra row shows whether another page exists
+        params = {"election_id": election_id, "limit": limit + 1}
+        if keyset:
+            params.update(after_ts=afterTs, after_id=afterId)
 
-        # Get vote submission timestamps
-        vote_submissions = db.query(VoteSubmission).filter(
-            VoteSubmission.election_id == election_id
-        ).order_by(VoteSubmission.submitted_at).all()
+        audit_trail = {}
+        next_cursors = {}
+        for key, (first_page, next_page, _, ts_key, render) in sections.items():
+            # Each list has a prebuilt first-page and after-cursor statement
+            rows = (await db.execute(next_page if keyset else first_page, params)).all()
+            has_more = len(rows) > limit
+            rows = rows[:limit]
 
-        result = {
-            "election_id": str(election_id),
-            "election_name": election.name,
-            "audit_trail": {
-                "blockchain_transactions": [
-                    {
-                        "id": str(tx.id),
-                        "tx_type": tx.tx_type.value,
-                        "tx_hash": tx.tx_hash,
-                        "block_number": tx.block_number,
-                        "from_address": tx.from_address,
-                        "to_address": tx.to_address,
-                        "gas_used": tx.gas_used,
-                        "status": tx.status,
-                        "recorded_at": tx.recorded_at.isoformat()
-                    }
-                    for tx in blockchain_txns
-                ],
-                "audit_logs": [
-                    {
-                        "id": str(log.id),
-                        "admin_id": str(log.admin_id) if log.admin_id else None,
-                        "action": log.action.value,
-                        "details": log.details,
-                        "occurred_at": log.occurred_at.isoformat()
-                    }
-                    for log in audit_logs
-                ],
-                "vote_submissions": [
-                    {
-                        "id": str(vote.id),
-                        "tx_hash": vote.tx_hash,
-                        "block_number": vote.block_number,
-                        "submitted_at": vote.submitted_at.isoformat()
-                    }
-                    for vote in vote_submissions
-                ]
-            },
-            "statistics": {
-                "total_blockchain_transactions": len(blockchain_txns),
-                "total_audit_events": len(audit_logs),
-                "total_votes_submitted": len(vote_submissions)
-            }
-        }
+            audit_trail[key] = [render(row) for row in rows]
+            next_cursors[key] = None
+            if has_more:
+                next_cursors[key] = {"afterTs": getattr(rows[-1], ts_key).isoformat(), "afterId": str(rows[-1].id)}
 
-        logger.info(
+        totals = (await db.execute(_STMT_AUDIT_TRAIL_TOTALS, {"election_id": election_id})).one()
+
+        logger.debug(
             "election_audit_trail_retrieved",
-            election_id=str(election_id),
-            admin_id=str(current_admin.id)
+            election_id=election_id,
+            admin_id=current_admin.id
         )
 
-        return result
+        return ORJSONResponse({
+            "election_id": election_id,
+            "election_name": election_name,
+            "audit_trail": audit_trail,
+            "next_cursors": next_cursors,
+            "statistics": {
+                "total_blockchain_transactions": totals[0],
+                "total_audit_events": totals[1],
+                "total_votes_submitted": totals[2]
+            }
+        })
 
     except HTTPException:
         raise
@@ -1204,4 +1550,3 @@ async def get_election_audit_trail(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve election audit trail: {str(e)}"
         )
-
@@ -7,8 +7,8 @@ from sqlalchemy import text
 from typing import List, Optional
 import structlog
 import base64
-import uuid
 
+from app.cache import voter_session_key, cache_delete
 from app.database import get_db
 from app.middleware.auth import get_current_admin, require_role
 from app.models.admin import AdminRole
@@ -16,17 +16,13 @@ from app.models.audit import AuditLog, LogAction
 from app.schemas.voter import VoterCreate, VoterResponse
 from app.services.crypto import hash_biometric, derive_blockchain_voter_id, generate_salt, encrypt_biometric
 from app.services.blockchain import blockchain_service, BlockchainError
-from app.services.biometric import FaceService, FingerprintService, FACE_AVAILABLE, FINGERPRINT_AVAILABLE
+from app.services.biometric import get_face_service, get_fingerprint_service
+from app.utils.uuid7 import uuid7
 
 logger = structlog.get_logger()
 
 router = APIRouter(prefix="/api/voters", tags=["Voters"])
 
-# Initialize biometric services
-face_service = FaceService() if FACE_AVAILABLE else None
-fingerprint_service = FingerprintService() if FINGERPRINT_AVAILABLE else None
-
-
 @router.post("/register", response_model=VoterResponse, status_code=status.HTTP_201_CREATED)
 async def register_voter(
     voter_data: VoterCreate,
@@ -106,6 +102,9 @@ async def register_voter(
         # Generate cryptographic salt for biometric hashing
         biometric_salt = generate_salt()
 
+        face_service = get_face_service()
+        fingerprint_service = get_fingerprint_service()
+
         # Process face biometric: extract embedding, hash, quantize, and encrypt
         if not face_service:
             raise HTTPException(
@@ -145,7 +144,7 @@ async def register_voter(
         blockchain_voter_id = derive_blockchain_voter_id(voter_data.voter_id)
 
         # Generate new voter UUID
-        voter_uuid = uuid.uuid4()
+        voter_uuid = uuid7()
 
         # Register voter on blockchain
         # Try to register on blockchain (optional for testing)
@@ -582,6 +581,7 @@ async def delete_voter(
             {"voter_id": voter_id}
         )
         db.commit()
+        await cache_delete(voter_session_key(voter_id))
 
         logger.info(
             "voter_soft_deleted",
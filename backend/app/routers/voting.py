@@ -7,18 +7,23 @@ from sqlalchemy import text
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from pydantic import BaseModel, Field
+import ipaddress
 import uuid
 import structlog
 
+from app.cache import voter_session_key, cache_delete
 from app.database import get_db
 from app.config import settings
 from app.models.voter import Voter, AuthAttempt, VoteSubmission, AuthMethod, AuthOutcome
 from app.models.election import Election, Candidate, ElectionStatus
 from app.models.audit import BlockchainTransaction, TxType
 from app.middleware.auth import create_voting_session_token, get_current_session
+from app.services.audit_queue import auth_attempt_queue
 from app.services.crypto import hash_biometric
-from app.services.biometric import FaceService, FingerprintService, BiometricAuthError, FACE_AVAILABLE, FINGERPRINT_AVAILABLE
+from app.services.biometric import BiometricAuthError, FINGERPRINT_AVAILABLE, get_face_service, get_fingerprint_service
 from app.services.blockchain import blockchain_service, BlockchainError
+from app.utils.hex import hex_to_bytes
+from app.utils.uuid7 import uuid7
 
 logger = structlog.get_logger()
 
@@ -43,11 +48,6 @@ class FingerprintAuthRequest(BaseModel):
 # In production, use Redis for distributed systems
 used_tokens: Dict[str, datetime] = {}
 
-# Initialize biometric services (only if available)
-face_service = FaceService() if (FaceService and FACE_AVAILABLE) else None
-fingerprint_service = FingerprintService() if (FingerprintService and FINGERPRINT_AVAILABLE) else None
-
-
 def clean_expired_tokens():
     """Remove expired tokens from used_tokens store"""
     now = datetime.utcnow()
@@ -64,38 +64,39 @@ def get_client_ip(request: Request) -> str:
 
 
 def log_auth_attempt(
-    db: Session,
-    voter_id: str,
+    voter_pk: Optional[Any],
     auth_method: AuthMethod,
     outcome: AuthOutcome,
     failure_reason: str = None,
     similarity_score: float = None,
     ip_address: str = None
 ) -> None:
-    """Log authentication attempt to database"""
+    """
+    Queue an authentication attempt for the batched log writer
+
+    Args:
+        voter_pk: Voter primary key (UUID or string), or None if the voter ID was not found
+        auth_method: Biometric method used
+        outcome: Attempt outcome
+        failure_reason: Why the attempt failed
+        similarity_score: Biometric similarity score
+        ip_address: Client IP address
+    """
+    # Validate here: one invalid INET value would fail the whole batch insert
     try:
-        db.execute(
-            text("""
-                INSERT INTO auth_attempts
-                (id, voter_id, auth_method, outcome, failure_reason, similarity_score, ip_address, attempted_at)
-                VALUES (:id,
-                        (SELECT id FROM voters WHERE voter_id = :voter_id),
-                        :auth_method, :outcome, :failure_reason, :similarity_score, :ip_address, NOW())
-            """),
-            {
-                "id": str(uuid.uuid4()),
-                "voter_id": voter_id,
-                "auth_method": auth_method.value,
-                "outcome": outcome.value,
-                "failure_reason": failure_reason,
-                "similarity_score": similarity_score,
-                "ip_address": ip_address
-            }
-        )
-        db.commit()
-    except Exception as e:
-        logger.error("failed_to_log_auth_attempt", error=str(e))
-        db.rollback()
+        ip_address = str(ipaddress.ip_address(ip_address)) if ip_address else None
+    except ValueError:
+        ip_address = None
+
+    auth_attempt_queue.enqueue({
+        "id": uuid7(),
+        "voter_id": uuid.UUID(str(voter_pk)) if voter_pk else None,
+        "auth_method": auth_method,
+        "outcome": outcome,
+        "failure_reason": failure_reason[:500] if failure_reason else None,
+        "similarity_score": float(similarity_score) if similarity_score is not None else None,
+        "ip_address": ip_address
+    })
 
 
 @router.post("/authenticate/face")
@@ -138,7 +139,7 @@ async def authenticate_with_face(
         voter = result.fetchone()
 
         if not voter:
-            log_auth_attempt(db, voter_id, AuthMethod.FACE, AuthOutcome.FAILURE,
+            log_auth_attempt(None, AuthMethod.FACE, AuthOutcome.FAILURE,
                            "Voter not found", ip_address=ip_address)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -147,7 +148,7 @@ async def authenticate_with_face(
 
         # Check if voter already voted
         if voter.has_voted:
-            log_auth_attempt(db, voter_id, AuthMethod.FACE, AuthOutcome.FAILURE,
+            log_auth_attempt(voter.id, AuthMethod.FACE, AuthOutcome.FAILURE,
                            "Already voted", ip_address=ip_address)
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -160,7 +161,7 @@ async def authenticate_with_face(
             lockout_duration = timedelta(minutes=settings.LOCKOUT_DURATION_MINUTES)
             if lockout_time and datetime.utcnow() < lockout_time + lockout_duration:
                 remaining = (lockout_time + lockout_duration - datetime.utcnow()).seconds // 60
-                log_auth_attempt(db, voter_id, AuthMethod.FACE, AuthOutcome.LOCKOUT,
+                log_auth_attempt(voter.id, AuthMethod.FACE, AuthOutcome.LOCKOUT,
                                f"Account locked for {remaining} more minutes", ip_address=ip_address)
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
@@ -173,6 +174,7 @@ async def authenticate_with_face(
                     {"voter_id": voter_id}
                 )
                 db.commit()
+                await cache_delete(voter_session_key(voter_id))
 
         # Check max auth attempts
         if voter.failed_auth_count >= settings.MAX_AUTH_ATTEMPTS:
@@ -182,20 +184,23 @@ async def authenticate_with_face(
                 {"voter_id": voter_id}
             )
             db.commit()
+            await cache_delete(voter_session_key(voter_id))
 
-            log_auth_attempt(db, voter_id, AuthMethod.FACE, AuthOutcome.LOCKOUT,
+            log_auth_attempt(voter.id, AuthMethod.FACE, AuthOutcome.LOCKOUT,
                            "Max attempts exceeded", ip_address=ip_address)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Maximum authentication attempts exceeded. Account locked for {settings.LOCKOUT_DURATION_MINUTES} minutes."
             )
 
+        face_service = get_face_service()
+
         # Decode and process live face image
         try:
             image_bytes = face_service.decode_image(face_image)
             live_embedding = face_service.get_embedding(image_bytes)
         except BiometricAuthError as e:
-            log_auth_attempt(db, voter_id, AuthMethod.FACE, AuthOutcome.FAILURE,
+            log_auth_attempt(voter.id, AuthMethod.FACE, AuthOutcome.FAILURE,
                            str(e), ip_address=ip_address)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -220,7 +225,7 @@ async def authenticate_with_face(
             db.commit()
 
             remaining_attempts = settings.MAX_AUTH_ATTEMPTS - new_count
-            log_auth_attempt(db, voter_id, AuthMethod.FACE, AuthOutcome.FAILURE,
+            log_auth_attempt(voter.id, AuthMethod.FACE, AuthOutcome.FAILURE,
                            f"Face not matched (similarity: {similarity_score:.4f})",
                            similarity_score, ip_address)
 
@@ -264,7 +269,7 @@ async def authenticate_with_face(
         )
 
         # Log successful authentication
-        log_auth_attempt(db, voter_id, AuthMethod.FACE, AuthOutcome.SUCCESS,
+        log_auth_attempt(voter.id, AuthMethod.FACE, AuthOutcome.SUCCESS,
                        None, similarity_score, ip_address)
 
         logger.info("face_authentication_success", voter_id=voter_id, similarity=similarity_score)
@@ -311,6 +316,7 @@ async def authenticate_with_fingerprint(
     voter_id = auth_request.voter_id
     fingerprint_data = auth_request.fingerprint_template
 
+    fingerprint_service = get_fingerprint_service()
     if not FINGERPRINT_AVAILABLE or not fingerprint_service:
         logger.error("fingerprint_service_unavailable")
         raise HTTPException(
@@ -337,7 +343,7 @@ async def authenticate_with_fingerprint(
         voter = result.fetchone()
 
         if not voter:
-            log_auth_attempt(db, voter_id, AuthMethod.FINGERPRINT, AuthOutcome.FAILURE,
+            log_auth_attempt(None, AuthMethod.FINGERPRINT, AuthOutcome.FAILURE,
                            "Voter not found", ip_address=ip_address)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -346,7 +352,7 @@ async def authenticate_with_fingerprint(
 
         # Check if voter already voted
         if voter.has_voted:
-            log_auth_attempt(db, voter_id, AuthMethod.FINGERPRINT, AuthOutcome.FAILURE,
+            log_auth_attempt(voter.id, AuthMethod.FINGERPRINT, AuthOutcome.FAILURE,
                            "Already voted", ip_address=ip_address)
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -359,7 +365,7 @@ async def authenticate_with_fingerprint(
             lockout_duration = timedelta(minutes=settings.LOCKOUT_DURATION_MINUTES)
             if lockout_time and datetime.utcnow() < lockout_time + lockout_duration:
                 remaining = (lockout_time + lockout_duration - datetime.utcnow()).seconds // 60
-                log_auth_attempt(db, voter_id, AuthMethod.FINGERPRINT, AuthOutcome.LOCKOUT,
+                log_auth_attempt(voter.id, AuthMethod.FINGERPRINT, AuthOutcome.LOCKOUT,
                                f"Account locked for {remaining} more minutes", ip_address=ip_address)
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
@@ -372,6 +378,7 @@ async def authenticate_with_fingerprint(
                     {"voter_id": voter_id}
                 )
                 db.commit()
+                await cache_delete(voter_session_key(voter_id))
 
         # Check max auth attempts
         if voter.failed_auth_count >= settings.MAX_AUTH_ATTEMPTS:
@@ -381,8 +388,9 @@ async def authenticate_with_fingerprint(
                 {"voter_id": voter_id}
             )
             db.commit()
+            await cache_delete(voter_session_key(voter_id))
 
-            log_auth_attempt(db, voter_id, AuthMethod.FINGERPRINT, AuthOutcome.LOCKOUT,
+            log_auth_attempt(voter.id, AuthMethod.FINGERPRINT, AuthOutcome.LOCKOUT,
                            "Max attempts exceeded", ip_address=ip_address)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -394,7 +402,7 @@ async def authenticate_with_fingerprint(
             fingerprint_bytes = fingerprint_service.decode_image(fingerprint_data)
             live_template = fingerprint_service.process_fingerprint(fingerprint_bytes)
         except BiometricAuthError as e:
-            log_auth_attempt(db, voter_id, AuthMethod.FINGERPRINT, AuthOutcome.FAILURE,
+            log_auth_attempt(voter.id, AuthMethod.FINGERPRINT, AuthOutcome.FAILURE,
                            str(e), ip_address=ip_address)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -419,7 +427,7 @@ async def authenticate_with_fingerprint(
             db.commit()
 
             remaining_attempts = settings.MAX_AUTH_ATTEMPTS - new_count
-            log_auth_attempt(db, voter_id, AuthMethod.FINGERPRINT, AuthOutcome.FAILURE,
+            log_auth_attempt(voter.id, AuthMethod.FINGERPRINT, AuthOutcome.FAILURE,
                            f"Fingerprint not matched (similarity: {similarity_score:.4f})",
                            similarity_score, ip_address)
 
@@ -463,7 +471,7 @@ async def authenticate_with_fingerprint(
         )
 
         # Log successful authentication
-        log_auth_attempt(db, voter_id, AuthMethod.FINGERPRINT, AuthOutcome.SUCCESS,
+        log_auth_attempt(voter.id, AuthMethod.FINGERPRINT, AuthOutcome.SUCCESS,
                        None, similarity_score, ip_address)
 
         logger.info("fingerprint_authentication_success", voter_id=voter_id, similarity=similarity_score)
@@ -713,11 +721,11 @@ async def cast_vote(
                 VALUES (:id, :voter_id, :election_id, :session_id, :tx_hash, :block_number, :gas_used, NOW())
             """),
             {
-                "id": str(uuid.uuid4()),
+                "id": str(uuid7()),
                 "voter_id": voter.id,
                 "election_id": election_id,
                 "session_id": session_id,
-                "tx_hash": tx_hash,
+                "tx_hash": hex_to_bytes(tx_hash),
                 "block_number": block_number,
                 "gas_used": gas_used
             }
@@ -753,6 +761,7 @@ async def cast_vote(
         db.add(blockchain_tx)
 
         db.commit()
+        await cache_delete(voter_session_key(voter_id))
 
         # Mark token as used
         used_tokens[session_id] = datetime.utcnow() + timedelta(minutes=10)
@@ -793,17 +802,25 @@ async def verify_vote(
     Returns:
         Vote verification details
     """
+    try:
+        tx_hash_bytes = hex_to_bytes(tx_hash)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Vote transaction not found."
+        )
+
     try:
         # Check if transaction exists in database
         result = db.execute(
             text("""
-                SELECT vs.tx_hash, vs.block_number, vs.submitted_at, vs.gas_used,
+                SELECT '0x' || encode(vs.tx_hash, 'hex') AS tx_hash, vs.block_number, vs.submitted_at, vs.gas_used,
                        e.name as election_name, e.status as election_status
                 FROM vote_submissions vs
                 JOIN elections e ON vs.election_id = e.id
                 WHERE vs.tx_hash = :tx_hash
             """),
-            {"tx_hash": tx_hash}
+            {"tx_hash": tx_hash_bytes}
         )
         vote = result.fetchone()
 
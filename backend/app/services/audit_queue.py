@@ -0,0 +1,109 @@
+"""
+Batched writer for append-only log rows
+
+Authentication attempts are logged on every voter login. Instead of one
+INSERT and commit per attempt inside the request, rows are queued in memory
+and written by a background task in multi-row batches.
+"""
+from typing import Optional, Type
+import asyncio
+import structlog
+from sqlalchemy import insert
+
+from app.database import Base, async_engine
+from app.models.voter import AuthAttempt
+
+logger = structlog.get_logger()
+
+
+class AuditQueue:
+    """
+    Buffer rows for one table and insert them in batches
+
+    A batch is written when it reaches batch_size rows or flush_interval
+    seconds after its first row, whichever comes first.
+    """
+
+    def __init__(self, model: Type[Base], batch_size: int = 100, flush_interval: float = 0.05, maxsize: int = 10_000):
+        self.model = model
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background writer; call from the running event loop"""
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write everything still queued, then stop the background writer"""
+        if self._task is None:
+            return
+        # The sentinel queues behind pending rows, so they are all written first
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    def enqueue(self, row: dict) -> None:
+        """
+        Queue a row for insertion
+
+        Args:
+            row: Column values for one row of the model's table
+        """
+        if self._queue is None:
+            logger.error("audit_queue_not_started", table=self.model.__tablename__, row=row)
+            return
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            # Only reachable if the database has been down for a while; keep
+            # the row in the structured log rather than blocking the request
+            logger.error("audit_queue_full", table=self.model.__tablename__, row=row)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            row = await self._queue.get()
+            if row is None:
+                return
+            rows = [row]
+            deadline = loop.time() + self.flush_interval
+            while len(rows) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    await self._write(rows)
+                    return
+                rows.append(row)
+            await self._write(rows)
+
+    async def _write(self, rows: list) -> None:
+        if not rows:
+            return
+        stmt = insert(self.model)
+        try:
+            async with async_engine.begin() as conn:
+                await conn.execute(stmt, rows)
+            return
+        except Exception as e:
+            logger.error("audit_batch_insert_failed", table=self.model.__tablename__, rows=len(rows), error=str(e))
+
+        # Retry one by one so a single bad row does not lose the whole batch
+        for row in rows:
+            try:
+                async with async_engine.begin() as conn:
+                    await conn.execute(stmt, row)
+            except Exception as e:
+                logger.error("audit_row_insert_failed", table=self.model.__tablename__, row=row, error=str(e))
+
+
+auth_attempt_queue = AuditQueue(AuthAttempt)
@@ -1,6 +1,11 @@
 """
 Biometric authentication services
 """
+from functools import lru_cache
+from typing import Optional
+import structlog
+
+logger = structlog.get_logger()
 
 
 class BiometricAuthError(Exception):
@@ -23,10 +28,53 @@ except ImportError:
     FingerprintService = None
     FINGERPRINT_AVAILABLE = False
 
+
+@lru_cache(maxsize=1)
+def get_face_service() -> Optional["FaceService"]:
+    """
+    Shared FaceService, created on first use
+
+    Returns:
+        FaceService, or None if its dependencies are not installed
+    """
+    return FaceService() if FACE_AVAILABLE else None
+
+
+@lru_cache(maxsize=1)
+def get_fingerprint_service() -> Optional["FingerprintService"]:
+    """
+    Shared FingerprintService, created on first use
+
+    Returns:
+        FingerprintService, or None if its dependencies are not installed
+    """
+    return FingerprintService() if FINGERPRINT_AVAILABLE else None
+
+
+def warm_up_biometric_services() -> None:
+    """
+    Create the biometric services and load the face detector
+
+    Blocking; run in a worker thread at startup so the first
+    authentication request does not pay for loading the cascade.
+    """
+    try:
+        face_service = get_face_service()
+        if face_service is not None:
+            face_service._get_face_cascade()
+        get_fingerprint_service()
+        logger.info("biometric_services_warmed", face=FACE_AVAILABLE, fingerprint=FINGERPRINT_AVAILABLE)
+    except Exception as e:
+        logger.warning("biometric_warm_up_failed", error=str(e))
+
+
 __all__ = [
     "BiometricAuthError",
     "FaceService",
     "FingerprintService",
     "FACE_AVAILABLE",
     "FINGERPRINT_AVAILABLE",
+    "get_face_service",
+    "get_fingerprint_service",
+    "warm_up_biometric_services",
 ]
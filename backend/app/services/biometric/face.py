@@ -4,18 +4,25 @@ Face recognition service using OpenCV (lightweight alternative to DeepFace)
 NOTE: This is a simplified implementation for Python 3.14 compatibility.
 For production use with higher accuracy, use Python 3.11/3.12 with DeepFace+ArcFace.
 """
+from collections import OrderedDict
 import base64
-import io
+import hashlib
+import threading
 import numpy as np
-from PIL import Image
 import cv2
 import structlog
 
 from app.config import settings
+from app.services.biometric.kernels import cosine_similarity
 from app.services.crypto import hash_biometric, encrypt_biometric, decrypt_biometric, quantize_embedding, dequantize_embedding
 
 logger = structlog.get_logger()
 
+# Recent embeddings keyed by a digest of the image bytes, so a retried or
+# repeated upload of the same image skips detection and feature extraction.
+# Each entry is a 128x128 float32 vector (64 KiB).
+_EMBEDDING_CACHE_SIZE = 256
+
 
 class BiometricAuthError(Exception):
     """Custom exception for biometric authentication errors"""
@@ -34,6 +41,8 @@ class FaceService:
         self.threshold = settings.FACE_THRESHOLD
         self.model_name = "OpenCV-HOG"  # Simple but functional
         self._face_cascade = None
+        self._embedding_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
 
         logger.info("face_service_initialized", model="OpenCV-HOG",
                    note="Lightweight implementation for Python 3.14 compatibility")
@@ -48,6 +57,38 @@ class FaceService:
         return self._face_cascade
 
     def get_embedding(self, image_bytes: bytes) -> np.ndarray:
+        """
+        Extract face features from image, reusing the result for repeated images
+
+        Args:
+            image_bytes: Raw image bytes
+
+        Returns:
+            numpy.ndarray: Read-only face feature vector
+
+        Raises:
+            BiometricAuthError: If face detection or embedding fails
+        """
+        key = hashlib.blake2b(image_bytes, digest_size=16).digest()
+
+        with self._embedding_cache_lock:
+            embedding = self._embedding_cache.get(key)
+            if embedding is not None:
+                self._embedding_cache.move_to_end(key)
+                return embedding
+
+        embedding = self._extract_embedding(image_bytes)
+        # Shared between callers, so it must never be modified in place
+        embedding.flags.writeable = False
+
+        with self._embedding_cache_lock:
+            self._embedding_cache[key] = embedding
+            if len(self._embedding_cache) > _EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+
+        return embedding
+
+    def _extract_embedding(self, image_bytes: bytes) -> np.ndarray:
         """
         Extract face features from image using OpenCV
 
@@ -65,16 +106,14 @@ class FaceService:
             BiometricAuthError: If face detection or embedding fails
         """
         try:
-            # Convert bytes to PIL Image
-            image = Image.open(io.BytesIO(image_bytes))
-
-            # Convert to RGB if needed
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-
-            # Convert to numpy array and then to OpenCV format
-            img_array = np.array(image)
-            img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+            # Decode straight from the request buffer into an OpenCV image;
+            # EXIF orientation is ignored, as it was with PIL
+            img_bgr = cv2.imdecode(
+                np.frombuffer(image_bytes, dtype=np.uint8),
+                cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION
+            )
+            if img_bgr is None:
+                raise BiometricAuthError("Invalid image format")
 
             # Convert to grayscale for face detection
             gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
@@ -221,24 +260,7 @@ class FaceService:
         Returns:
             float: Cosine similarity score (0 to 1)
         """
-        # Ensure same shape
-        if a.shape != b.shape:
-            return 0.0
-
-        # Calculate cosine similarity
-        dot_product = np.dot(a, b)
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        similarity = dot_product / (norm_a * norm_b)
-
-        # Clamp to [0, 1] range
-        similarity = max(0.0, min(1.0, similarity))
-
-        return similarity
+        return cosine_similarity(a, b)
 
     def decode_image(self, base64_image: str) -> bytes:
         """
@@ -251,11 +273,12 @@ class FaceService:
             bytes: Decoded image bytes
         """
         try:
-            # Remove data URI prefix if present
-            if ',' in base64_image:
-                base64_image = base64_image.split(',')[1]
+            # Remove data URI prefix if present, without copying into a list
+            _, sep, payload = base64_image.partition(',')
+            if sep:
+                base64_image = payload
 
-            # Decode base64
+            # Decode base64 (str input is decoded directly, no ASCII encode)
             image_bytes = base64.b64decode(base64_image)
 
             return image_bytes
@@ -9,6 +9,7 @@ from PIL import Image
 import structlog
 
 from app.config import settings
+from app.services.biometric.kernels import cosine_similarity
 from app.services.crypto import hash_biometric, encrypt_biometric, decrypt_biometric, quantize_embedding, dequantize_embedding
 from app.services.biometric.face import BiometricAuthError
 
@@ -153,29 +154,14 @@ class FingerprintService:
         Calculate cosine similarity between two fingerprint embeddings
         Same approach as face recognition for consistency
         """
-        if a.shape != b.shape:
-            return 0.0
-
-        # Calculate cosine similarity
-        dot_product = np.dot(a, b)
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        similarity = dot_product / (norm_a * norm_b)
-
-        # Clamp to [0, 1] range
-        similarity = max(0.0, min(1.0, similarity))
-
-        return similarity
+        return cosine_similarity(a, b)
 
     def decode_image(self, base64_image: str) -> bytes:
         """Decode base64 fingerprint image to bytes"""
         try:
-            if ',' in base64_image:
-                base64_image = base64_image.split(',')[1]
+            _, sep, payload = base64_image.partition(',')
+            if sep:
+                base64_image = payload
 
             image_bytes = base64.b64decode(base64_image)
             return image_bytes
@@ -0,0 +1,37 @@
+"""
+Vector similarity kernels shared by the face and fingerprint services
+
+Embeddings are compared as contiguous float32 vectors so every reduction is
+a single BLAS dot product, with no per-call dtype promotion or copies.
+"""
+import numpy as np
+
+
+def _as_f32(a: np.ndarray) -> np.ndarray:
+    """View an array as contiguous float32, copying only if it is not already"""
+    return np.ascontiguousarray(a, dtype=np.float32)
+
+
+def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Cosine similarity between two embeddings, clamped to [0, 1]
+
+    Args:
+        a: First embedding
+        b: Second embedding
+
+    Returns:
+        float: Similarity score, or 0.0 for mismatched shapes or zero vectors
+    """
+    if a.shape != b.shape:
+        return 0.0
+
+    a = _as_f32(a).ravel()
+    b = _as_f32(b).ravel()
+
+    dot = float(np.dot(a, b))
+    norm_sq = float(np.dot(a, a)) * float(np.dot(b, b))
+    if norm_sq == 0.0:
+        return 0.0
+
+    return min(1.0, max(0.0, dot / np.sqrt(norm_sq)))
@@ -62,6 +62,11 @@ class BlockchainService:
             logger.warning("blockchain_initialization_failed", error=str(e),
                          message="Blockchain features will be disabled. Start Ganache to enable.")
 
+    @property
+    def results_available(self) -> bool:
+        """Whether result reads can reach the chain (connected and tallier loaded)"""
+        return self.connected and self.results_tallier is not None
+
     def _ensure_connected(self):
         """Raise error if blockchain is not connected"""
         if not self.connected:
@@ -15,11 +15,12 @@ from app.config import settings
 
 logger = structlog.get_logger()
 
-# Initialize Argon2id password hasher
+# Initialize Argon2id password hasher; defaults follow the OWASP baseline
+# (t=2, m=19 MiB, p=1). Verification reads the parameters from each hash.
 ph = PasswordHasher(
-    time_cost=3,
-    memory_cost=65536,
-    parallelism=4,
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
     hash_len=32,
     salt_len=16
 )
@@ -0,0 +1,7 @@
+"""
+Shared utilities
+"""
+from app.utils.hex import bytes_to_hex, hex_to_bytes
+from app.utils.uuid7 import uuid7, uuid7_datetime
+
+__all__ = ["bytes_to_hex", "hex_to_bytes", "uuid7", "uuid7_datetime"]
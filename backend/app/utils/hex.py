@@ -0,0 +1,34 @@
+"""
+Hex string <-> bytes conversion for BYTEA hash and address columns
+"""
+
+
+def hex_to_bytes(value: str) -> bytes:
+    """
+    Decode a hex string, with or without a 0x prefix
+
+    Args:
+        value: Hex string such as a transaction hash or address
+
+    Returns:
+        bytes: Decoded bytes
+
+    Raises:
+        ValueError: If the string is not valid hex
+    """
+    if value[:2] in ("0x", "0X"):
+        value = value[2:]
+    return bytes.fromhex(value)
+
+
+def bytes_to_hex(value: bytes) -> str:
+    """
+    Encode bytes as a lowercase 0x-prefixed hex string
+
+    Args:
+        value: Raw bytes (bytes or memoryview)
+
+    Returns:
+        str: 0x-prefixed hex string
+    """
+    return "0x" + bytes(value).hex()
@@ -0,0 +1,30 @@
+-- Migration: Store admins.role as the native admin_role enum
+-- Date: 2026-10-15
+-- Reason: Databases created through SQLAlchemy create_all have role as VARCHAR(50);
+--         the enum is smaller in the index and compares by its ordinal
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'admin_role') THEN
+        CREATE TYPE admin_role AS ENUM (
+            'super_admin',
+            'election_administrator',
+            'polling_officer',
+            'auditor'
+        );
+    END IF;
+END
+$$;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'admins' AND column_name = 'role' AND data_type = 'character varying'
+    ) THEN
+        ALTER TABLE admins ALTER COLUMN role DROP DEFAULT;
+        ALTER TABLE admins ALTER COLUMN role TYPE admin_role USING role::admin_role;
+        ALTER TABLE admins ALTER COLUMN role SET DEFAULT 'polling_officer';
+    END IF;
+END
+$$;
@@ -0,0 +1,11 @@
+-- Migration: Covering index for voting session checks
+-- Date: 2026-10-15
+-- Reason: get_current_session reads only has_voted and locked_out by voter_id;
+--         INCLUDE lets Postgres answer it with an index-only scan
+-- Note: CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_voters_voterid_covering
+    ON voters (voter_id) INCLUDE (has_voted, locked_out);
+
+-- The plain index duplicates the UNIQUE constraint's index
+DROP INDEX CONCURRENTLY IF EXISTS idx_voters_voter_id;
@@ -0,0 +1,31 @@
+-- Migration: Time-ordered UUIDv7 primary key defaults
+-- Date: 2026-10-15
+-- Reason: uuid_generate_v4() scatters inserts across the primary key B-tree;
+--         UUIDv7 keys are time-ordered so append-heavy tables insert at the tail.
+--         Existing ids are left untouched.
+
+CREATE EXTENSION IF NOT EXISTS "pgcrypto";
+
+CREATE OR REPLACE FUNCTION gen_uuid_v7() RETURNS UUID AS $$
+DECLARE
+    unix_ms BIGINT := (EXTRACT(EPOCH FROM clock_timestamp()) * 1000)::BIGINT;
+    bytes BYTEA := gen_random_bytes(16);
+BEGIN
+    -- 48-bit big-endian millisecond timestamp
+    bytes := overlay(bytes PLACING substring(int8send(unix_ms) FROM 3) FROM 1 FOR 6);
+    -- Version 7 and RFC 9562 variant bits
+    bytes := set_byte(bytes, 6, (get_byte(bytes, 6) & 15) | 112);
+    bytes := set_byte(bytes, 8, (get_byte(bytes, 8) & 63) | 128);
+    RETURN encode(bytes, 'hex')::UUID;
+END
+$$ LANGUAGE plpgsql VOLATILE;
+
+ALTER TABLE admins ALTER COLUMN id SET DEFAULT gen_uuid_v7();
+ALTER TABLE elections ALTER COLUMN id SET DEFAULT gen_uuid_v7();
+ALTER TABLE constituencies ALTER COLUMN id SET DEFAULT gen_uuid_v7();
+ALTER TABLE candidates ALTER COLUMN id SET DEFAULT gen_uuid_v7();
+ALTER TABLE voters ALTER COLUMN id SET DEFAULT gen_uuid_v7();
+ALTER TABLE auth_attempts ALTER COLUMN id SET DEFAULT gen_uuid_v7();
+ALTER TABLE vote_submissions ALTER COLUMN id SET DEFAULT gen_uuid_v7();
+ALTER TABLE audit_logs ALTER COLUMN id SET DEFAULT gen_uuid_v7();
+ALTER TABLE blockchain_txns ALTER COLUMN id SET DEFAULT gen_uuid_v7();
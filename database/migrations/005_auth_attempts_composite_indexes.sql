@@ -0,0 +1,15 @@
+-- Migration: Composite indexes for the authentication log view
+-- Date: 2026-10-15
+-- Reason: /api/audit/logs filters by outcome or voter and orders by attempted_at DESC;
+--         composite indexes return rows pre-sorted so LIMIT stops early.
+--         The single-column outcome and voter_id indexes become redundant prefixes.
+-- Note: CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_auth_attempts_outcome_attempted_at
+    ON auth_attempts (outcome, attempted_at DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_auth_attempts_voter_attempted_at
+    ON auth_attempts (voter_id, attempted_at DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_auth_attempts_outcome;
+DROP INDEX CONCURRENTLY IF EXISTS idx_auth_attempts_voter_id;
@@ -0,0 +1,165 @@
+-- Migration: Monthly range partitioning for auth_attempts and audit_logs
+-- Date: 2026-10-15
+-- Reason: Both tables are append-only and every audit query filters on their
+--         time column. Monthly partitions keep per-partition indexes small,
+--         let the planner prune to the months in range, and allow old months
+--         to be detached and archived instead of vacuumed.
+--         The partition key must be part of the primary key, so the PKs
+--         become (id, attempted_at) and (id, occurred_at).
+--         vote_submissions and blockchain_txns are intentionally not
+--         partitioned: UNIQUE (voter_id, election_id) and UNIQUE (tx_hash)
+--         cannot be enforced across partitions without adding the time column.
+-- Note: Rewrites both tables under an ACCESS EXCLUSIVE lock; run in a
+--       maintenance window. Schedule create_monthly_partitions() monthly
+--       (cron or pg_cron) so upcoming months exist before rows arrive.
+--       Databases created through SQLAlchemy create_all have audit_logs.action
+--       as VARCHAR and no log_action type; the type is created here and the
+--       copy casts, so the rebuilt table uses the enum either way.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION create_monthly_partitions(parent TEXT, from_month DATE, to_month DATE)
+RETURNS VOID AS $$
+DECLARE
+    month_start DATE := date_trunc('month', from_month)::DATE;
+BEGIN
+    WHILE month_start <= to_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_' || to_char(month_start, 'YYYYMM'),
+            parent,
+            month_start,
+            (month_start + INTERVAL '1 month')::DATE
+        );
+        month_start := (month_start + INTERVAL '1 month')::DATE;
+    END LOOP;
+END
+$$ LANGUAGE plpgsql;
+
+-- -----------------------------------------------------------------------------
+-- auth_attempts
+-- -----------------------------------------------------------------------------
+ALTER TABLE auth_attempts RENAME TO auth_attempts_legacy;
+ALTER TABLE auth_attempts_legacy RENAME CONSTRAINT auth_attempts_pkey TO auth_attempts_legacy_pkey;
+
+CREATE TABLE auth_attempts (
+    id UUID NOT NULL DEFAULT gen_uuid_v7(),
+    voter_id UUID REFERENCES voters(id) ON DELETE SET NULL,
+    session_id UUID,
+    polling_station VARCHAR(200),
+    auth_method auth_method NOT NULL,
+    outcome auth_outcome NOT NULL,
+    failure_reason VARCHAR(500),
+    similarity_score DECIMAL(5,4),
+    ip_address INET,
+    attempted_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (id, attempted_at),
+    CONSTRAINT auth_attempts_similarity_range CHECK (similarity_score IS NULL OR (similarity_score >= 0 AND similarity_score <= 1))
+) PARTITION BY RANGE (attempted_at);
+
+CREATE TABLE auth_attempts_default PARTITION OF auth_attempts DEFAULT;
+
+-- Partitions must exist before the copy; a month cannot be split out of the
+-- default partition once it holds that month's rows
+SELECT create_monthly_partitions(
+    'auth_attempts',
+    (SELECT COALESCE(MIN(attempted_at), NOW()) FROM auth_attempts_legacy)::DATE,
+    (CURRENT_DATE + INTERVAL '3 months')::DATE
+);
+
+INSERT INTO auth_attempts (
+    id, voter_id, session_id, polling_station, auth_method, outcome,
+    failure_reason, similarity_score, ip_address, attempted_at
+)
+SELECT
+    id, voter_id, session_id, polling_station, auth_method, outcome,
+    failure_reason, similarity_score, ip_address, attempted_at
+FROM auth_attempts_legacy;
+
+DROP TABLE auth_attempts_legacy;
+
+CREATE INDEX idx_auth_attempts_voter_attempted_at ON auth_attempts(voter_id, attempted_at DESC);
+CREATE INDEX idx_auth_attempts_session_id ON auth_attempts(session_id);
+CREATE INDEX idx_auth_attempts_outcome_attempted_at ON auth_attempts(outcome, attempted_at DESC);
+CREATE INDEX idx_auth_attempts_attempted_at ON auth_attempts(attempted_at DESC);
+CREATE INDEX idx_auth_attempts_auth_method ON auth_attempts(auth_method);
+
+CREATE RULE auth_attempts_no_update AS ON UPDATE TO auth_attempts DO INSTEAD NOTHING;
+CREATE RULE auth_attempts_no_delete AS ON DELETE TO auth_attempts DO INSTEAD NOTHING;
+
+COMMENT ON TABLE auth_attempts IS 'Append-only log of all authentication attempts';
+
+-- -----------------------------------------------------------------------------
+-- audit_logs
+-- -----------------------------------------------------------------------------
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'log_action') THEN
+        CREATE TYPE log_action AS ENUM (
+            'admin_created',
+            'admin_updated',
+            'admin_deleted',
+            'admin_login',
+            'admin_logout',
+            'election_created',
+            'election_updated',
+            'election_started',
+            'election_closed',
+            'election_finalized',
+            'voter_registered',
+            'voter_updated',
+            'candidate_added',
+            'candidate_updated',
+            'contract_deployed',
+            'settings_changed'
+        );
+    END IF;
+END
+$$;
+
+ALTER TABLE audit_logs RENAME TO audit_logs_legacy;
+ALTER TABLE audit_logs_legacy RENAME CONSTRAINT audit_logs_pkey TO audit_logs_legacy_pkey;
+
+CREATE TABLE audit_logs (
+    id UUID NOT NULL DEFAULT gen_uuid_v7(),
+    admin_id UUID REFERENCES admins(id) ON DELETE SET NULL,
+    action log_action NOT NULL,
+    target_table VARCHAR(100),
+    target_id UUID,
+    details JSONB,
+    ip_address INET,
+    occurred_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (id, occurred_at)
+) PARTITION BY RANGE (occurred_at);
+
+CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT;
+
+SELECT create_monthly_partitions(
+    'audit_logs',
+    (SELECT COALESCE(MIN(occurred_at), NOW()) FROM audit_logs_legacy)::DATE,
+    (CURRENT_DATE + INTERVAL '3 months')::DATE
+);
+
+INSERT INTO audit_logs (
+    id, admin_id, action, target_table, target_id, details, ip_address, occurred_at
+)
+SELECT
+    id, admin_id, action::TEXT::log_action, target_table, target_id, details, ip_address, occurred_at
+FROM audit_logs_legacy;
+
+DROP TABLE audit_logs_legacy;
+
+CREATE INDEX idx_audit_logs_admin_id ON audit_logs(admin_id);
+CREATE INDEX idx_audit_logs_action ON audit_logs(action);
+CREATE INDEX idx_audit_logs_occurred_at ON audit_logs(occurred_at DESC);
+CREATE INDEX idx_audit_logs_target ON audit_logs(target_table, target_id);
+CREATE INDEX idx_audit_logs_details ON audit_logs USING gin(details);
+
+CREATE RULE audit_logs_no_update AS ON UPDATE TO audit_logs DO INSTEAD NOTHING;
+CREATE RULE audit_logs_no_delete AS ON DELETE TO audit_logs DO INSTEAD NOTHING;
+
+COMMENT ON TABLE audit_logs IS 'Append-only log of all administrative actions';
+
+COMMIT;
@@ -0,0 +1,16 @@
+-- Migration: jsonb_path_ops GIN indexes on audit_logs.details and blockchain_txns.raw_event
+-- Date: 2026-10-15
+-- Reason: The audit export filters details with @> containment. jsonb_path_ops
+--         indexes are smaller and faster for @> than the default jsonb_ops,
+--         and no query uses the key-existence operators only jsonb_ops supports.
+-- Note: audit_logs is partitioned, so its index cannot be built CONCURRENTLY
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_audit_logs_details;
+CREATE INDEX idx_audit_logs_details ON audit_logs USING gin(details jsonb_path_ops);
+
+DROP INDEX IF EXISTS idx_blockchain_txns_raw_event;
+CREATE INDEX idx_blockchain_txns_raw_event ON blockchain_txns USING gin(raw_event jsonb_path_ops);
+
+COMMIT;
@@ -0,0 +1,13 @@
+-- Migration: Keyset pagination index for the authentication log view
+-- Date: 2026-10-15
+-- Reason: /api/audit/logs pages with (attempted_at, id) < (:ts, :id) ordered by
+--         attempted_at DESC, id DESC; including id lets the row comparison and
+--         the sort be satisfied by one index range scan.
+-- Note: auth_attempts is partitioned, so the index cannot be built CONCURRENTLY
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_auth_attempts_attempted_at;
+CREATE INDEX idx_auth_attempts_attempted_at ON auth_attempts(attempted_at DESC, id DESC);
+
+COMMIT;
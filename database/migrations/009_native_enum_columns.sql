@@ -0,0 +1,57 @@
+-- Migration: Store elections.status and blockchain_txns.tx_type as native enums
+-- Date: 2026-10-15
+-- Reason: Databases created through SQLAlchemy create_all have these columns as
+--         VARCHAR(50); a native enum is a fixed 4 bytes per row and per index
+--         entry instead of the full label. Databases built from schema.sql
+--         already use the enums and are left untouched.
+-- Note: audit_logs.action is converted by 006, which rebuilds that table
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'election_status') THEN
+        CREATE TYPE election_status AS ENUM (
+            'draft',
+            'configured',
+            'active',
+            'ended',
+            'finalized'
+        );
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'tx_type') THEN
+        CREATE TYPE tx_type AS ENUM (
+            'deploy_controller',
+            'deploy_registry',
+            'deploy_booth',
+            'deploy_tallier',
+            'register_voter',
+            'register_candidate',
+            'open_voting',
+            'cast_vote',
+            'close_voting',
+            'tally_results',
+            'finalize_election'
+        );
+    END IF;
+END
+$$;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'elections' AND column_name = 'status' AND data_type = 'character varying'
+    ) THEN
+        ALTER TABLE elections ALTER COLUMN status DROP DEFAULT;
+        ALTER TABLE elections ALTER COLUMN status TYPE election_status USING status::election_status;
+        ALTER TABLE elections ALTER COLUMN status SET DEFAULT 'draft';
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'blockchain_txns' AND column_name = 'tx_type' AND data_type = 'character varying'
+    ) THEN
+        ALTER TABLE blockchain_txns ALTER COLUMN tx_type TYPE tx_type USING tx_type::tx_type;
+    END IF;
+END
+$$;
@@ -0,0 +1,32 @@
+-- Migration: Store transaction hashes and addresses as BYTEA
+-- Date: 2026-10-15
+-- Reason: vote_submissions.tx_hash and blockchain_txns.tx_hash/from_address/to_address
+--         held 0x-prefixed hex text (66/42 chars). Raw bytes (32/20) halve the
+--         row and unique index size. The application converts to and from
+--         "0x..." strings at the ORM boundary.
+-- Note: Rewrites both tables under an ACCESS EXCLUSIVE lock
+
+BEGIN;
+
+ALTER TABLE vote_submissions DROP CONSTRAINT IF EXISTS vote_submissions_tx_hash_format;
+ALTER TABLE vote_submissions
+    ALTER COLUMN tx_hash TYPE BYTEA USING decode(substr(tx_hash, 3), 'hex');
+ALTER TABLE vote_submissions
+    ADD CONSTRAINT vote_submissions_tx_hash_length CHECK (octet_length(tx_hash) = 32);
+
+ALTER TABLE blockchain_txns DROP CONSTRAINT IF EXISTS blockchain_txns_tx_hash_format;
+ALTER TABLE blockchain_txns DROP CONSTRAINT IF EXISTS blockchain_txns_from_address_format;
+ALTER TABLE blockchain_txns DROP CONSTRAINT IF EXISTS blockchain_txns_to_address_format;
+ALTER TABLE blockchain_txns
+    ALTER COLUMN tx_hash TYPE BYTEA USING decode(substr(tx_hash, 3), 'hex'),
+    ALTER COLUMN from_address TYPE BYTEA USING decode(substr(from_address, 3), 'hex'),
+    ALTER COLUMN to_address TYPE BYTEA USING decode(substr(to_address, 3), 'hex');
+ALTER TABLE blockchain_txns
+    ADD CONSTRAINT blockchain_txns_tx_hash_length CHECK (octet_length(tx_hash) = 32),
+    ADD CONSTRAINT blockchain_txns_from_address_length CHECK (octet_length(from_address) = 20),
+    ADD CONSTRAINT blockchain_txns_to_address_length CHECK (to_address IS NULL OR octet_length(to_address) = 20);
+
+COMMENT ON COLUMN blockchain_txns.tx_hash IS 'Raw 32-byte transaction hash';
+COMMENT ON COLUMN vote_submissions.tx_hash IS 'Raw 32-byte transaction hash';
+
+COMMIT;
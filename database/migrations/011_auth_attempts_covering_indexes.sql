@@ -0,0 +1,22 @@
+-- Migration: Covering indexes for the authentication log view
+-- Date: 2026-10-15
+-- Reason: /api/audit/logs reads a fixed projection of auth_attempts ordered by
+--         (attempted_at DESC, id DESC), optionally filtered by outcome. With the
+--         projected columns INCLUDEd, those pages are index-only scans once the
+--         visibility map is set; auth_attempts is insert-only, so autovacuum's
+--         insert threshold (PostgreSQL 13+) keeps it current.
+-- Note: auth_attempts is partitioned, so the indexes cannot be built CONCURRENTLY
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_auth_attempts_outcome_attempted_at;
+CREATE INDEX idx_auth_attempts_outcome_attempted_at
+    ON auth_attempts(outcome, attempted_at DESC, id DESC)
+    INCLUDE (voter_id, auth_method, ip_address, failure_reason, similarity_score);
+
+DROP INDEX IF EXISTS idx_auth_attempts_attempted_at;
+CREATE INDEX idx_auth_attempts_attempted_at
+    ON auth_attempts(attempted_at DESC, id DESC)
+    INCLUDE (voter_id, outcome, auth_method, ip_address, failure_reason, similarity_score);
+
+COMMIT;
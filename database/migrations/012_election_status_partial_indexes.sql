@@ -0,0 +1,22 @@
+-- Migration: Partial and composite indexes for election status queries
+-- Date: 2026-10-15
+-- Reason: /api/elections/stats counts active elections and GET /api/elections
+--         filters by status ordered by created_at DESC. A partial index on the
+--         active rows answers the count from a handful of index entries, and
+--         (status, created_at DESC) serves the filtered, ordered listing
+--         without a sort; it also covers plain status lookups, so the
+--         single-column status index is dropped. finalize_election reads the
+--         active candidates of each constituency, served by a partial
+--         (election_id, constituency_id) index.
+-- Note: CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_elections_active
+    ON elections (id) WHERE status = 'active';
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_elections_status_created
+    ON elections (status, created_at DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_elections_status;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_candidates_election_constituency
+    ON candidates (election_id, constituency_id) WHERE is_active;
@@ -0,0 +1,15 @@
+-- Migration: Keyset pagination indexes for the elections listing
+-- Date: 2026-10-15
+-- Reason: GET /api/elections pages by (created_at DESC, id DESC), optionally
+--         filtered by status. Both orderings need id as the last key so a
+--         keyset cursor is a single index range scan; the status index from
+--         012 is rebuilt with id appended.
+-- Note: CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_elections_created_id
+    ON elections (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_elections_status_created_id
+    ON elections (status, created_at DESC, id DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_elections_status_created;
@@ -0,0 +1,16 @@
+-- Migration: Persisted results for finalized elections
+-- Date: 2026-10-15
+-- Reason: GET /api/elections/{id}/results rebuilt the whole result set on
+--         every cache miss (constituencies, candidates and one blockchain
+--         RPC per candidate). Finalized results never change, so the first
+--         complete computation is stored here and later reads are a single
+--         primary-key lookup.
+-- Note: Rows are removed with their election (ON DELETE CASCADE)
+
+CREATE TABLE IF NOT EXISTS election_results (
+    election_id UUID PRIMARY KEY REFERENCES elections(id) ON DELETE CASCADE,
+    payload JSONB NOT NULL,
+    computed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE election_results IS 'Results of finalized elections, written once on first complete computation';
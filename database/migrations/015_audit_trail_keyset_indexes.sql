@@ -0,0 +1,23 @@
+-- Migration: Keyset pagination indexes for the election audit trail
+-- Date: 2026-10-15
+-- Reason: GET /api/elections/{id}/audit pages each list by (timestamp, id)
+--         within one election. With the election filter leading and id last,
+--         each page is a single index range scan and each total an index
+--         count. idx_audit_logs_target is a prefix of its replacement.
+-- Note: audit_logs is partitioned, so its index cannot be built CONCURRENTLY;
+--       run the two CONCURRENTLY statements outside a transaction block
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blockchain_txns_election_recorded_id
+    ON blockchain_txns (election_id, recorded_at, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_vote_submissions_election_submitted_id
+    ON vote_submissions (election_id, submitted_at, id);
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_audit_logs_target_occurred_id
+    ON audit_logs (target_table, target_id, occurred_at, id);
+
+DROP INDEX IF EXISTS idx_audit_logs_target;
+
+COMMIT;
@@ -0,0 +1,11 @@
+-- Migration: Drop single-column election_id indexes superseded by 015
+-- Date: 2026-10-15
+-- Reason: The (election_id, timestamp, id) indexes from 015 serve every
+--         lookup by election_id, including the foreign key checks, so the
+--         single-column indexes only add write cost. vote_submissions is
+--         written on every vote.
+-- Note: DROP INDEX CONCURRENTLY cannot run inside a transaction block
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_vote_submissions_election_id;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_blockchain_txns_election_id;
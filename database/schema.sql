@@ -5,6 +5,43 @@
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
 
+-- Time-ordered UUIDv7 generator used for primary key defaults
+CREATE OR REPLACE FUNCTION gen_uuid_v7() RETURNS UUID AS $$
+DECLARE
+    unix_ms BIGINT := (EXTRACT(EPOCH FROM clock_timestamp()) * 1000)::BIGINT;
+    bytes BYTEA := gen_random_bytes(16);
+BEGIN
+    -- 48-bit big-endian millisecond timestamp
+    bytes := overlay(bytes PLACING substring(int8send(unix_ms) FROM 3) FROM 1 FOR 6);
+    -- Version 7 and RFC 9562 variant bits
+    bytes := set_byte(bytes, 6, (get_byte(bytes, 6) & 15) | 112);
+    bytes := set_byte(bytes, 8, (get_byte(bytes, 8) & 63) | 128);
+    RETURN encode(bytes, 'hex')::UUID;
+END
+$$ LANGUAGE plpgsql VOLATILE;
+
+-- Create monthly range partitions of a time-partitioned log table
+-- covering [from_month, to_month]; existing partitions are left alone.
+-- Run periodically to pre-create upcoming months, e.g.
+--   SELECT create_monthly_partitions('auth_attempts', CURRENT_DATE, (CURRENT_DATE + INTERVAL '3 months')::DATE);
+CREATE OR REPLACE FUNCTION create_monthly_partitions(parent TEXT, from_month DATE, to_month DATE)
+RETURNS VOID AS $$
+DECLARE
+    month_start DATE := date_trunc('month', from_month)::DATE;
+BEGIN
+    WHILE month_start <= to_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_' || to_char(month_start, 'YYYYMM'),
+            parent,
+            month_start,
+            (month_start + INTERVAL '1 month')::DATE
+        );
+        month_start := (month_start + INTERVAL '1 month')::DATE;
+    END LOOP;
+END
+$$ LANGUAGE plpgsql;
+
 -- Drop existing types if they exist
 DROP TYPE IF EXISTS admin_role CASCADE;
 DROP TYPE IF EXISTS election_status CASCADE;
@@ -77,7 +114,7 @@ CREATE TYPE tx_type AS ENUM (
 -- TABLE: admins
 -- =============================================================================
 CREATE TABLE admins (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_uuid_v7(),
     username VARCHAR(100) NOT NULL UNIQUE,
     email VARCHAR(255) NOT NULL UNIQUE,
     password_hash VARCHAR(512) NOT NULL,
@@ -104,7 +141,7 @@ CREATE INDEX idx_admins_is_active ON admins(is_active);
 -- TABLE: elections
 -- =============================================================================
 CREATE TABLE elections (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_uuid_v7(),
     name VARCHAR(300) NOT NULL,
     description TEXT,
     status election_status NOT NULL DEFAULT 'draft',
@@ -128,7 +165,9 @@ CREATE TABLE elections (
 );
 
 -- Indexes for elections
-CREATE INDEX idx_elections_status ON elections(status);
+CREATE INDEX idx_elections_active ON elections(id) WHERE status = 'active';
+CREATE INDEX idx_elections_status_created_id ON elections(status, created_at DESC, id DESC);
+CREATE INDEX idx_elections_created_id ON elections(created_at DESC, id DESC);
 CREATE INDEX idx_elections_created_by ON elections(created_by);
 CREATE INDEX idx_elections_voting_dates ON elections(voting_start_at, voting_end_at);
 CREATE INDEX idx_elections_contract_address ON elections(contract_address);
@@ -137,7 +176,7 @@ CREATE INDEX idx_elections_contract_address ON elections(contract_address);
 -- TABLE: constituencies
 -- =============================================================================
 CREATE TABLE constituencies (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_uuid_v7(),
     election_id UUID NOT NULL REFERENCES elections(id) ON DELETE CASCADE,
     name VARCHAR(200) NOT NULL,
     code VARCHAR(50) NOT NULL,
@@ -160,7 +199,7 @@ CREATE INDEX idx_constituencies_on_chain_id ON constituencies(on_chain_id);
 -- TABLE: candidates
 -- =============================================================================
 CREATE TABLE candidates (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_uuid_v7(),
     election_id UUID NOT NULL REFERENCES elections(id) ON DELETE CASCADE,
     constituency_id UUID NOT NULL REFERENCES constituencies(id) ON DELETE CASCADE,
     name VARCHAR(300) NOT NULL,
@@ -182,12 +221,13 @@ CREATE INDEX idx_candidates_election_id ON candidates(election_id);
 CREATE INDEX idx_candidates_constituency_id ON candidates(constituency_id);
 CREATE INDEX idx_candidates_on_chain_id ON candidates(on_chain_id);
 CREATE INDEX idx_candidates_is_active ON candidates(is_active);
+CREATE INDEX idx_candidates_election_constituency ON candidates(election_id, constituency_id) WHERE is_active;
 
 -- =============================================================================
 -- TABLE: voters
 -- =============================================================================
 CREATE TABLE voters (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_uuid_v7(),
     voter_id VARCHAR(100) NOT NULL UNIQUE,
     full_name VARCHAR(300) NOT NULL,
     address TEXT,
@@ -218,7 +258,7 @@ CREATE TABLE voters (
 );
 
 -- Indexes for voters
-CREATE INDEX idx_voters_voter_id ON voters(voter_id);
+CREATE INDEX idx_voters_voterid_covering ON voters(voter_id) INCLUDE (has_voted, locked_out);
 CREATE INDEX idx_voters_blockchain_voter_id ON voters(blockchain_voter_id);
 CREATE INDEX idx_voters_constituency_id ON voters(constituency_id);
 CREATE INDEX idx_voters_has_voted ON voters(has_voted);
@@ -227,10 +267,10 @@ CREATE INDEX idx_voters_face_hash ON voters(face_embedding_hash);
 CREATE INDEX idx_voters_fingerprint_hash ON voters(fingerprint_template_hash);
 
 -- =============================================================================
--- TABLE: auth_attempts (APPEND-ONLY)
+-- TABLE: auth_attempts (APPEND-ONLY, partitioned monthly by attempted_at)
 -- =============================================================================
 CREATE TABLE auth_attempts (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID NOT NULL DEFAULT gen_uuid_v7(),
     voter_id UUID REFERENCES voters(id) ON DELETE SET NULL,
     session_id UUID,
     polling_station VARCHAR(200),
@@ -241,14 +281,21 @@ CREATE TABLE auth_attempts (
     ip_address INET,
     attempted_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
 
+    PRIMARY KEY (id, attempted_at),
     CONSTRAINT auth_attempts_similarity_range CHECK (similarity_score IS NULL OR (similarity_score >= 0 AND similarity_score <= 1))
-);
+) PARTITION BY RANGE (attempted_at);
+
+-- Catch-all for rows outside the pre-created months
+CREATE TABLE auth_attempts_default PARTITION OF auth_attempts DEFAULT;
+SELECT create_monthly_partitions('auth_attempts', CURRENT_DATE, (CURRENT_DATE + INTERVAL '3 months')::DATE);
 
 -- Indexes for auth_attempts
-CREATE INDEX idx_auth_attempts_voter_id ON auth_attempts(voter_id);
+CREATE INDEX idx_auth_attempts_voter_attempted_at ON auth_attempts(voter_id, attempted_at DESC);
 CREATE INDEX idx_auth_attempts_session_id ON auth_attempts(session_id);
-CREATE INDEX idx_auth_attempts_outcome ON auth_attempts(outcome);
-CREATE INDEX idx_auth_attempts_attempted_at ON auth_attempts(attempted_at DESC);
+CREATE INDEX idx_auth_attempts_outcome_attempted_at ON auth_attempts(outcome, attempted_at DESC, id DESC)
+    INCLUDE (voter_id, auth_method, ip_address, failure_reason, similarity_score);
+CREATE INDEX idx_auth_attempts_attempted_at ON auth_attempts(attempted_at DESC, id DESC)
+    INCLUDE (voter_id, outcome, auth_method, ip_address, failure_reason, similarity_score);
 CREATE INDEX idx_auth_attempts_auth_method ON auth_attempts(auth_method);
 
 -- Make auth_attempts append-only (prevent UPDATE and DELETE)
@@ -259,52 +306,58 @@ CREATE RULE auth_attempts_no_delete AS ON DELETE TO auth_attempts DO INSTEAD NOT
 -- TABLE: vote_submissions (APPEND-ONLY)
 -- =============================================================================
 CREATE TABLE vote_submissions (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_uuid_v7(),
     voter_id UUID NOT NULL REFERENCES voters(id) ON DELETE RESTRICT,
     election_id UUID NOT NULL REFERENCES elections(id) ON DELETE RESTRICT,
     session_id UUID NOT NULL,
-    tx_hash VARCHAR(66) NOT NULL UNIQUE,
+    tx_hash BYTEA NOT NULL UNIQUE,
     block_number BIGINT NOT NULL,
     gas_used BIGINT,
     submitted_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
 
     CONSTRAINT vote_submissions_unique_voter_election UNIQUE (voter_id, election_id),
-    CONSTRAINT vote_submissions_tx_hash_format CHECK (tx_hash ~* '^0x[a-fA-F0-9]{64}$'),
+    CONSTRAINT vote_submissions_tx_hash_length CHECK (octet_length(tx_hash) = 32),
     CONSTRAINT vote_submissions_block_positive CHECK (block_number > 0),
     CONSTRAINT vote_submissions_gas_positive CHECK (gas_used IS NULL OR gas_used > 0)
 );
 
 -- Indexes for vote_submissions
 CREATE INDEX idx_vote_submissions_voter_id ON vote_submissions(voter_id);
-CREATE INDEX idx_vote_submissions_election_id ON vote_submissions(election_id);
 CREATE INDEX idx_vote_submissions_tx_hash ON vote_submissions(tx_hash);
 CREATE INDEX idx_vote_submissions_session_id ON vote_submissions(session_id);
 CREATE INDEX idx_vote_submissions_submitted_at ON vote_submissions(submitted_at DESC);
+CREATE INDEX idx_vote_submissions_election_submitted_id ON vote_submissions(election_id, submitted_at, id);
 
 -- Make vote_submissions append-only (prevent UPDATE and DELETE)
 CREATE RULE vote_submissions_no_update AS ON UPDATE TO vote_submissions DO INSTEAD NOTHING;
 CREATE RULE vote_submissions_no_delete AS ON DELETE TO vote_submissions DO INSTEAD NOTHING;
 
 -- =============================================================================
--- TABLE: audit_logs (APPEND-ONLY)
+-- TABLE: audit_logs (APPEND-ONLY, partitioned monthly by occurred_at)
 -- =============================================================================
 CREATE TABLE audit_logs (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID NOT NULL DEFAULT gen_uuid_v7(),
     admin_id UUID REFERENCES admins(id) ON DELETE SET NULL,
     action log_action NOT NULL,
     target_table VARCHAR(100),
     target_id UUID,
     details JSONB,
     ip_address INET,
-    occurred_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
-);
+    occurred_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (id, occurred_at)
+) PARTITION BY RANGE (occurred_at);
+
+-- Catch-all for rows outside the pre-created months
+CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT;
+SELECT create_monthly_partitions('audit_logs', CURRENT_DATE, (CURRENT_DATE + INTERVAL '3 months')::DATE);
 
 -- Indexes for audit_logs
 CREATE INDEX idx_audit_logs_admin_id ON audit_logs(admin_id);
 CREATE INDEX idx_audit_logs_action ON audit_logs(action);
 CREATE INDEX idx_audit_logs_occurred_at ON audit_logs(occurred_at DESC);
-CREATE INDEX idx_audit_logs_target ON audit_logs(target_table, target_id);
-CREATE INDEX idx_audit_logs_details ON audit_logs USING gin(details);
+CREATE INDEX idx_audit_logs_target_occurred_id ON audit_logs(target_table, target_id, occurred_at, id);
+CREATE INDEX idx_audit_logs_details ON audit_logs USING gin(details jsonb_path_ops);
 
 -- Make audit_logs append-only (prevent UPDATE and DELETE)
 CREATE RULE audit_logs_no_update AS ON UPDATE TO audit_logs DO INSTEAD NOTHING;
@@ -314,31 +367,40 @@ CREATE RULE audit_logs_no_delete AS ON DELETE TO audit_logs DO INSTEAD NOTHING;
 -- TABLE: blockchain_txns
 -- =============================================================================
 CREATE TABLE blockchain_txns (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_uuid_v7(),
     election_id UUID REFERENCES elections(id) ON DELETE SET NULL,
     tx_type tx_type NOT NULL,
-    tx_hash VARCHAR(66) NOT NULL UNIQUE,
+    tx_hash BYTEA NOT NULL UNIQUE,
     block_number BIGINT,
-    from_address VARCHAR(42) NOT NULL,
-    to_address VARCHAR(42),
+    from_address BYTEA NOT NULL,
+    to_address BYTEA,
     gas_used BIGINT,
     status BOOLEAN NOT NULL DEFAULT TRUE,
     raw_event JSONB,
     recorded_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
 
-    CONSTRAINT blockchain_txns_tx_hash_format CHECK (tx_hash ~* '^0x[a-fA-F0-9]{64}$'),
-    CONSTRAINT blockchain_txns_from_address_format CHECK (from_address ~* '^0x[a-fA-F0-9]{40}$'),
-    CONSTRAINT blockchain_txns_to_address_format CHECK (to_address IS NULL OR to_address ~* '^0x[a-fA-F0-9]{40}$'),
+    CONSTRAINT blockchain_txns_tx_hash_length CHECK (octet_length(tx_hash) = 32),
+    CONSTRAINT blockchain_txns_from_address_length CHECK (octet_length(from_address) = 20),
+    CONSTRAINT blockchain_txns_to_address_length CHECK (to_address IS NULL OR octet_length(to_address) = 20),
     CONSTRAINT blockchain_txns_block_positive CHECK (block_number IS NULL OR block_number > 0)
 );
 
 -- Indexes for blockchain_txns
-CREATE INDEX idx_blockchain_txns_election_id ON blockchain_txns(election_id);
 CREATE INDEX idx_blockchain_txns_tx_hash ON blockchain_txns(tx_hash);
 CREATE INDEX idx_blockchain_txns_tx_type ON blockchain_txns(tx_type);
 CREATE INDEX idx_blockchain_txns_from_address ON blockchain_txns(from_address);
 CREATE INDEX idx_blockchain_txns_recorded_at ON blockchain_txns(recorded_at DESC);
-CREATE INDEX idx_blockchain_txns_raw_event ON blockchain_txns USING gin(raw_event);
+CREATE INDEX idx_blockchain_txns_election_recorded_id ON blockchain_txns(election_id, recorded_at, id);
+CREATE INDEX idx_blockchain_txns_raw_event ON blockchain_txns USING gin(raw_event jsonb_path_ops);
+
+-- =============================================================================
+-- TABLE: election_results
+-- =============================================================================
+CREATE TABLE election_results (
+    election_id UUID PRIMARY KEY REFERENCES elections(id) ON DELETE CASCADE,
+    payload JSONB NOT NULL,
+    computed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
 
 -- =============================================================================
 -- TRIGGERS
@@ -535,6 +597,9 @@ COMMENT ON TABLE auth_attempts IS 'Append-only log of all authentication attempt
 COMMENT ON TABLE vote_submissions IS 'Append-only log of all vote submissions';
 COMMENT ON TABLE audit_logs IS 'Append-only log of all administrative actions';
 COMMENT ON TABLE blockchain_txns IS 'Record of all blockchain transactions';
+COMMENT ON TABLE election_results IS 'Results of finalized elections, written once on first complete computation';
+COMMENT ON COLUMN blockchain_txns.tx_hash IS 'Raw 32-byte transaction hash';
+COMMENT ON COLUMN vote_submissions.tx_hash IS 'Raw 32-byte transaction hash';
 
 COMMENT ON COLUMN voters.encrypted_face_embedding IS 'AES-256-GCM encrypted quantized face embedding for similarity comparison';
 COMMENT ON COLUMN voters.encrypted_fingerprint_template IS 'AES-256-GCM encrypted fingerprint template for similarity comparison';